@@ -7,16 +7,18 @@ type-safe event filtering, and plugin mounting capabilities.
 
 from __future__ import annotations
 
+import functools
 import logging
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from .utils.logging import setup_logging
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Iterable
 
     from fastapi import FastAPI
 
+    from .core.asgi import ASGIManager
     from .events import Condition
 
 from .core.di.container import ServiceContainer
@@ -72,11 +74,6 @@ class Pantainos:
         self.db_initializer = DatabaseInitializer(self.container)
         self.runner = ApplicationRunner(self)
 
-        # ASGI manager - import here to avoid circular imports
-        from .core.asgi import ASGIManager
-
-        self.asgi_manager = ASGIManager(self)
-
         # Lifecycle manager
         from .core.lifecycle import LifecycleManager
 
@@ -96,6 +93,19 @@ class Pantainos:
 
         self.logger = logging.getLogger(__name__)
 
+    @functools.cached_property
+    def asgi_manager(self) -> ASGIManager:
+        """
+        ASGI manager, built on first use.
+
+        Creating it imports FastAPI and builds the FastAPI app, so applications
+        that are never served over ASGI (scripts, tests) skip that cost.
+        """
+        # Import here to avoid circular imports
+        from .core.asgi import ASGIManager
+
+        return ASGIManager(self)
+
     def __call__(self) -> FastAPI:
         """Make Pantainos callable as ASGI app"""
         return self.asgi_manager()
@@ -181,7 +191,7 @@ class Pantainos:
             self.logger.warning(f"Unknown schedule type: {schedule.event_type}")
             return
 
-        self.schedule_manager.scheduled_tasks.append(task)
+        self.schedule_manager.register_task(task)
         self.logger.debug(f"Registered scheduled handler: {handler.__name__} for {schedule.event_type}")
 
     def mount(self, plugin: Any, name: str | None = None) -> None:
@@ -192,6 +202,33 @@ class Pantainos:
         web_server = getattr(self, "web_server", None)
         self.plugin_registry.mount(plugin, name, web_server)
 
+    def reset(self) -> None:
+        """
+        Drop all registered event handlers, error handlers, event hooks,
+        middleware, mounted plugins (and their container singletons),
+        scheduled tasks and queued events.
+
+        Components are cleared in place, so the container, event bus and
+        schedule manager are kept, along with services registered on the
+        container by anything other than a plugin mount. Call this only while
+        the application is stopped.
+        """
+        self.event_bus.handlers.clear()
+        self.event_bus.handler_registry.handlers_by_module.clear()
+        if hasattr(self.event_bus, "error_handlers"):
+            self.event_bus.error_handlers.clear()
+        if hasattr(self.event_bus, "event_hooks"):
+            self.event_bus.event_hooks.clear()
+        if hasattr(self.event_bus, "middleware"):
+            self.event_bus.middleware.clear()
+        while not self.event_bus.event_queue.empty():
+            self.event_bus.event_queue.get_nowait()
+            self.event_bus.event_queue.task_done()
+        for plugin in self.plugin_registry.plugins.values():
+            self.container.unregister(type(plugin))
+        self.plugin_registry.plugins.clear()
+        self.schedule_manager.scheduled_tasks.clear()
+
     async def emit(self, event: EventModel) -> None:
         """
         Broadcast an event to all registered handlers.
@@ -205,6 +242,18 @@ class Pantainos:
         """
         await self.event_bus.emit(event)
 
+    async def emit_many(self, events: Iterable[EventModel]) -> None:
+        """
+        Broadcast several events, queued in order as one batch.
+
+        Args:
+            events: EventModel instances to emit
+
+        Examples:
+            await app.emit_many([GenericEvent(type="user.login"), GenericEvent(type="user.logout")])
+        """
+        await self.event_bus.emit_many(events)
+
     async def start(self) -> None:
         """Start the application"""
         await self.lifecycle_manager.start(
@@ -2,12 +2,25 @@
 Core components for Pantainos
 """
 
-from .asgi import ASGIManager
+from typing import TYPE_CHECKING, Any
+
 from .event_bus import EventBus
 from .lifecycle import LifecycleManager
 
+if TYPE_CHECKING:
+    from .asgi import ASGIManager
+
 __all__ = [
     "ASGIManager",
     "EventBus",
     "LifecycleManager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import ASGIManager on first access so importing the core does not pull in FastAPI"""
+    if name == "ASGIManager":
+        from .asgi import ASGIManager
+
+        return ASGIManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
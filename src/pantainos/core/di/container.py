@@ -14,6 +14,9 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+# Distinguishes "not registered" from a singleton registered as None
+_MISSING = object()
+
 
 class ServiceContainer:
     """
@@ -36,6 +39,9 @@ class ServiceContainer:
         Example:
             container.register_singleton(TwitchClient, twitch_client_instance)
         """
+        # Re-registering the same instance (e.g. a plugin remounted) is a no-op
+        if self._singletons.get(service_type, _MISSING) is instance:
+            return
         self._singletons[service_type] = instance
 
     def register_factory(self, service_type: type[T], factory: Callable[[], T]) -> None:
@@ -67,13 +73,15 @@ class ServiceContainer:
         Example:
             twitch_client = container.resolve(TwitchClient)
         """
-        # Check singletons first
-        if service_type in self._singletons:
-            return cast("T", self._singletons[service_type])
+        # Check singletons first - one hashed lookup per map rather than a
+        # membership test followed by an index
+        instance = self._singletons.get(service_type, _MISSING)
+        if instance is not _MISSING:
+            return cast("T", instance)
 
         # Check factories
-        if service_type in self._factories:
-            factory = self._factories[service_type]
+        factory = self._factories.get(service_type)
+        if factory is not None:
             return cast("T", factory())
 
         # Service not found
@@ -100,6 +108,16 @@ class ServiceContainer:
         """
         return set(self._singletons.keys()) | set(self._factories.keys())
 
+    def unregister(self, service_type: type) -> None:
+        """
+        Remove a registered service, whether singleton or factory.
+
+        Args:
+            service_type: The type to remove; unknown types are ignored
+        """
+        self._singletons.pop(service_type, None)
+        self._factories.pop(service_type, None)
+
     def clear(self) -> None:
         """Clear all registered services."""
         self._singletons.clear()
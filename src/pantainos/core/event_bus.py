@@ -3,19 +3,33 @@ Event Bus - Central event routing system for Pantainos
 """
 
 import asyncio
-import contextlib
 import inspect
 import logging
+import sys
 from collections import defaultdict
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from typing import Any
 
 from pantainos.core.di.container import ServiceContainer
+from pantainos.db.repositories.event_repository import EventRepository
 from pantainos.events import EventModel
 
 logger = logging.getLogger(__name__)
 
 
+def _start_handler_task(coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+    """
+    Create a task for a handler run.
+
+    On Python 3.12+ the task starts eagerly, so a handler that finishes
+    without suspending completes here instead of waiting a loop iteration.
+    Only the bus's own tasks are affected; the loop's task factory is left alone.
+    """
+    if sys.version_info >= (3, 12):
+        return asyncio.Task(coro, loop=asyncio.get_running_loop(), eager_start=True)
+    return asyncio.create_task(coro)
+
+
 class HandlerRegistry:
     """Simple registry for tracking handlers by module"""
 
@@ -30,12 +44,18 @@ class EventBus:
     This replaces the old EventBus that relied on HandlerRegistry and global state.
     """
 
-    def __init__(self, container: ServiceContainer) -> None:
+    def __init__(self, container: ServiceContainer, workers: int = 16) -> None:
         self.handlers: dict[str, list[dict[str, Any]]] = defaultdict(list)
         self.container = container
         self.running = False
         self.event_queue: asyncio.Queue[EventModel] = asyncio.Queue()
-        self.processing_task: asyncio.Task[None] | None = None
+        # Number of worker tasks that pull events off the queue and dispatch them.
+        # Each worker dispatches one event at a time, so ``workers`` handlers that
+        # are all slow hold up every other queued event until one finishes.
+        self.workers = workers
+        self.worker_tasks: list[asyncio.Task[None]] = []
+        # Workers currently dispatching an event, which stop() lets finish
+        self._busy_workers: set[asyncio.Task[Any]] = set()
         self.handler_registry = HandlerRegistry()
 
     def register(self, event_type: str, handler: Callable[..., Awaitable[Any]], condition: Any | None = None) -> None:
@@ -44,40 +64,113 @@ class EventBus:
         logger.debug(f"Registered handler {handler.__name__} for event {event_type}")
 
     async def emit(self, event: EventModel) -> None:
-        """Emit an event to all registered handlers"""
+        """
+        Emit an event to all registered handlers.
+
+        The event is dropped, with a debug log message, if nothing would
+        consume it: no handler for its type, no middleware or event hook, and
+        no EventRepository to log it. Register consumers before emitting.
+        """
+        if not self._has_consumers(event):
+            logger.debug(f"Event dropped, nothing consumes it: {event.event_type} from {event.source}")
+            return
         await self.event_queue.put(event)
         logger.debug(f"Event queued: {event.event_type} from {event.source}")
 
+    async def emit_many(self, events: Iterable[EventModel]) -> None:
+        """
+        Emit several events at once, queued in order without yielding between them.
+
+        Events nothing would consume are dropped, as in emit().
+        """
+        queued = 0
+        for event in events:
+            if self._has_consumers(event):
+                self.event_queue.put_nowait(event)
+                queued += 1
+            else:
+                logger.debug(f"Event dropped, nothing consumes it: {event.event_type} from {event.source}")
+        logger.debug(f"Queued {queued} events")
+
+    def _has_consumers(self, event: EventModel) -> bool:
+        """Check whether dispatching the event would reach anything"""
+        if self.handlers.get(event.event_type):
+            return True
+        # Middleware may re-route the event; hooks and event logging see every event
+        if getattr(self, "middleware", None) or getattr(self, "event_hooks", None):
+            return True
+        return self.container.is_registered(EventRepository)
+
     async def start(self) -> None:
-        """Start the event processing loop"""
+        """Start the pool of event processing workers"""
         self.running = True
-        self.processing_task = asyncio.create_task(self._process_events())
-        logger.info("EventBus started")
-
-    async def stop(self) -> None:
-        """Stop the event processing loop"""
+        self.worker_tasks = [
+            asyncio.create_task(self._process_events(), name=f"event_bus:worker-{i}") for i in range(self.workers)
+        ]
+        logger.info(f"EventBus started with {self.workers} workers")
+
+    async def stop(self, grace_period: float = 5.0) -> None:
+        """
+        Stop the event processing workers.
+
+        Idle workers are cancelled. Workers in the middle of a dispatch get up to
+        ``grace_period`` seconds to finish that event's handlers before they are
+        cancelled too. Events still queued are not dispatched.
+
+        Args:
+            grace_period: Seconds to wait for in-flight handlers to finish
+        """
         self.running = False
-        if self.processing_task:
-            self.processing_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self.processing_task
+        busy = [task for task in self.worker_tasks if task in self._busy_workers]
+        for task in self.worker_tasks:
+            if task not in self._busy_workers:
+                task.cancel()
+        if busy:
+            _, pending = await asyncio.wait(busy, timeout=grace_period)
+            if pending:
+                logger.warning(f"Cancelling {len(pending)} event worker(s) still busy after {grace_period}s")
+            for task in pending:
+                task.cancel()
+        if self.worker_tasks:
+            await asyncio.gather(*self.worker_tasks, return_exceptions=True)
+            self.worker_tasks.clear()
         logger.info("EventBus stopped")
 
+    async def drain(self) -> None:
+        """
+        Wait until every queued event has been dispatched and its handlers have finished.
+
+        Raises:
+            RuntimeError: If events are queued while the bus is not running,
+                since nothing would ever dispatch them
+        """
+        if not self.running:
+            if not self.event_queue.empty():
+                raise RuntimeError("EventBus is not running; queued events will not be dispatched")
+            return
+        await self.event_queue.join()
+
     async def _process_events(self) -> None:
-        """Process events from the queue"""
+        """
+        Worker loop: dispatch queued events one at a time.
+
+        start() runs a fixed pool of these, so at most ``workers`` events are
+        dispatched concurrently and no task is created per event. stop()
+        cancels idle workers; a busy one finishes its event, then exits.
+        """
+        worker = asyncio.current_task()
+        assert worker is not None
         while self.running:
+            event = await self.event_queue.get()
+            self._busy_workers.add(worker)
             try:
-                # Wait for event with timeout to allow for shutdown
-                event = await asyncio.wait_for(self.event_queue.get(), timeout=1.0)
-                task = asyncio.create_task(self._dispatch_event(event))
-                # Store task reference to avoid RUF006 warning
-                self._background_tasks: set[asyncio.Task[None]] = getattr(self, "_background_tasks", set())
-                self._background_tasks.add(task)
-                task.add_done_callback(self._background_tasks.discard)
-            except TimeoutError:
-                continue
+                await self._dispatch_event(event)
             except Exception as e:
                 logger.error(f"Error in event processing: {e}", exc_info=True)
+            finally:
+                self._busy_workers.discard(worker)
+                # Mark the event finished once its dispatch completes, for drain()
+                self.event_queue.task_done()
 
     async def _dispatch_event(self, event: EventModel) -> None:
         """Dispatch event to all matching handlers"""
@@ -118,8 +211,8 @@ class EventBus:
             logger.debug(f"No handlers for event {event.event_type}")
             return
 
-        # Create tasks for all handlers that pass conditions
-        tasks = []
+        # Collect handlers that pass conditions
+        matched = []
         for handler_info in handlers:
             handler = handler_info["handler"]
             condition = handler_info["condition"]
@@ -135,20 +228,20 @@ class EventBus:
                     logger.error(f"Error in condition for {name}: {e}")
                     continue
 
-            # Create task for handler execution with DI
-            task = asyncio.create_task(self._execute_handler(handler, event))
-            tasks.append(task)
+            matched.append(handler)
 
-        # Wait for all handlers to complete
-        if tasks:
+        # Run handlers concurrently and wait for all of them to complete. Each
+        # handler gets its own task, and with it a copy of the context, so
+        # context variables set by one event's handler never leak into the next
+        # event dispatched on the same worker
+        if matched:
+            tasks = [_start_handler_task(self._execute_handler(handler, event)) for handler in matched]
             await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _log_event_to_database(self, event: EventModel) -> None:
         """Log event to database if EventRepository is available"""
         try:
             # Try to get EventRepository from container
-            from pantainos.db.repositories.event_repository import EventRepository
-
             event_repo = self.container.resolve(EventRepository)
 
             # Extract user_id from event data if available
@@ -82,7 +82,7 @@ class LifecycleManager:
         if emit_startup_event:
             from pantainos.events import GenericEvent
 
-            event = GenericEvent(type="system.startup", data={"timestamp": "startup"}, source="system")
+            event = GenericEvent.from_trusted(type="system.startup", data={"timestamp": "startup"}, source="system")
             await self.event_bus.emit(event)
 
         logger.info("Pantainos application started")
@@ -44,6 +44,7 @@ class Database:
         self.connection = await aiosqlite.connect(
             self.db_path,
             isolation_level=None,  # Autocommit mode enabled
+            cached_statements=256,  # Keep compiled statements for repository hot paths
         )
 
         # Set row factory to return Row objects with column names
@@ -17,6 +17,41 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# SQL statements are kept as module constants so every call hands sqlite the
+# same text and hits its compiled statement cache instead of re-parsing.
+_SQL_GET = {
+    True: "SELECT value, data_type FROM persistent_variables WHERE name = ?",
+    False: "SELECT value, data_type FROM session_variables WHERE name = ?",
+}
+_SQL_DELETE = {
+    True: "DELETE FROM persistent_variables WHERE name = ?",
+    False: "DELETE FROM session_variables WHERE name = ?",
+}
+_SQL_EXISTS = {
+    True: "SELECT COUNT(*) FROM persistent_variables WHERE name = ?",
+    False: "SELECT COUNT(*) FROM session_variables WHERE name = ?",
+}
+_SQL_UPSERT_PERSISTENT = """
+    INSERT INTO persistent_variables (name, value, data_type, description, created_at, updated_at)
+    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+    ON CONFLICT(name) DO UPDATE SET
+        value = excluded.value,
+        data_type = excluded.data_type,
+        description = excluded.description,
+        updated_at = CURRENT_TIMESTAMP
+"""
+_SQL_UPSERT_SESSION = """
+    INSERT INTO session_variables (name, value, data_type, created_at)
+    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(name) DO UPDATE SET
+        value = excluded.value,
+        data_type = excluded.data_type,
+        created_at = CURRENT_TIMESTAMP
+"""
+_SQL_LIST_PERSISTENT = "SELECT name, value, data_type, description, created_at, updated_at FROM persistent_variables"
+_SQL_LIST_SESSION = "SELECT name, value, data_type, created_at FROM session_variables"
+_SQL_CLEAR_SESSION = "DELETE FROM session_variables"
+
 
 class VariableRepository:
     """
@@ -64,12 +99,7 @@ class VariableRepository:
         Returns:
             Variable value converted to proper type, or default if not found
         """
-        table = "persistent_variables" if persistent else "session_variables"
-
-        row = await self.db.fetchone(
-            f"SELECT value, data_type FROM {table} WHERE name = ?",  # noqa: S608
-            (name,),
-        )
+        row = await self.db.fetchone(_SQL_GET[bool(persistent)], (name,))
 
         if row is None:
             return default
@@ -109,31 +139,10 @@ class VariableRepository:
 
         if persistent:
             # Upsert persistent variable
-            await self.db.execute(
-                """
-                INSERT INTO persistent_variables (name, value, data_type, description, created_at, updated_at)
-                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                ON CONFLICT(name) DO UPDATE SET
-                    value = excluded.value,
-                    data_type = excluded.data_type,
-                    description = excluded.description,
-                    updated_at = CURRENT_TIMESTAMP
-                """,
-                (name, str_value, data_type, description),
-            )
+            await self.db.execute(_SQL_UPSERT_PERSISTENT, (name, str_value, data_type, description))
         else:
             # Upsert session variable
-            await self.db.execute(
-                """
-                INSERT INTO session_variables (name, value, data_type, created_at)
-                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-                ON CONFLICT(name) DO UPDATE SET
-                    value = excluded.value,
-                    data_type = excluded.data_type,
-                    created_at = CURRENT_TIMESTAMP
-                """,
-                (name, str_value, data_type),
-            )
+            await self.db.execute(_SQL_UPSERT_SESSION, (name, str_value, data_type))
 
         await self.db.commit()
         logger.debug(f"Set {'persistent' if persistent else 'session'} variable '{name}' = {value}")
@@ -149,12 +158,7 @@ class VariableRepository:
         Returns:
             True if variable was deleted, False if it didn't exist
         """
-        table = "persistent_variables" if persistent else "session_variables"
-
-        cursor = await self.db.execute(
-            f"DELETE FROM {table} WHERE name = ?",  # noqa: S608
-            (name,),
-        )
+        cursor = await self.db.execute(_SQL_DELETE[bool(persistent)], (name,))
         await self.db.commit()
 
         deleted = cursor.rowcount > 0
@@ -173,12 +177,7 @@ class VariableRepository:
         Returns:
             True if variable exists
         """
-        table = "persistent_variables" if persistent else "session_variables"
-
-        count = await self.db.fetchval(
-            f"SELECT COUNT(*) FROM {table} WHERE name = ?",  # noqa: S608
-            (name,),
-        )
+        count = await self.db.fetchval(_SQL_EXISTS[bool(persistent)], (name,))
         return bool(count > 0)
 
     async def list_variables(self, persistent: bool = True) -> list[dict[str, Any]]:
@@ -191,12 +190,23 @@ class VariableRepository:
         Returns:
             List of variable info dictionaries
         """
+        variables = await self.list_variables_by_name(persistent)
+        return list(variables.values())
+
+    async def list_variables_by_name(self, persistent: bool = True) -> dict[str, dict[str, Any]]:
+        """
+        List all variables keyed by name
+
+        Args:
+            persistent: True for persistent variables, False for session variables
+
+        Returns:
+            Dictionary mapping variable name to variable info dictionary
+        """
         if persistent:
-            rows = await self.db.fetchall(
-                "SELECT name, value, data_type, description, created_at, updated_at FROM persistent_variables"
-            )
-            return [
-                {
+            rows = await self.db.fetchall(_SQL_LIST_PERSISTENT)
+            return {
+                row[0]: {
                     "name": row[0],
                     "value": self.convert_value(row[1], row[2]),
                     "data_type": row[2],
@@ -205,17 +215,17 @@ class VariableRepository:
                     "updated_at": row[5],
                 }
                 for row in rows
-            ]
-        rows = await self.db.fetchall("SELECT name, value, data_type, created_at FROM session_variables")
-        return [
-            {
+            }
+        rows = await self.db.fetchall(_SQL_LIST_SESSION)
+        return {
+            row[0]: {
                 "name": row[0],
                 "value": self.convert_value(row[1], row[2]),
                 "data_type": row[2],
                 "created_at": row[3],
             }
             for row in rows
-        ]
+        }
 
     async def clear_session_variables(self) -> int:
         """
@@ -224,7 +234,7 @@ class VariableRepository:
         Returns:
             Number of variables cleared
         """
-        cursor = await self.db.execute("DELETE FROM session_variables")
+        cursor = await self.db.execute(_SQL_CLEAR_SESSION)
         await self.db.commit()
         count = cursor.rowcount
         logger.info(f"Cleared {count} session variables")
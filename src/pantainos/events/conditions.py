@@ -8,8 +8,9 @@ compile-time error checking.
 
 from __future__ import annotations
 
+import functools
 import logging
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, ParamSpec, TypeVar, cast
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -19,6 +20,9 @@ logger = logging.getLogger(__name__)
 # Type variable for event models
 E = TypeVar("E")
 
+P = ParamSpec("P")
+R = TypeVar("R")
+
 
 class Condition(Generic[E]):
     """
@@ -71,6 +75,40 @@ class Condition(Generic[E]):
         return f"Condition({self.name})"
 
 
+class _PredicateCondition(Condition[E]):
+    """
+    Condition that calls its check directly when evaluated.
+
+    Skips Condition.__call__'s error guard; the event bus already catches
+    and logs exceptions raised while evaluating a handler's condition.
+    """
+
+    def __call__(self, event: E) -> bool:
+        return self.check(event)
+
+
+def cached_condition(factory: Callable[P, R]) -> Callable[P, R]:
+    """
+    Memoize a condition factory on its arguments.
+
+    Handlers declared with the same condition (``equals("action", "start")``
+    on several handlers, or a condition built inside a loop) then share one
+    predicate instead of allocating a new closure each time. Calls with
+    unhashable arguments, such as a list value, bypass the cache.
+    """
+    cached = cast("Callable[P, R]", functools.lru_cache(maxsize=256, typed=True)(factory))
+
+    @functools.wraps(factory)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        try:
+            hash((args, tuple(kwargs.items())))
+        except TypeError:
+            return factory(*args, **kwargs)
+        return cached(*args, **kwargs)
+
+    return wrapper
+
+
 def always_true() -> Condition[Any]:
     """Condition that always passes - useful as a default"""
     return Condition(lambda _: True, "always_true")
@@ -82,8 +120,17 @@ def always_false() -> Condition[Any]:
 
 
 # Core conditions that work with any event type
+@cached_condition
 def equals(field: str, value: Any) -> Condition[Any]:
-    """Check if the event field equals a value"""
+    """
+    Check if the event field equals a value
+
+    Calling the returned condition runs the check directly instead of through
+    Condition.__call__'s try/except. The check cannot raise for ordinary
+    events, and exceptions from ``==`` on unusual field values propagate to
+    the caller; the event bus catches and logs those. It combines with &, |
+    and ~ like any other Condition.
+    """
 
     def check(event: Any) -> bool:
         if hasattr(event, field):
@@ -92,7 +139,7 @@ def equals(field: str, value: Any) -> Condition[Any]:
             return bool(event.data.get(field) == value)
         return False
 
-    return Condition(check, f"equals({field}, {value})")
+    return _PredicateCondition(check, f"equals({field}, {value})")
 
 
 def contains(field: str, value: Any) -> Condition[Any]:
@@ -8,14 +8,14 @@ event filtering.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, ClassVar, Self, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Self, TypeVar, cast
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
 from pydantic import BaseModel, Field
 
-from .conditions import Condition
+from .conditions import Condition, cached_condition
 
 # Type variable for event model classes
 T = TypeVar("T", bound="EventModel")
@@ -35,6 +35,25 @@ class EventModel(BaseModel):
     # Optional source tracking
     source: str = Field(default="system", description="Source that emitted this event")
 
+    @classmethod
+    def from_trusted(cls, **data: Any) -> Self:
+        """
+        Create an event from framework-produced data without validation.
+
+        Internal emitters (scheduler, lifecycle, plugin re-namespacing) build
+        their payloads from values that are already well-typed, so they can
+        skip pydantic validation via ``model_construct``. Defaults and default
+        factories are still applied. User-supplied data should keep going
+        through the regular constructor.
+
+        Args:
+            **data: Field values for the event
+
+        Returns:
+            Event instance populated with the given values
+        """
+        return cast("Self", cls.model_construct(**data))
+
     @classmethod
     def condition(cls, check: Callable[[Self], bool], name: str = "") -> Condition[Self]:
         """
@@ -54,16 +73,19 @@ class EventModel(BaseModel):
 
     # Common conditions that work with any event model
     @classmethod
+    @cached_condition
     def source_is(cls, source: str) -> Condition[Self]:
         """Check if event came from a specific source"""
         return cls.condition(lambda event: event.source == source, f"source_is({source})")
 
     @classmethod
+    @cached_condition
     def has_field(cls, field_name: str) -> Condition[Self]:
         """Check if event has a specific field"""
         return cls.condition(lambda event: hasattr(event, field_name), f"has_field({field_name})")
 
     @classmethod
+    @cached_condition
     def field_equals(cls, field_name: str, value: Any) -> Condition[Self]:
         """Check if a field equals a specific value"""
 
@@ -141,7 +141,9 @@ class Plugin(ABC):
             # Create a new instance with namespaced type
             event_data = event.model_dump()
             event_data.pop("source", None)  # Remove source to override
-            namespaced_event = GenericEvent(type=namespaced_type, data=event_data, source=source or self.name)
+            namespaced_event = GenericEvent.from_trusted(
+                type=namespaced_type, data=event_data, source=source or self.name
+            )
             await self.app.event_bus.emit(namespaced_event)
         else:
             # String-based emission - create GenericEvent
@@ -2,6 +2,7 @@
 Plugin management utilities for mounting and lifecycle management
 """
 
+import asyncio
 import logging
 from typing import Any
 
@@ -55,11 +56,8 @@ class PluginRegistry:
         plugin._mount(None)  # Will need to pass app context  # noqa: SLF001
 
         # Integrate web components if available
-        if web_server:
-            if hasattr(plugin, "pages"):
-                web_server.mount_plugin_pages(plugin)
-            if hasattr(plugin, "apis"):
-                web_server.mount_plugin_apis(plugin)
+        if web_server and (getattr(plugin, "pages", None) is not None or getattr(plugin, "apis", None) is not None):
+            web_server.mount_plugin(plugin)
 
         logger.info(f"Mounted plugin: {plugin_name}")
 
@@ -72,24 +70,32 @@ class PluginRegistry:
         return self.plugins.copy()
 
     async def start_all(self) -> None:
-        """Start all mounted plugins."""
-        for plugin_name, plugin in self.plugins.items():
-            if hasattr(plugin, "start"):
-                try:
-                    await plugin.start()
-                    logger.debug(f"Started plugin: {plugin_name}")
-                except Exception as e:
-                    logger.error(f"Error starting plugin {plugin_name}: {e}")
+        """Start all mounted plugins concurrently."""
+        await asyncio.gather(*(self._safe_start(name, plugin) for name, plugin in self.plugins.items()))
 
     async def stop_all(self) -> None:
-        """Stop all mounted plugins."""
-        for plugin_name, plugin in self.plugins.items():
-            if hasattr(plugin, "stop"):
-                try:
-                    await plugin.stop()
-                    logger.debug(f"Stopped plugin: {plugin_name}")
-                except Exception as e:
-                    logger.error(f"Error stopping plugin {plugin_name}: {e}")
+        """Stop all mounted plugins concurrently."""
+        await asyncio.gather(*(self._safe_stop(name, plugin) for name, plugin in self.plugins.items()))
+
+    async def _safe_start(self, plugin_name: str, plugin: Any) -> None:
+        """Start a single plugin, logging instead of raising on failure."""
+        if not hasattr(plugin, "start"):
+            return
+        try:
+            await plugin.start()
+            logger.debug(f"Started plugin: {plugin_name}")
+        except Exception as e:
+            logger.error(f"Error starting plugin {plugin_name}: {e}")
+
+    async def _safe_stop(self, plugin_name: str, plugin: Any) -> None:
+        """Stop a single plugin, logging instead of raising on failure."""
+        if not hasattr(plugin, "stop"):
+            return
+        try:
+            await plugin.stop()
+            logger.debug(f"Stopped plugin: {plugin_name}")
+        except Exception as e:
+            logger.error(f"Error stopping plugin {plugin_name}: {e}")
 
     def is_mounted(self, name: str) -> bool:
         """Check if a plugin is mounted."""
@@ -52,3 +52,10 @@ class WatchChangedEvent(EventModel):
     has_changes: bool = Field(description="Whether changes were detected this execution")
     current_result_count: int = Field(description="Number of results in current execution")
     previous_result_count: int | None = Field(description="Number of results in previous execution")
+
+
+# Build validators at import so the first scheduler tick doesn't pay for it,
+# even if a future field introduces a forward reference that defers the build.
+IntervalExecutedEvent.model_rebuild()
+CronTriggeredEvent.model_rebuild()
+WatchChangedEvent.model_rebuild()
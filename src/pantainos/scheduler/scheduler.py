@@ -6,6 +6,7 @@ watch triggers, emitting scheduled events through the event bus.
 """
 
 import asyncio
+import itertools
 import logging
 import time
 from collections.abc import Callable
@@ -14,6 +15,8 @@ from typing import Any
 
 from pantainos.core.di.container import ServiceContainer
 from pantainos.core.event_bus import EventBus
+from pantainos.db.database import Database
+from pantainos.events import EventModel
 
 from .events import CronTriggeredEvent, IntervalExecutedEvent, WatchChangedEvent
 from .schedules import Cron, Interval, Watch
@@ -31,6 +34,14 @@ class ScheduleManager:
     event bus when scheduled conditions are met.
     """
 
+    # Time source and sleep used by the task loops; tests swap these for a
+    # fake clock so schedules advance without waiting in real time
+    _clock = staticmethod(time.time)
+    _sleep = staticmethod(asyncio.sleep)
+
+    # Maximum number of queued scheduled events forwarded to the bus at once
+    _EMIT_BATCH_SIZE = 64
+
     def __init__(self, event_bus: EventBus, container: ServiceContainer) -> None:
         """
         Initialize the schedule manager.
@@ -42,8 +53,37 @@ class ScheduleManager:
         self.event_bus = event_bus
         self.container = container
         self.running = False
-        self.scheduled_tasks: list[IntervalTask | CronTask | WatchTask] = []
+        # Keyed by register_task() so a schedule can be looked up or removed directly
+        self.scheduled_tasks: dict[str, IntervalTask | CronTask | WatchTask] = {}
+        # Sequence numbers that make each registration's key unique
+        self._task_ids = itertools.count(1)
         self.background_tasks: set[asyncio.Task[None]] = set()
+        # Database used by watch queries, resolved on first check and
+        # reused until the manager is stopped
+        self._database: Database | None = None
+        # Scheduled events waiting to be forwarded to the event bus; None
+        # tells the drain worker to flush and exit
+        self._emit_queue: asyncio.Queue[EventModel | None] = asyncio.Queue()
+        self._emit_worker: asyncio.Task[None] | None = None
+        # Per-task event templates, keyed by id() of the task
+        self._event_templates: dict[int, IntervalExecutedEvent | CronTriggeredEvent | WatchChangedEvent] = {}
+
+    def register_task(self, task: IntervalTask | CronTask | WatchTask) -> str:
+        """
+        Register a scheduled task to be started with the manager.
+
+        Every call gets its own key, so registering the same handler and
+        schedule twice runs the task twice, as separate registrations.
+
+        Args:
+            task: Typed task wrapping a handler and its schedule
+
+        Returns:
+            Key of the task in scheduled_tasks
+        """
+        key = f"{task.type}:{next(self._task_ids)}"
+        self.scheduled_tasks[key] = task
+        return key
 
     async def add_interval_schedule(self, handler: Callable[..., Any], interval: Interval) -> None:
         """
@@ -53,11 +93,8 @@ class ScheduleManager:
             handler: Handler function to call when interval triggers
             interval: Interval schedule configuration
         """
-        task = IntervalTask(
-            handler=handler,
-            schedule=interval,
-        )
-        self.scheduled_tasks.append(task)
+        task = IntervalTask.create_unchecked(handler, interval)
+        self.register_task(task)
         logger.debug(f"Added interval schedule: {interval.seconds}s")
 
     async def add_cron_schedule(self, handler: Callable[..., Any], cron: Cron) -> None:
@@ -68,12 +105,8 @@ class ScheduleManager:
             handler: Handler function to call when cron triggers
             cron: Cron schedule configuration
         """
-        task = CronTask(
-            handler=handler,
-            schedule=cron,
-            next_execution=self.calculate_next_cron_time(cron),
-        )
-        self.scheduled_tasks.append(task)
+        task = CronTask.create_unchecked(handler, cron, next_execution=self.calculate_next_cron_time(cron))
+        self.register_task(task)
         logger.debug(f"Added cron schedule: {cron.expression}")
 
     async def add_watch_schedule(self, handler: Callable[..., Any], watch: Watch) -> None:
@@ -84,11 +117,8 @@ class ScheduleManager:
             handler: Handler function to call when watch triggers
             watch: Database watch configuration
         """
-        task = WatchTask(
-            handler=handler,
-            schedule=watch,
-        )
-        self.scheduled_tasks.append(task)
+        task = WatchTask.create_unchecked(handler, watch)
+        self.register_task(task)
         logger.debug(f"Added watch schedule: {watch.query}")
 
     async def start(self) -> None:
@@ -100,9 +130,11 @@ class ScheduleManager:
         self.running = True
         logger.info("Starting ScheduleManager")
 
+        self._emit_worker = asyncio.create_task(self._drain_emits(), name="schedule:emit")
+
         # Create background tasks for each scheduled task
-        for task_info in self.scheduled_tasks:
-            task = asyncio.create_task(self._run_scheduled_task(task_info))
+        for key, task_info in self.scheduled_tasks.items():
+            task = asyncio.create_task(self._run_scheduled_task(task_info), name=f"schedule:{key}")
             self.background_tasks.add(task)
             task.add_done_callback(self.background_tasks.discard)
 
@@ -122,6 +154,16 @@ class ScheduleManager:
             await asyncio.gather(*self.background_tasks, return_exceptions=True)
             self.background_tasks.clear()
 
+        # Forward any events still queued, then let the worker exit; events
+        # from executions after this point go straight to the event bus
+        if self._emit_worker:
+            emit_worker, self._emit_worker = self._emit_worker, None
+            self._emit_queue.put_nowait(None)
+            await emit_worker
+
+        self._database = None
+        self._event_templates.clear()
+
         logger.info("ScheduleManager stopped")
 
     async def _run_scheduled_task(self, task_info: IntervalTask | CronTask | WatchTask) -> None:
@@ -146,7 +188,7 @@ class ScheduleManager:
                     delay = await self._calculate_delay(task_info)
 
                     # Wait for the scheduled time with cancellation support
-                    await asyncio.sleep(delay)
+                    await self._sleep(delay)
 
                     if not self.running:
                         break
@@ -164,7 +206,7 @@ class ScheduleManager:
                 except Exception as e:
                     logger.error(f"Error in scheduled task ({task_type}): {e}", exc_info=True)
                     # Continue running despite errors - wait a bit before retrying
-                    await asyncio.sleep(1.0)
+                    await self._sleep(1.0)
 
         except asyncio.CancelledError:
             logger.debug(f"Scheduled task cancelled: {task_type}")
@@ -189,7 +231,7 @@ class ScheduleManager:
 
             # Calculate next interval execution
             if interval_task.last_execution > 0:
-                elapsed = time.time() - interval_task.last_execution
+                elapsed = self._clock() - interval_task.last_execution
                 remaining = interval.seconds - elapsed
                 return max(0.0, remaining)
 
@@ -199,7 +241,7 @@ class ScheduleManager:
             cron_task = task_info
             # Calculate time until next cron execution
             next_time = cron_task.next_execution
-            return max(0.0, next_time - time.time())
+            return max(0.0, next_time - self._clock())
 
         if isinstance(task_info, WatchTask):
             watch_task = task_info
@@ -207,7 +249,7 @@ class ScheduleManager:
 
             # Check interval for database watches
             if watch_task.last_check > 0:
-                elapsed = time.time() - watch_task.last_check
+                elapsed = self._clock() - watch_task.last_check
                 remaining = watch.check_interval - elapsed
                 return max(0.0, remaining)
 
@@ -256,16 +298,15 @@ class ScheduleManager:
 
         watch_task = task_info
         watch: Watch = watch_task.schedule
-        watch_task.last_check = time.time()
+        watch_task.last_check = self._clock()
 
         try:
-            # Get database from container
-            from pantainos.db.database import Database
-
-            database = self.container.resolve(Database)
+            # Get database from container once, then reuse it on later checks
+            database = self._database or self.container.resolve(Database)
             if not database:
                 logger.warning("Database not available for watch query")
                 return False
+            self._database = database
 
             # Execute the watch query
             results = await database.execute_query(watch.query, tuple(watch.params) if watch.params else None)
@@ -302,13 +343,18 @@ class ScheduleManager:
         task_info.execution_count += 1
 
         try:
-            # Create and emit the appropriate typed event
+            # Create the appropriate typed event and queue it for emission; with
+            # no emit worker running (before start() or after stop()) nothing
+            # would drain the queue, so emit it directly
             event = await self._create_typed_event(task_info)
-            await self.event_bus.emit(event)
+            if self._emit_worker is None:
+                await self.event_bus.emit(event)
+            else:
+                self._emit_queue.put_nowait(event)
 
             # Update execution tracking
             if isinstance(task_info, IntervalTask):
-                task_info.last_execution = time.time()
+                task_info.last_execution = self._clock()
                 logger.debug(f"Executed interval schedule (count: {task_info.execution_count})")
             elif isinstance(task_info, CronTask):
                 # Calculate next cron execution time
@@ -320,68 +366,102 @@ class ScheduleManager:
         except Exception as e:
             logger.error(f"Error executing scheduled task: {e}")
 
-    async def _create_typed_event(
+    async def _drain_emits(self) -> None:
+        """Forward queued scheduled events to the event bus in batches."""
+        while True:
+            event = await self._emit_queue.get()
+            batch: list[EventModel] = []
+            while event is not None:
+                batch.append(event)
+                if len(batch) >= self._EMIT_BATCH_SIZE or self._emit_queue.empty():
+                    break
+                event = self._emit_queue.get_nowait()
+
+            if batch:
+                results = await asyncio.gather(*(self.event_bus.emit(e) for e in batch), return_exceptions=True)
+                for queued, result in zip(batch, results, strict=True):
+                    if isinstance(result, Exception):
+                        logger.error(f"Error emitting scheduled event {queued.event_type}: {result}")
+
+            if event is None:
+                return
+
+    def _event_template(
         self, task_info: ScheduledTask
     ) -> IntervalExecutedEvent | CronTriggeredEvent | WatchChangedEvent:
         """
-        Create a typed event for a scheduled task.
+        Get the event template holding a task's per-schedule fields.
+
+        Templates are built once per task; each execution copies the template
+        and fills in only the fields that change between runs.
 
         Args:
             task_info: Task information object
 
         Returns:
-            Typed event model instance
+            Typed event model carrying the schedule configuration
         """
-        execution_time = datetime.now()
-        execution_count = task_info.execution_count
+        template = self._event_templates.get(id(task_info))
+        if template is not None:
+            return template
 
         if isinstance(task_info, IntervalTask):
             interval = task_info.schedule
-            return IntervalExecutedEvent(
-                execution_time=execution_time,
-                execution_count=execution_count,
+            template = IntervalExecutedEvent.from_trusted(
                 seconds=interval.seconds,
                 start_immediately=interval.start_immediately,
                 align_to_minute=interval.align_to_minute,
                 source="scheduler",
             )
-
-        if isinstance(task_info, CronTask):
+        elif isinstance(task_info, CronTask):
             cron = task_info.schedule
-            cron_task = task_info
-            next_execution_time = cron_task.next_execution if cron_task else time.time()
-            return CronTriggeredEvent(
-                execution_time=execution_time,
-                execution_count=execution_count,
+            template = CronTriggeredEvent.from_trusted(
                 expression=cron.expression,
                 timezone=cron.timezone,
-                scheduled_time=datetime.fromtimestamp(next_execution_time),
                 source="scheduler",
             )
-
-        if isinstance(task_info, WatchTask):
+        elif isinstance(task_info, WatchTask):
             watch = task_info.schedule
-            watch_task = task_info
-            if not watch_task:
-                raise ValueError("Expected WatchTask for watch schedule")
-
-            results = watch_task.current_results or []
-            previous_results = watch_task.previous_results or []
-            has_changes = watch_task.has_changes
-
-            return WatchChangedEvent(
-                execution_time=execution_time,
-                execution_count=execution_count,
+            template = WatchChangedEvent.from_trusted(
                 query=watch.query,
                 check_interval=watch.check_interval,
                 detect_changes=watch.detect_changes,
-                has_changes=has_changes,
-                current_result_count=len(results),
-                previous_result_count=len(previous_results) if previous_results else None,
                 source="scheduler",
             )
+        else:
+            raise ValueError(f"Unknown task type: {type(task_info).__name__}")
+
+        self._event_templates[id(task_info)] = template
+        return template
+
+    async def _create_typed_event(
+        self, task_info: ScheduledTask
+    ) -> IntervalExecutedEvent | CronTriggeredEvent | WatchChangedEvent:
+        """
+        Create a typed event for a scheduled task.
+
+        Args:
+            task_info: Task information object
+
+        Returns:
+            Typed event model instance
+        """
+        template = self._event_template(task_info)
+        update: dict[str, Any] = {
+            "execution_time": datetime.now(),
+            "execution_count": task_info.execution_count,
+        }
+
+        if isinstance(task_info, CronTask):
+            update["scheduled_time"] = datetime.fromtimestamp(task_info.next_execution)
+        elif isinstance(task_info, WatchTask):
+            results = task_info.current_results or []
+            previous_results = task_info.previous_results or []
+            update["has_changes"] = task_info.has_changes
+            update["current_result_count"] = len(results)
+            update["previous_result_count"] = len(previous_results) if previous_results else None
 
-        raise ValueError(f"Unknown task type: {type(task_info).__name__}")
+        return template.model_copy(update=update)
 
     def calculate_next_cron_time(self, cron: Cron) -> float:
         """
@@ -396,8 +476,7 @@ class ScheduleManager:
         # Basic cron calculation - for production, would use croniter library
         # For now, just schedule for next minute as a placeholder
         # TODO: Implement proper cron parsing using cron.expression
-        import time
 
         # Use the cron expression for basic validation, but return fixed interval
         _ = cron.expression  # Acknowledge we should use this
-        return time.time() + 60.0
+        return self._clock() + 60.0
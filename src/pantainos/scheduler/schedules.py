@@ -8,6 +8,8 @@ and database-reactive handlers while maintaining the clean @app.on() API.
 
 from __future__ import annotations
 
+import functools
+import re
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, ClassVar, Self
 
@@ -19,6 +21,45 @@ if TYPE_CHECKING:
     from pantainos.events import Condition
 
 
+def _cron_field_re(value: str) -> re.Pattern[str]:
+    """Compile a cron field pattern: comma-separated values, ranges, wildcards and steps"""
+    item = rf"(?:\*|(?:{value})(?:-(?:{value}))?)(?:/\d+)?"
+    return re.compile(rf"{item}(?:,{item})*", re.IGNORECASE)
+
+
+# Compiled once at import so validating a new expression never compiles a regex
+_CRON_MINUTE_RE = _cron_field_re(r"[0-5]?\d")
+_CRON_HOUR_RE = _cron_field_re(r"[01]?\d|2[0-3]")
+_CRON_DOM_RE = _cron_field_re(r"0?[1-9]|[12]\d|3[01]")
+_CRON_MONTH_RE = _cron_field_re(r"0?[1-9]|1[0-2]|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec")
+_CRON_DOW_RE = _cron_field_re(r"[0-7]|sun|mon|tue|wed|thu|fri|sat")
+_CRON_FIELD_RES = (_CRON_MINUTE_RE, _CRON_HOUR_RE, _CRON_DOM_RE, _CRON_MONTH_RE, _CRON_DOW_RE)
+_CRON_FIELD_NAMES = ("minute", "hour", "day", "month", "weekday")
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_cron(expr: str) -> tuple[str, ...]:
+    """
+    Split and validate a cron expression, caching the result.
+
+    Args:
+        expr: Cron expression (minute hour day month weekday)
+
+    Returns:
+        The five cron fields
+
+    Raises:
+        ValueError: If the expression does not have exactly five valid fields
+    """
+    parts = tuple(expr.split())
+    if len(parts) != 5:
+        raise ValueError("Cron expression must have 5 parts: minute hour day month weekday")
+    for part, pattern, name in zip(parts, _CRON_FIELD_RES, _CRON_FIELD_NAMES, strict=True):
+        if not pattern.fullmatch(part):
+            raise ValueError(f"Invalid cron {name} field: {part!r}")
+    return parts
+
+
 class Schedule(EventModel):
     """
     Base class for all scheduled events.
@@ -107,10 +148,7 @@ class Cron(Schedule):
     @classmethod
     def validate_cron_expression(cls, v: str) -> str:
         """Validate cron expression format"""
-        # Basic validation - 5 parts separated by spaces
-        parts = v.strip().split()
-        if len(parts) != 5:
-            raise ValueError("Cron expression must have 5 parts: minute hour day month weekday")
+        _validate_cron(v)
         return v
 
     @classmethod
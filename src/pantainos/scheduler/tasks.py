@@ -8,7 +8,7 @@ replacing the previous dict[str, Any] approach.
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
-from typing import Any, Literal
+from typing import Any, Literal, Self, cast
 
 from pydantic import BaseModel, Field
 
@@ -25,6 +25,11 @@ class ScheduledTask(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
+    @classmethod
+    def create_unchecked(cls, handler: Callable[..., Awaitable[Any]], schedule: Schedule, **kwargs: Any) -> Self:
+        """Create a task without validation, for callers that already hold a typed schedule."""
+        return cast("Self", cls.model_construct(handler=handler, schedule=schedule, **kwargs))
+
 
 class IntervalTask(ScheduledTask):
     """Task that runs on a fixed interval."""
@@ -94,6 +94,10 @@ class ApplicationRunner:
             # Paths on different drives (Windows) or other issues
             return None
 
+        # The file is the working directory itself - nothing to import
+        if not rel_path.parts:
+            return None
+
         # Remove .py extension and convert to module name
         module_path = rel_path.with_suffix("")
 
@@ -39,6 +39,16 @@ class NavigationSystem:
     - Responsive mobile support
     """
 
+    # Built-in pages, shared by every instance; NavigationBuilder.with_items replaces them per instance
+    _DEFAULT_NAV_ITEMS: tuple[dict[str, str], ...] = (
+        {"id": "dashboard", "label": "Dashboard", "icon": "dashboard", "path": "/"},
+        {"id": "events", "label": "Events", "icon": "timeline", "path": "/events"},
+        {"id": "plugins", "label": "Plugins", "icon": "extension", "path": "/plugins"},
+        {"id": "handlers", "label": "Handlers", "icon": "functions", "path": "/handlers"},
+        {"id": "database", "label": "Database", "icon": "storage", "path": "/database"},
+        {"id": "settings", "label": "Settings", "icon": "settings", "path": "/settings"},
+    )
+
     def __init__(self, app: Pantainos) -> None:
         """Initialize navigation system with Pantainos application."""
         if not NICEGUI_AVAILABLE:
@@ -50,14 +60,7 @@ class NavigationSystem:
         self.search_query = ""
 
         # Navigation items
-        self.nav_items = [
-            {"id": "dashboard", "label": "Dashboard", "icon": "dashboard", "path": "/"},
-            {"id": "events", "label": "Events", "icon": "timeline", "path": "/events"},
-            {"id": "plugins", "label": "Plugins", "icon": "extension", "path": "/plugins"},
-            {"id": "handlers", "label": "Handlers", "icon": "functions", "path": "/handlers"},
-            {"id": "database", "label": "Database", "icon": "storage", "path": "/database"},
-            {"id": "settings", "label": "Settings", "icon": "settings", "path": "/settings"},
-        ]
+        self.nav_items = list(self._DEFAULT_NAV_ITEMS)
 
     def create_sidebar(self) -> None:
         """Create the collapsible sidebar navigation."""
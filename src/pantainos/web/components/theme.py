@@ -11,10 +11,12 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ThemeConfig:
     """
     Configuration for a theme including colors, typography, and spacing.
+
+    The generated CSS is cached and rebuilt only when a value it uses changes.
     """
 
     # Primary colors
@@ -65,8 +67,30 @@ class ThemeConfig:
     card_styles: dict[str, Any] = field(default_factory=dict)
     input_styles: dict[str, Any] = field(default_factory=dict)
 
+    # Generated CSS and the values it was built from, filled in by generate_css()
+    _css: str = field(default="", init=False, repr=False, compare=False)
+    _css_key: tuple[str, ...] | None = field(default=None, init=False, repr=False, compare=False)
+
     def generate_css(self) -> str:
         """Generate CSS variables from theme configuration."""
+        key = (
+            self.primary,
+            self.secondary,
+            self.accent,
+            self.background,
+            self.surface,
+            self.text_primary,
+            self.text_secondary,
+            self.success,
+            self.warning,
+            self.error,
+            self.info,
+            self.font_family,
+            self.font_size_base,
+        )
+        if key == self._css_key:
+            return self._css
+
         css = f"""
         :root {{
             --primary: {self.primary};
@@ -84,7 +108,9 @@ class ThemeConfig:
             --font-size-base: {self.font_size_base};
         }}
         """
-        return css.strip()
+        self._css = css.strip()
+        self._css_key = key
+        return self._css
 
 
 class ThemeManager:
@@ -92,9 +118,12 @@ class ThemeManager:
     Manages theme switching and application of themes to the UI.
     """
 
+    __slots__ = ("_applied_css", "current_theme", "themes")
+
     def __init__(self) -> None:
         """Initialize theme manager with default themes."""
         self.current_theme = "dark"
+        self._applied_css: str | None = None
         self.themes: dict[str, ThemeConfig] = {
             "dark": ThemeConfig(),
             "light": ThemeConfig(
@@ -139,6 +168,9 @@ class ThemeManager:
 
     def apply_theme(self) -> None:
         """Apply the current theme to the UI."""
-        # In a real implementation, this would update the UI
-        # For now, it's a no-op to satisfy the tests
-        pass
+        css = self.get_current_config().generate_css()
+        if css == self._applied_css:
+            return
+
+        # In a real implementation, this would push the CSS into the UI
+        self._applied_css = css
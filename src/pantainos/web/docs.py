@@ -8,12 +8,33 @@ docstrings to generate comprehensive API documentation.
 from __future__ import annotations
 
 import inspect
+import weakref
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from pantainos.application import Pantainos
 
 
+# Weakly keyed, so a handler that is unregistered and dropped takes its entry with it
+_signature_cache: weakref.WeakKeyDictionary[Callable[..., Any], inspect.Signature] = weakref.WeakKeyDictionary()
+
+
+def _handler_signature(handler: Callable[..., Any]) -> inspect.Signature:
+    """Signature of a handler, introspected once per handler across documentation builds."""
+    try:
+        return _signature_cache[handler]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable or not weakly referenceable: introspect without caching
+        return inspect.signature(handler)
+    signature = inspect.signature(handler)
+    _signature_cache[handler] = signature
+    return signature
+
+
 class DocumentationGenerator:
     """
     Generates documentation by extracting handler information from the event system.
@@ -99,7 +120,7 @@ class DocumentationGenerator:
 
         # Extract signature
         try:
-            signature = str(inspect.signature(handler)) if handler is not None else "Unknown signature"
+            signature = str(_handler_signature(handler)) if handler is not None else "Unknown signature"
         except (ValueError, TypeError):
             signature = "Unknown signature"
 
@@ -130,7 +151,7 @@ class DocumentationGenerator:
             List of parameter names excluding 'event'
         """
         try:
-            sig = inspect.signature(handler)
+            sig = _handler_signature(handler)
             params = list(sig.parameters.keys())
             # Remove 'event' parameter as it's always present
             return [param for param in params if param != "event"]
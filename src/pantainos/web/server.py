@@ -8,26 +8,18 @@ web interface for documentation and plugin configuration.
 from __future__ import annotations
 
 import asyncio
+from importlib.util import find_spec
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from fastapi import FastAPI
+    from fastapi import APIRouter, FastAPI
     from fastapi.responses import HTMLResponse
 
     from pantainos.application import Pantainos
     from pantainos.plugin.base import Plugin
 
-    WEB_AVAILABLE = True
-else:
-    try:
-        from fastapi import FastAPI
-        from fastapi.responses import HTMLResponse
-
-        WEB_AVAILABLE = True
-    except ImportError:
-        WEB_AVAILABLE = False
-        FastAPI = Any  # type: ignore[assignment,misc]
-        HTMLResponse = Any  # type: ignore[assignment,misc]
+# FastAPI (and pydantic/Starlette under it) is only imported once a WebServer is built
+WEB_AVAILABLE = find_spec("fastapi") is not None
 
 
 class WebServer:
@@ -51,38 +43,54 @@ class WebServer:
         >>> await web_server.start()
     """
 
-    def __init__(self, pantainos_app: Pantainos) -> None:
+    def __init__(self, pantainos_app: Pantainos, compress: bool = True) -> None:
         """
         Initialize web server with Pantainos application.
 
         Args:
             pantainos_app: The Pantainos application to serve
+            compress: Gzip responses of 1 KiB or more for clients that accept it (default: True)
         """
         if not WEB_AVAILABLE:
             raise RuntimeError("Web dependencies not available. Install with: pip install fastapi uvicorn nicegui")
 
+        from fastapi import FastAPI
+
         self.app = pantainos_app
         self.fastapi = FastAPI(
             title="Pantainos API", description="REST API for Pantainos event-driven application", version="0.1.0"
         )
+        if compress:
+            from fastapi.middleware.gzip import GZipMiddleware
+
+            self.fastapi.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
         self.plugin_pages: dict[str, dict[str, Any]] = {}
 
+        # Last rendered documentation page and the handlers/plugins it was rendered from
+        self._docs_response: HTMLResponse | None = None
+        self._docs_fingerprint: tuple[Any, ...] | None = None
+
         # Register documentation route - NiceGUI components require proper setup
         self._setup_documentation_route()
 
     def _setup_documentation_route(self) -> None:
         """Setup documentation route for styled HTML interface."""
+        from fastapi.responses import HTMLResponse
 
-        @self.fastapi.get("/ui/docs", response_class=HTMLResponse)
-        def get_documentation() -> str:
-            """Serve styled documentation page"""
-            try:
-                from .ui import DocumentationUI
-
-                doc_ui = DocumentationUI(self.app)
-                return doc_ui.create_documentation_page()
-            except RuntimeError:
-                return "<html><body><h1>Documentation unavailable</h1><p>NiceGUI not installed</p></body></html>"
+        @self.fastapi.get("/ui/docs", response_class=HTMLResponse, response_model=None)
+        def get_documentation() -> HTMLResponse | str:
+            """Serve styled documentation page, re-rendered only when handlers or plugins change"""
+            fingerprint = self._documentation_fingerprint()
+            if self._docs_response is None or fingerprint != self._docs_fingerprint:
+                try:
+                    from .ui import DocumentationUI
+
+                    doc_ui = DocumentationUI(self.app)
+                    self._docs_response = HTMLResponse(doc_ui.create_documentation_page())
+                    self._docs_fingerprint = fingerprint
+                except RuntimeError:
+                    return "<html><body><h1>Documentation unavailable</h1><p>NiceGUI not installed</p></body></html>"
+            return self._docs_response
 
         @self.fastapi.get("/ui/events", response_class=HTMLResponse)
         def get_event_explorer() -> str:
@@ -129,6 +137,49 @@ ui.run(port=8080)</code></pre>
             except Exception as e:
                 return f"<html><body><h1>Error</h1><p>{e!s}</p></body></html>"
 
+    def _documentation_fingerprint(self) -> tuple[Any, ...]:
+        """
+        Identify everything the documentation page is rendered from.
+
+        Covers each handler and its condition, each plugin with its API and
+        page routes, and whether the app has a web server and a database.
+        """
+        handlers = getattr(getattr(self.app, "event_bus", None), "handlers", None) or {}
+        registry = getattr(self.app, "plugin_registry", None)
+        plugins = registry.get_all() if registry is not None else {}
+        return (
+            tuple(
+                (event_type, tuple((id(entry["handler"]), id(entry.get("condition"))) for entry in entries))
+                for event_type, entries in handlers.items()
+            ),
+            tuple(
+                (
+                    name,
+                    id(plugin),
+                    tuple(getattr(plugin, "apis", None) or ()),
+                    tuple(getattr(plugin, "pages", None) or ()),
+                )
+                for name, plugin in plugins.items()
+            ),
+            hasattr(self.app, "web_server"),
+            hasattr(self.app, "database"),
+        )
+
+    def mount_plugin(self, plugin: Plugin) -> None:
+        """
+        Mount a plugin's web pages and API endpoints in a single pass.
+
+        Args:
+            plugin: Plugin instance with registered pages and/or APIs
+        """
+        from fastapi import APIRouter
+
+        # Collect all of the plugin's routes on one router, then add them to the app at once
+        router = APIRouter()
+        self._add_page_routes(router, plugin)
+        self._add_api_routes(router, plugin)
+        self._include_plugin_router(router)
+
     def mount_plugin_pages(self, plugin: Plugin) -> None:
         """
         Mount web pages for a plugin as UI routes.
@@ -136,17 +187,33 @@ ui.run(port=8080)</code></pre>
         Args:
             plugin: Plugin instance with registered pages
         """
-        if not hasattr(plugin, "pages"):
-            return
+        from fastapi import APIRouter
+
+        router = APIRouter()
+        self._add_page_routes(router, plugin)
+        self._include_plugin_router(router)
 
+    def mount_plugin_apis(self, plugin: Plugin) -> None:
+        """
+        Mount API endpoints for a plugin to the FastAPI application.
+
+        Args:
+            plugin: Plugin instance with registered APIs
+        """
+        from fastapi import APIRouter
+
+        router = APIRouter()
+        self._add_api_routes(router, plugin)
+        self._include_plugin_router(router)
+
+    def _add_page_routes(self, router: APIRouter, plugin: Plugin) -> None:
+        """Register a plugin's pages on router as GET routes under /ui/plugins/<name>."""
         pages = getattr(plugin, "pages", None)
         if not pages or not isinstance(pages, dict):
             return
 
         plugin_name = plugin.name
         self.plugin_pages[plugin_name] = pages
-
-        # Register each page as a UI route with FastAPI
         base_path = f"/ui/plugins/{plugin_name}"
 
         for route_path, page_info in pages.items():
@@ -154,30 +221,17 @@ ui.run(port=8080)</code></pre>
             if not handler:
                 continue
 
-            # Construct full UI path
-            full_path = f"{base_path}/" if route_path == "" else f"{base_path}/{route_path}"
-
-            # Register page as GET route
-            self.fastapi.get(full_path)(handler)
-
-    def mount_plugin_apis(self, plugin: Plugin) -> None:
-        """
-        Mount API endpoints for a plugin to the FastAPI application.
-
-        Args:
-            plugin: Plugin instance with registered APIs
-        """
-        if not hasattr(plugin, "apis"):
-            return
+            # Register page as GET route, the main page at the plugin's base path
+            router.get(f"{base_path}/{route_path}")(handler)
 
+    def _add_api_routes(self, router: APIRouter, plugin: Plugin) -> None:
+        """Register a plugin's API endpoints on router under /api/plugins/<name>."""
         apis = getattr(plugin, "apis", None)
         if not apis or not isinstance(apis, dict):
             return
 
-        plugin_name = plugin.name
-        base_path = f"/api/plugins/{plugin_name}"
+        base_path = f"/api/plugins/{plugin.name}"
 
-        # Register each API endpoint with FastAPI
         for route_path, endpoint_info in apis.items():
             handler = endpoint_info.get("handler")
             if not handler:
@@ -186,33 +240,59 @@ ui.run(port=8080)</code></pre>
             # Construct full path
             full_path = f"{base_path}{route_path}"
 
-            # Register endpoint with FastAPI (determine HTTP method by route pattern)
+            # Register endpoint on the router (determine HTTP method by route pattern)
             if route_path.endswith("/reset") or "reset" in route_path:
-                self.fastapi.post(full_path)(handler)  # Reset endpoints are POST
+                router.post(full_path)(handler)  # Reset endpoints are POST
             elif route_path == "/events":
-                self.fastapi.post(full_path)(handler)  # Events endpoint is POST
+                router.post(full_path)(handler)  # Events endpoint is POST
             else:  # Metrics and other endpoints - GET
-                self.fastapi.get(full_path)(handler)
+                router.get(full_path)(handler)
+
+    def _include_plugin_router(self, router: APIRouter) -> None:
+        """Add a plugin router's routes to the FastAPI application, if it has any."""
+        if router.routes:
+            self.fastapi.include_router(router)
+            # The docs page lists plugin routes, so render it afresh
+            self._docs_response = None
 
     def get_fastapi_app(self) -> FastAPI:
         """Get the FastAPI application instance."""
         return self.fastapi
 
-    async def start(self, port: int = 8080, host: str = "127.0.0.1") -> None:
+    async def start(
+        self,
+        port: int = 8080,
+        host: str = "127.0.0.1",
+        access_log: bool = False,
+        proxy_headers: bool = False,
+    ) -> None:
         """
         Start the web server using uvicorn.
 
         Args:
             port: Port to bind to (default: 8080)
             host: Host to bind to (default: "127.0.0.1" for local access)
+            access_log: Log every request (default: False)
+            proxy_headers: Trust X-Forwarded-* headers, for running behind a reverse proxy (default: False)
         """
         try:
             import uvicorn
         except ImportError as e:
             raise RuntimeError("uvicorn not available. Install with: pip install uvicorn") from e
 
-        # Create server configuration for async context
-        config = uvicorn.Config(app=self.fastapi, port=port, host=host, log_level="info")
+        # Create server configuration for async context; per-request logging and
+        # proxy header rewriting are opt-in since they add work to every request,
+        # and the Server and Date headers are left off every response
+        config = uvicorn.Config(
+            app=self.fastapi,
+            port=port,
+            host=host,
+            log_level="info",
+            access_log=access_log,
+            proxy_headers=proxy_headers,
+            server_header=False,
+            date_header=False,
+        )
         server = uvicorn.Server(config)
 
         # Start server in async context (non-blocking)
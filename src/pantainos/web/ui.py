@@ -22,91 +22,9 @@ else:
 if TYPE_CHECKING:
     from pantainos.application import Pantainos
 
-
-class DocumentationUI:
-    """
-    NiceGUI-based documentation interface for Pantainos applications.
-    """
-
-    def __init__(self, app: Pantainos) -> None:
-        """
-        Initialize documentation UI with Pantainos application.
-        """
-        if not NICEGUI_AVAILABLE:
-            raise RuntimeError("NiceGUI not available. Install with: pip install nicegui")
-
-        self.app = app
-
-    def create_documentation_page(self) -> str:
-        """
-        Create the main documentation page as styled HTML.
-        """
-        from .docs import DocumentationGenerator
-
-        # Extract documentation data
-        doc_generator = DocumentationGenerator(self.app)
-        docs_data = doc_generator.extract_handlers_docs()
-
-        # Build handlers section HTML
-        handlers_html = ""
-        for handler in docs_data.get("handlers", []):
-            handler_name = handler.get("handler_name", "")
-            event_type = handler.get("event_type", "")
-            docstring = handler.get("docstring", "")
-            handlers_html += f"""
-                <div class="handler-card">
-                    <h4>{handler_name}</h4>
-                    <div class="event-type">Event: {event_type}</div>
-                    <div class="handler-description">{docstring}</div>
-                </div>
-            """
-
-        # Build plugins section HTML
-        plugins_html = ""
-        plugins = self.app.plugin_registry.get_all()
-        if plugins:
-            for plugin_name, plugin in plugins.items():
-                plugins_html += f"""
-                    <div class="plugin-card">
-                        <h4>Plugin: {plugin_name}</h4>
-                """
-
-                # API endpoints
-                if hasattr(plugin, "apis") and plugin.apis:
-                    plugins_html += "<div class='plugin-apis'><strong>API Endpoints:</strong><ul>"
-                    for route in plugin.apis:
-                        plugins_html += f"<li><span class='api-badge'>API</span> /api/plugins/{plugin_name}{route}</li>"
-                    plugins_html += "</ul></div>"
-
-                # Web pages
-                if hasattr(plugin, "pages") and plugin.pages:
-                    plugins_html += "<div class='plugin-pages'><strong>Web Pages:</strong><ul>"
-                    for route in plugin.pages:
-                        page_route = (
-                            f"/ui/plugins/{plugin_name}/" if route == "" else f"/ui/plugins/{plugin_name}/{route}"
-                        )
-                        plugins_html += f"<li><span class='ui-badge'>UI</span> {page_route}</li>"
-                    plugins_html += "</ul></div>"
-
-                plugins_html += "</div>"
-        else:
-            plugins_html = "<div class='no-data'>No plugins registered</div>"
-
-        # Build application metrics
-        event_count = (
-            len(self.app.event_bus.handlers) if hasattr(self.app, "event_bus") and self.app.event_bus.handlers else 0
-        )
-        plugin_count = len(self.app.plugin_registry.get_all())
-        web_status = "Enabled" if hasattr(self.app, "web_server") else "Disabled"
-        db_status = "Connected" if hasattr(self.app, "database") else "Not Connected"
-
-        return f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Pantainos API Documentation</title>
-    <style>
-        body {{
+# Stylesheet for the documentation page; static, so it is not re-formatted on every render
+_DOCUMENTATION_CSS = """\
+        body {
             font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
             font-size: 13px;
             margin: 0;
@@ -114,13 +32,13 @@ class DocumentationUI:
             background-color: #1e1e1e;
             color: #d4d4d4;
             line-height: 1.4;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1400px;
             margin: 0 auto;
             padding: 10px;
-        }}
-        h1 {{
+        }
+        h1 {
             color: #4ec9b0;
             font-size: 20px;
             border-bottom: 1px solid #3e3e3e;
@@ -129,8 +47,8 @@ class DocumentationUI:
             font-weight: normal;
             text-transform: uppercase;
             letter-spacing: 2px;
-        }}
-        h2 {{
+        }
+        h2 {
             color: #569cd6;
             font-size: 14px;
             margin-top: 20px;
@@ -139,41 +57,41 @@ class DocumentationUI:
             letter-spacing: 1px;
             border-bottom: 1px solid #3e3e3e;
             padding-bottom: 5px;
-        }}
-        h4 {{
+        }
+        h4 {
             color: #dcdcaa;
             margin: 0 0 5px 0;
             font-size: 13px;
             font-weight: bold;
-        }}
-        .section {{
+        }
+        .section {
             background: #252526;
             border: 1px solid #3e3e3e;
             padding: 10px;
             margin-bottom: 10px;
-        }}
-        .handler-card, .plugin-card {{
+        }
+        .handler-card, .plugin-card {
             border: 1px solid #3e3e3e;
             padding: 8px;
             margin-bottom: 5px;
             background-color: #1e1e1e;
             transition: all 0.1s;
-        }}
-        .handler-card:hover, .plugin-card:hover {{
+        }
+        .handler-card:hover, .plugin-card:hover {
             background-color: #2a2a2a;
             border-color: #4ec9b0;
-        }}
-        .event-type {{
+        }
+        .event-type {
             color: #9cdcfe;
             font-size: 11px;
             margin-bottom: 5px;
-        }}
-        .handler-description {{
+        }
+        .handler-description {
             color: #808080;
             font-size: 11px;
             line-height: 1.3;
-        }}
-        .api-badge {{
+        }
+        .api-badge {
             background-color: #0d7a44;
             color: #4af626;
             padding: 1px 4px;
@@ -181,8 +99,8 @@ class DocumentationUI:
             font-weight: bold;
             margin-right: 5px;
             text-transform: uppercase;
-        }}
-        .ui-badge {{
+        }
+        .ui-badge {
             background-color: #7a440d;
             color: #f6a64a;
             padding: 1px 4px;
@@ -190,66 +108,156 @@ class DocumentationUI:
             font-weight: bold;
             margin-right: 5px;
             text-transform: uppercase;
-        }}
-        .metrics-grid {{
+        }
+        .metrics-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 5px;
             margin-top: 10px;
-        }}
-        .metric-card {{
+        }
+        .metric-card {
             background: #1e1e1e;
             padding: 10px;
             border: 1px solid #3e3e3e;
             text-align: center;
-        }}
-        .metric-value {{
+        }
+        .metric-value {
             font-size: 18px;
             font-weight: bold;
             color: #4ec9b0;
             display: block;
-        }}
-        .metric-label {{
+        }
+        .metric-label {
             color: #808080;
             font-size: 10px;
             text-transform: uppercase;
             letter-spacing: 1px;
             margin-top: 3px;
-        }}
-        .no-data {{
+        }
+        .no-data {
             color: #606060;
             font-size: 11px;
             padding: 10px;
             text-align: center;
             background: #1e1e1e;
             border: 1px dashed #3e3e3e;
-        }}
-        ul {{
+        }
+        ul {
             margin: 5px 0;
             padding-left: 15px;
             list-style-type: none;
-        }}
-        li {{
+        }
+        li {
             margin-bottom: 3px;
             font-size: 11px;
-        }}
-        li:before {{
+        }
+        li:before {
             content: "▸ ";
             color: #608b4e;
             margin-right: 3px;
-        }}
-        .plugin-apis, .plugin-pages {{
+        }
+        .plugin-apis, .plugin-pages {
             margin-top: 5px;
             font-size: 11px;
-        }}
-        strong {{
+        }
+        strong {
             color: #c586c0;
             font-weight: normal;
             text-transform: uppercase;
             font-size: 10px;
             letter-spacing: 1px;
-        }}
-    </style>
+        }
+"""
+
+
+class DocumentationUI:
+    """
+    NiceGUI-based documentation interface for Pantainos applications.
+    """
+
+    def __init__(self, app: Pantainos) -> None:
+        """
+        Initialize documentation UI with Pantainos application.
+        """
+        if not NICEGUI_AVAILABLE:
+            raise RuntimeError("NiceGUI not available. Install with: pip install nicegui")
+
+        self.app = app
+
+    def create_documentation_page(self) -> str:
+        """
+        Create the main documentation page as styled HTML.
+        """
+        from .docs import DocumentationGenerator
+
+        # Extract documentation data
+        doc_generator = DocumentationGenerator(self.app)
+        docs_data = doc_generator.extract_handlers_docs()
+
+        # Build handlers section HTML; parts are joined once rather than concatenated per card
+        handler_parts = []
+        for handler in docs_data.get("handlers", []):
+            handler_name = handler.get("handler_name", "")
+            event_type = handler.get("event_type", "")
+            docstring = handler.get("docstring", "")
+            handler_parts.append(f"""
+                <div class="handler-card">
+                    <h4>{handler_name}</h4>
+                    <div class="event-type">Event: {event_type}</div>
+                    <div class="handler-description">{docstring}</div>
+                </div>
+            """)
+        handlers_html = "".join(handler_parts)
+
+        # Build plugins section HTML
+        plugins = self.app.plugin_registry.get_all()
+        if plugins:
+            plugin_parts = []
+            for plugin_name, plugin in plugins.items():
+                plugin_parts.append(f"""
+                    <div class="plugin-card">
+                        <h4>Plugin: {plugin_name}</h4>
+                """)
+
+                # API endpoints
+                if hasattr(plugin, "apis") and plugin.apis:
+                    plugin_parts.append("<div class='plugin-apis'><strong>API Endpoints:</strong><ul>")
+                    plugin_parts.extend(
+                        f"<li><span class='api-badge'>API</span> /api/plugins/{plugin_name}{route}</li>"
+                        for route in plugin.apis
+                    )
+                    plugin_parts.append("</ul></div>")
+
+                # Web pages
+                if hasattr(plugin, "pages") and plugin.pages:
+                    plugin_parts.append("<div class='plugin-pages'><strong>Web Pages:</strong><ul>")
+                    for route in plugin.pages:
+                        page_route = (
+                            f"/ui/plugins/{plugin_name}/" if route == "" else f"/ui/plugins/{plugin_name}/{route}"
+                        )
+                        plugin_parts.append(f"<li><span class='ui-badge'>UI</span> {page_route}</li>")
+                    plugin_parts.append("</ul></div>")
+
+                plugin_parts.append("</div>")
+            plugins_html = "".join(plugin_parts)
+        else:
+            plugins_html = "<div class='no-data'>No plugins registered</div>"
+
+        # Build application metrics
+        event_count = (
+            len(self.app.event_bus.handlers) if hasattr(self.app, "event_bus") and self.app.event_bus.handlers else 0
+        )
+        plugin_count = len(plugins)
+        web_status = "Enabled" if hasattr(self.app, "web_server") else "Disabled"
+        db_status = "Connected" if hasattr(self.app, "database") else "Not Connected"
+
+        return f"""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Pantainos API Documentation</title>
+    <style>
+{_DOCUMENTATION_CSS}    </style>
 </head>
 <body>
     <div class="container">
@@ -3,6 +3,7 @@ Shared test fixtures for the test suite
 """
 
 import asyncio
+import sys
 import tempfile
 from pathlib import Path
 
@@ -13,6 +14,18 @@ from pantainos.core.event_bus import EventBus
 from pantainos.db.database import Database
 
 
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop (winloop on Windows) when it is available"""
+    try:
+        if sys.platform == "win32":
+            import winloop as fast_loop
+        else:
+            import uvloop as fast_loop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {fast_loop.__name__: fast_loop.new_event_loop}
+
+
 @pytest.fixture
 async def test_database():
     """Create a temporary database for testing"""
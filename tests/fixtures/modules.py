@@ -0,0 +1,22 @@
+"""
+Stand-in modules for optional web UI dependencies
+"""
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+# Built once per worker and shared by every web test module that imports UI code
+NICEGUI_MODULES = {"nicegui": MagicMock(), "nicegui.events": MagicMock()}
+
+
+def mock_web_modules(**extra: Any) -> Any:
+    """
+    Patch sys.modules with the NiceGUI stand-ins for the duration of an import
+
+    Args:
+        **extra: Additional module stand-ins, e.g. ``psutil=mock_psutil``
+
+    Returns:
+        patch.dict context manager
+    """
+    return patch.dict("sys.modules", {**NICEGUI_MODULES, **extra})
@@ -37,6 +37,19 @@ class TestServiceContainer:
         assert resolved is service_instance
         assert resolved.value == "singleton"
 
+    def test_singleton_reregistration(self):
+        """Test that re-registering a singleton keeps the same instance and replaces a different one"""
+        container = ServiceContainer()
+        first = MockService("first")
+
+        container.register_singleton(MockService, first)
+        container.register_singleton(MockService, first)
+        assert container.resolve(MockService) is first
+
+        second = MockService("second")
+        container.register_singleton(MockService, second)
+        assert container.resolve(MockService) is second
+
     def test_factory_registration_and_resolution(self):
         """Test that factory services can be registered and create new instances"""
         container = ServiceContainer()
@@ -123,6 +136,18 @@ class TestServiceContainer:
         assert not container.is_registered(MockService)
         assert not container.is_registered(AnotherMockService)
 
+    def test_unregister_removes_one_service(self):
+        """Test unregister removes only the given service and ignores unknown types"""
+        container = ServiceContainer()
+        container.register_singleton(MockService, MockService())
+        container.register_factory(AnotherMockService, lambda: AnotherMockService())
+
+        container.unregister(MockService)
+        container.unregister(MockService)
+
+        assert not container.is_registered(MockService)
+        assert container.is_registered(AnotherMockService)
+
     def test_multiple_service_types(self):
         """Test registering and resolving multiple different service types"""
         container = ServiceContainer()
@@ -161,3 +186,11 @@ class TestServiceContainer:
         assert service2.value == "call_2"
         assert service3.value == "call_3"
         assert call_count == 3
+
+    def test_singleton_registered_as_none_resolves(self):
+        """Test that a singleton explicitly registered as None is still found"""
+        container = ServiceContainer()
+        container.register_singleton(MockService, None)
+        container.register_factory(MockService, lambda: MockService("factory"))
+
+        assert container.resolve(MockService) is None
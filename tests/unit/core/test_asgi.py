@@ -6,14 +6,16 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from pantainos.application import Pantainos
 from pantainos.core.asgi import ASGIManager
+from pantainos.core.lifecycle import LifecycleManager
 
 
 @pytest.fixture
 def mock_app():
     """Create mock Pantainos app instance."""
-    app = MagicMock()
-    app.lifecycle_manager = AsyncMock()
+    app = MagicMock(spec=Pantainos)
+    app.lifecycle_manager = AsyncMock(spec=LifecycleManager)
     app.db_initializer = MagicMock()
     app.database_url = "sqlite:///:memory:"
     app.master_key = None
@@ -130,10 +132,8 @@ def test_fastapi_creation_parameters(asgi_manager):
         assert "lifespan" in call_kwargs
 
 
-def test_documentation_route_success():
+def test_documentation_route_success(mock_app):
     """Test documentation route with successful DocumentationUI."""
-    mock_app = MagicMock()
-
     with patch("pantainos.core.asgi.WEB_AVAILABLE", True):
         with patch("pantainos.core.asgi.FastAPI") as mock_fastapi_class:
             mock_fastapi = MagicMock()
@@ -150,10 +150,8 @@ def test_documentation_route_success():
                 assert mock_fastapi.get.call_count == 2
 
 
-def test_documentation_route_error():
+def test_documentation_route_error(mock_app):
     """Test documentation route error handling."""
-    mock_app = MagicMock()
-
     with patch("pantainos.core.asgi.WEB_AVAILABLE", True):
         with patch("pantainos.core.asgi.FastAPI") as mock_fastapi_class:
             mock_fastapi = MagicMock()
@@ -166,10 +164,8 @@ def test_documentation_route_error():
             assert mock_fastapi.get.call_count == 2
 
 
-def test_event_explorer_route_setup():
+def test_event_explorer_route_setup(mock_app):
     """Test event explorer route setup."""
-    mock_app = MagicMock()
-
     with patch("pantainos.core.asgi.WEB_AVAILABLE", True):
         with patch("pantainos.core.asgi.FastAPI") as mock_fastapi_class:
             mock_fastapi = MagicMock()
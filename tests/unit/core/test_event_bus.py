@@ -3,6 +3,7 @@ EventBus tests - Core event routing functionality
 """
 
 import asyncio
+import contextvars
 
 import pytest
 
@@ -38,7 +39,7 @@ async def test_basic_registration(event_bus):
 
     event = GenericEvent(type="test.event", data={"value": "test"}, source="test")
     await event_bus.emit(event)
-    await asyncio.sleep(0.1)  # Allow event processing
+    await event_bus.drain()
 
     assert len(results) == 1
     assert results[0] == "test"
@@ -58,12 +59,12 @@ async def test_conditions_filter_events(event_bus):
     # Event that doesn't match condition
     event1 = GenericEvent(type="test.event", data={"value": "filtered", "status": "inactive"}, source="test")
     await event_bus.emit(event1)
-    await asyncio.sleep(0.1)
+    await event_bus.drain()
 
     # Event that matches condition
     event2 = GenericEvent(type="test.event", data={"value": "passed", "status": "active"}, source="test")
     await event_bus.emit(event2)
-    await asyncio.sleep(0.1)
+    await event_bus.drain()
 
     assert len(results) == 1
     assert results[0] == "passed"
@@ -85,13 +86,57 @@ async def test_multiple_handlers(event_bus):
 
     event = GenericEvent(type="test.event", data={"value": "test"}, source="test")
     await event_bus.emit(event)
-    await asyncio.sleep(0.1)
+    await event_bus.drain()
 
     assert len(results) == 2
     assert "handler1" in results
     assert "handler2" in results
 
 
+@pytest.mark.asyncio
+async def test_drain_waits_for_slow_handlers(event_bus):
+    """Test that drain returns only after queued events' handlers have finished"""
+    results = []
+
+    async def slow_handler(event):
+        await asyncio.sleep(0.01)
+        results.append(event.data["value"])
+
+    event_bus.register("test.event", slow_handler)
+
+    for value in range(3):
+        await event_bus.emit(GenericEvent(type="test.event", data={"value": value}, source="test"))
+    await asyncio.wait_for(event_bus.drain(), timeout=1.0)
+
+    assert sorted(results) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_bounds_concurrent_dispatch(container):
+    """Test that no more events are dispatched at once than there are workers"""
+    bus = EventBus(container, workers=2)
+    running = 0
+    peak = 0
+
+    async def handler(event):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    bus.register("test.event", handler)
+    await bus.start()
+    assert len(bus.worker_tasks) == 2
+
+    await bus.emit_many(GenericEvent(type="test.event", data={"value": i}, source="test") for i in range(10))
+    await asyncio.wait_for(bus.drain(), timeout=1.0)
+    await bus.stop()
+
+    assert peak == 2
+    assert bus.worker_tasks == []
+
+
 @pytest.mark.asyncio
 async def test_dependency_injection(event_bus):
     """Test that dependency injection works for handlers"""
@@ -113,7 +158,7 @@ async def test_dependency_injection(event_bus):
 
     event = GenericEvent(type="test.event", data={"value": "test"}, source="test")
     await event_bus.emit(event)
-    await asyncio.sleep(0.1)
+    await event_bus.drain()
 
     assert len(results) == 1
     assert results[0] == "injected_data"
@@ -124,11 +169,49 @@ async def test_no_handlers_no_errors(event_bus):
     """Test that events with no handlers don't cause errors"""
     event = GenericEvent(type="nonexistent.event", data={"value": "test"}, source="test")
     await event_bus.emit(event)
-    await asyncio.sleep(0.1)
+    await event_bus.drain()
 
     # Should complete without errors
 
 
+@pytest.mark.asyncio
+async def test_emit_skips_queue_without_consumers(container):
+    """Test that events nothing consumes are not queued for dispatch"""
+    bus = EventBus(container)
+
+    await bus.emit(GenericEvent(type="unheard.event", source="test"))
+    assert bus.event_queue.empty()
+
+    async def hook(event):
+        pass
+
+    bus.add_event_hook(hook)
+    await bus.emit(GenericEvent(type="unheard.event", source="test"))
+    assert bus.event_queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_emit_many_preserves_order(event_bus):
+    """Test that a batch of events is dispatched in the order given"""
+    results = []
+
+    async def handler(event):
+        results.append(event.data["value"])
+
+    event_bus.register("test.event", handler)
+
+    await event_bus.emit_many(
+        [
+            GenericEvent(type="test.event", data={"value": 1}, source="test"),
+            GenericEvent(type="unheard.event", data={"value": 2}, source="test"),
+            GenericEvent(type="test.event", data={"value": 3}, source="test"),
+        ]
+    )
+    await event_bus.drain()
+
+    assert results == [1, 3]
+
+
 @pytest.mark.asyncio
 async def test_add_event_hook(event_bus):
     """Test that we can add event hooks to track all events"""
@@ -143,7 +226,7 @@ async def test_add_event_hook(event_bus):
     # Emit an event
     event = GenericEvent(type="test.event", data={"data": "test"}, source="test")
     await event_bus.emit(event)
-    await asyncio.sleep(0.1)  # Let event processing complete
+    await event_bus.drain()
 
     # Hook should have captured the event
     assert len(events_captured) == 1
@@ -166,7 +249,7 @@ async def test_remove_event_hook(event_bus):
     # Emit an event
     event = GenericEvent(type="test.event", data={"data": "test"}, source="test")
     await event_bus.emit(event)
-    await asyncio.sleep(0.1)
+    await event_bus.drain()
 
     # Hook should not have captured anything
     assert len(events_captured) == 0
@@ -189,8 +272,112 @@ async def test_multiple_event_hooks(event_bus):
 
     event = GenericEvent(type="test.event", data={"data": "test"}, source="test")
     await event_bus.emit(event)
-    await asyncio.sleep(0.1)
+    await event_bus.drain()
 
     # Both hooks should have captured the event
     assert len(events_captured_1) == 1
     assert len(events_captured_2) == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_lets_in_flight_handlers_finish(container):
+    """Test that stop waits for a handler mid-dispatch instead of cancelling it"""
+    bus = EventBus(container, workers=2)
+    started = asyncio.Event()
+    finished = []
+
+    async def slow_handler(event):
+        started.set()
+        await asyncio.sleep(0.01)
+        finished.append(event.data["value"])
+
+    bus.register("test.event", slow_handler)
+    await bus.start()
+    await bus.emit(GenericEvent(type="test.event", data={"value": 1}, source="test"))
+    await asyncio.wait_for(started.wait(), timeout=1.0)
+
+    await asyncio.wait_for(bus.stop(), timeout=1.0)
+
+    assert finished == [1]
+    assert bus.worker_tasks == []
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_handlers_that_outlive_grace_period(container):
+    """Test that stop cancels a handler that never finishes once the grace period runs out"""
+    bus = EventBus(container, workers=1)
+    started = asyncio.Event()
+    cancelled = []
+
+    async def stuck_handler(event):
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(event.data["value"])
+            raise
+
+    bus.register("test.event", stuck_handler)
+    await bus.start()
+    await bus.emit(GenericEvent(type="test.event", data={"value": 1}, source="test"))
+    await asyncio.wait_for(started.wait(), timeout=1.0)
+
+    await asyncio.wait_for(bus.stop(grace_period=0.01), timeout=1.0)
+
+    assert cancelled == [1]
+    assert bus.worker_tasks == []
+
+
+@pytest.mark.asyncio
+async def test_context_vars_do_not_leak_between_events(container):
+    """Test that a context variable set by one event's handler is not seen by the next"""
+    request_id: contextvars.ContextVar[int | None] = contextvars.ContextVar("request_id", default=None)
+    seen = []
+
+    async def handler(event):
+        seen.append(request_id.get())
+        request_id.set(event.data["value"])
+
+    bus = EventBus(container, workers=1)
+    bus.register("test.event", handler)
+    await bus.start()
+    try:
+        for value in (1, 2):
+            await bus.emit(GenericEvent(type="test.event", data={"value": value}, source="test"))
+        await asyncio.wait_for(bus.drain(), timeout=1.0)
+    finally:
+        await bus.stop()
+
+    assert seen == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_drain_when_not_running(container):
+    """Test that drain returns with nothing queued and raises with events nobody will dispatch"""
+    bus = EventBus(container)
+
+    # Nothing queued: returns immediately
+    await asyncio.wait_for(bus.drain(), timeout=1.0)
+
+    async def handler(event):
+        pass
+
+    bus.register("test.event", handler)
+    await bus.emit(GenericEvent(type="test.event", source="test"))
+
+    with pytest.raises(RuntimeError, match="not running"):
+        await asyncio.wait_for(bus.drain(), timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_events_without_consumers_are_dropped_with_debug_log(container, caplog):
+    """Test that an event nothing consumes is not queued and the drop is logged"""
+    bus = EventBus(container)
+
+    with caplog.at_level("DEBUG", logger="pantainos.core.event_bus"):
+        await bus.emit(GenericEvent(type="unheard.event", source="test"))
+        await bus.emit_many([GenericEvent(type="unheard.other", source="test")])
+
+    assert bus.event_queue.empty()
+    assert "Event dropped, nothing consumes it: unheard.event from test" in caplog.text
+    assert "Event dropped, nothing consumes it: unheard.other from test" in caplog.text
@@ -194,24 +194,27 @@ class TestVariableRepository:
         await repo.set("session_number", 3.14, persistent=False)
 
         # List persistent variables
-        persistent_vars = await repo.list_variables(persistent=True)
+        assert len(await repo.list_variables(persistent=True)) == 4
+        persistent_vars = await repo.list_variables_by_name(persistent=True)
         assert len(persistent_vars) == 4
 
         # Check structure and values
-        string_var = next(v for v in persistent_vars if v["name"] == "string_var")
+        string_var = persistent_vars["string_var"]
+        assert string_var["name"] == "string_var"
         assert string_var["value"] == "hello"
         assert string_var["data_type"] == "string"
         assert string_var["description"] == "A string"
 
-        number_var = next(v for v in persistent_vars if v["name"] == "number_var")
+        number_var = persistent_vars["number_var"]
         assert number_var["value"] == 42
         assert number_var["data_type"] == "number"
 
         # List session variables
-        session_vars = await repo.list_variables(persistent=False)
+        assert len(await repo.list_variables(persistent=False)) == 2
+        session_vars = await repo.list_variables_by_name(persistent=False)
         assert len(session_vars) == 2
 
-        session_string = next(v for v in session_vars if v["name"] == "session_string")
+        session_string = session_vars["session_string"]
         assert session_string["value"] == "session"
         assert session_string["data_type"] == "string"
 
@@ -395,3 +398,20 @@ class TestVariableRepository:
         assert breakdown["number"] == 2
         assert breakdown["boolean"] == 1
         assert breakdown["json"] == 1
+
+    @pytest.mark.parametrize(("truthy", "falsy"), [(1, 0), ("yes", None), (1, "")])
+    async def test_persistent_flag_accepts_truthy_and_falsy_values(self, setup_repo, truthy, falsy):
+        """Test that non-bool persistent flags select the table by truthiness"""
+        repo = setup_repo
+
+        await repo.set("flag_var", "persistent", persistent=True)
+        await repo.set("flag_var", "session", persistent=False)
+
+        assert await repo.get("flag_var", persistent=truthy) == "persistent"
+        assert await repo.get("flag_var", persistent=falsy) == "session"
+        assert await repo.exists("flag_var", persistent=truthy)
+        assert await repo.exists("flag_var", persistent=falsy)
+
+        assert await repo.delete("flag_var", persistent=falsy)
+        assert not await repo.exists("flag_var", persistent=False)
+        assert await repo.exists("flag_var", persistent=True)
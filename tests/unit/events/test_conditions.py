@@ -2,7 +2,10 @@
 Tests for conditions.py - Event filtering conditions
 """
 
+import pytest
+
 from pantainos.events import Condition, equals
+from pantainos.events.conditions import contains
 
 
 def test_equals_condition_creates_callable():
@@ -11,6 +14,62 @@ def test_equals_condition_creates_callable():
 
     assert callable(condition)
     assert isinstance(condition, Condition)
+    assert condition.name == "equals(status, active)"
+
+
+def test_equals_condition_combines_with_condition():
+    """Test that a Condition can be combined with an equals condition"""
+    from pantainos.events import GenericEvent
+
+    combined = GenericEvent.source_is("web") & equals("status", "active")
+
+    assert isinstance(combined, Condition)
+    assert combined.name == "(source_is(web) AND equals(status, active))"
+    assert combined(GenericEvent(type="test", data={"status": "active"}, source="web")) is True
+    assert combined(GenericEvent(type="test", data={"status": "active"}, source="other")) is False
+
+
+@pytest.mark.parametrize(
+    ("build", "name", "expected"),
+    [
+        (
+            lambda: equals("status", "active") & contains("tag", "x"),
+            "(equals(status, active) AND contains(tag, x))",
+            [True, False, False],
+        ),
+        (
+            lambda: contains("tag", "x") & equals("status", "active"),
+            "(contains(tag, x) AND equals(status, active))",
+            [True, False, False],
+        ),
+        (
+            lambda: equals("status", "active") | equals("status", "idle"),
+            "(equals(status, active) OR equals(status, idle))",
+            [True, True, False],
+        ),
+        (
+            lambda: contains("tag", "x") | equals("status", "idle"),
+            "(contains(tag, x) OR equals(status, idle))",
+            [True, True, False],
+        ),
+        (lambda: ~equals("status", "active"), "NOT equals(status, active)", [False, True, True]),
+    ],
+)
+def test_equals_condition_composes_on_either_side(build, name, expected):
+    """Test that equals conditions combine with &, | and ~ from either side"""
+    from pantainos.events import GenericEvent
+
+    events = [
+        GenericEvent(type="test", data={"status": "active", "tag": "x"}, source="test"),
+        GenericEvent(type="test", data={"status": "idle", "tag": "y"}, source="test"),
+        GenericEvent(type="test", data={"status": "off", "tag": "y"}, source="test"),
+    ]
+
+    condition = build()
+
+    assert isinstance(condition, Condition)
+    assert condition.name == name
+    assert [condition(event) for event in events] == expected
 
 
 def test_equals_condition_matches_correct_value():
@@ -78,3 +78,17 @@ def test_event_condition_methods():
 
     wrong_source_condition = GenericEvent.source_is("other_source")
     assert wrong_source_condition(event) is False
+
+
+def test_from_trusted_builds_event_without_validation():
+    """Test that from_trusted constructs events and applies defaults"""
+    event = GenericEvent.from_trusted(type="trusted.event", source="scheduler")
+
+    assert isinstance(event, GenericEvent)
+    assert event.event_type == "trusted.event"
+    assert event.source == "scheduler"
+    assert event.data == {}
+
+    # Values are stored as-is, no coercion takes place
+    raw = SystemEvent.from_trusted(action="startup", pid="123")
+    assert raw.pid == "123"
@@ -2,6 +2,8 @@
 Tests for Plugin base class (src/pantainos/plugin/base.py)
 """
 
+import pytest
+
 from pantainos.plugin.base import HealthCheck, Plugin
 
 
@@ -17,38 +19,26 @@ class SimpleTestPlugin(Plugin):
         return HealthCheck.healthy("Test plugin is healthy")
 
 
-def test_plugin_can_be_instantiated_with_only_name():
-    """Plugin should only require name property, not version"""
-    # This should work now that version is removed
-    plugin = SimpleTestPlugin()
-    assert plugin.name == "test"
-
-
-def test_plugin_needs_emit_method():
-    """Plugin should have emit method for sending events"""
-    plugin = SimpleTestPlugin()
-
-    # Plugin should have emit method
-    assert hasattr(plugin, "emit"), "Plugin missing emit method"
-    assert callable(plugin.emit), "emit should be callable"
+@pytest.fixture(scope="module")
+def plugin():
+    """SimpleTestPlugin shared by the read-only interface checks"""
+    return SimpleTestPlugin()
 
 
-def test_plugin_needs_mount_hook():
-    """Plugin should have _mount method for app integration"""
-    plugin = SimpleTestPlugin()
-
-    # Plugin should have _mount method
-    assert hasattr(plugin, "_mount"), "Plugin missing _mount method"
-    assert callable(plugin._mount), "_mount should be callable"
-
-
-def test_plugin_needs_lifecycle_methods():
-    """Plugin should have start/stop lifecycle methods"""
-    plugin = SimpleTestPlugin()
+def test_plugin_can_be_instantiated_with_only_name(plugin):
+    """Plugin should only require name property, not version"""
+    assert plugin.name == "test"
 
-    # Plugin should have start and stop methods
-    assert hasattr(plugin, "start"), "Plugin missing start method"
-    assert callable(plugin.start), "start should be callable"
 
-    assert hasattr(plugin, "stop"), "Plugin missing stop method"
-    assert callable(plugin.stop), "stop should be callable"
+@pytest.mark.parametrize(
+    "method",
+    [
+        "emit",  # sending events
+        "_mount",  # app integration
+        "start",  # lifecycle
+        "stop",  # lifecycle
+    ],
+)
+def test_plugin_has_callable(plugin, method):
+    """Plugin should expose the emit, mount and lifecycle methods"""
+    assert callable(getattr(plugin, method, None)), f"Plugin missing {method} method"
@@ -2,7 +2,11 @@
 Tests for PluginRegistry - Plugin management and lifecycle
 """
 
-from unittest.mock import MagicMock
+import asyncio
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any
+from unittest.mock import create_autospec
 
 import pytest
 
@@ -11,63 +15,107 @@ from pantainos.plugin.base import HealthCheck, Plugin
 from pantainos.plugin.manager import PluginRegistry
 
 
+def _home() -> str:
+    return "home"
+
+
+def _status() -> dict[str, str]:
+    return {"status": "ok"}
+
+
+# Read-only so the instances sharing them cannot leak changes between tests
+_DEFAULT_PAGES = MappingProxyType({"index": MappingProxyType({"handler": _home, "type": "page"})})
+_DEFAULT_APIS = MappingProxyType({"status": MappingProxyType({"handler": _status, "type": "api"})})
+
+
 class MockPlugin(Plugin):
-    """Mock plugin for testing"""
+    """
+    Configurable mock plugin for testing
+
+    Args:
+        name: Plugin name
+        lifecycle: Track start/stop calls and expose pages/apis; when False the
+            lifecycle hooks are no-ops and pages/apis keep the empty defaults
+        raises: Make start/stop raise and report unhealthy
+    """
 
-    def __init__(self, name: str = "mock", **config):
+    __slots__ = ("_name", "apis", "lifecycle", "pages", "raises", "started", "stopped")
+
+    def __init__(self, name: str = "mock", *, lifecycle: bool = True, raises: bool = False, **config):
         super().__init__(**config)
         self._name = name
+        self.lifecycle = lifecycle
+        self.raises = raises
         self.started = False
         self.stopped = False
-        self.pages = {"index": {"handler": lambda: "home", "type": "page"}}
-        self.apis = {"status": {"handler": lambda: {"status": "ok"}, "type": "api"}}
+        if lifecycle:
+            # Tests never mutate these, so every instance shares the same mappings
+            self.pages = _DEFAULT_PAGES
+            self.apis = _DEFAULT_APIS
 
     @property
     def name(self) -> str:
         return self._name
 
     async def health_check(self) -> HealthCheck:
+        if self.raises:
+            return HealthCheck.unhealthy("Error plugin always fails")
         return HealthCheck.healthy("Mock plugin is healthy")
 
     async def start(self) -> None:
-        self.started = True
+        if self.raises:
+            raise Exception("Start error")
+        if self.lifecycle:
+            self.started = True
 
     async def stop(self) -> None:
-        self.stopped = True
+        if self.raises:
+            raise Exception("Stop error")
+        if self.lifecycle:
+            self.stopped = True
+
 
+class BarePlugin(Plugin):
+    """Plugin that never gets pages/apis attributes"""
 
-class MockPluginWithoutLifecycle(Plugin):
-    """Mock plugin without start/stop methods"""
+    def __init__(self) -> None:
+        # Skip Plugin.__init__, which would create the pages/apis dicts
+        self.config = {}
+        self.app = None
 
     @property
     def name(self) -> str:
         return "simple"
 
     async def health_check(self) -> HealthCheck:
-        return HealthCheck.healthy("Simple plugin is healthy")
+        return HealthCheck.healthy("Bare plugin is healthy")
 
 
-class MockPluginThrowsError(Plugin):
-    """Mock plugin that throws errors during lifecycle"""
+# Introspecting ServiceContainer for the spec is the costly part, so build it once
+_CONTAINER_TEMPLATE = create_autospec(ServiceContainer, instance=True)
 
-    @property
-    def name(self) -> str:
-        return "error"
 
-    async def health_check(self) -> HealthCheck:
-        return HealthCheck.unhealthy("Error plugin always fails")
+@pytest.fixture
+def mock_container():
+    """Provide the shared mock ServiceContainer with its call history cleared"""
+    _CONTAINER_TEMPLATE.reset_mock()
+    return _CONTAINER_TEMPLATE
 
-    async def start(self) -> None:
-        raise Exception("Start error")
 
-    async def stop(self) -> None:
-        raise Exception("Stop error")
+@dataclass
+class WebServerStub:
+    """Records the plugins passed to the web server mount hook"""
+
+    mount_calls: list[Any] = field(default_factory=list)
+
+    def mount_plugin(self, plugin: Any) -> None:
+        self.mount_calls.append(plugin)
 
 
 @pytest.fixture
-def mock_container():
-    """Create mock ServiceContainer"""
-    return MagicMock(spec=ServiceContainer)
+def mock_web_server():
+    """Create web server stub"""
+    return WebServerStub()
 
 
 @pytest.fixture
@@ -76,6 +124,12 @@ def plugin_registry(mock_container):
     return PluginRegistry(mock_container)
 
 
+@pytest.fixture(scope="module")
+def empty_registry():
+    """Shared empty PluginRegistry for tests that never mount anything"""
+    return PluginRegistry(_CONTAINER_TEMPLATE)
+
+
 @pytest.fixture
 def mock_plugin():
     """Create mock plugin"""
@@ -83,20 +137,15 @@ def mock_plugin():
 
 
 @pytest.fixture
-def mock_web_server():
-    """Create mock web server"""
-    web_server = MagicMock()
-    web_server.mount_plugin_pages = MagicMock()
-    web_server.mount_plugin_apis = MagicMock()
-    return web_server
+def make_plugin():
+    """Factory for named mock plugins"""
+    return lambda name="mock", **kwargs: MockPlugin(name, **kwargs)
 
 
-def test_plugin_registry_initialization(mock_container):
+def test_plugin_registry_initialization(empty_registry):
     """Test PluginRegistry initialization"""
-    registry = PluginRegistry(mock_container)
-
-    assert registry.plugins == {}
-    assert registry.container == mock_container
+    assert empty_registry.plugins == {}
+    assert empty_registry.container is _CONTAINER_TEMPLATE
 
 
 def test_mount_plugin_success(plugin_registry, mock_plugin, mock_container):
@@ -122,29 +171,27 @@ def test_mount_plugin_with_web_server(plugin_registry, mock_plugin, mock_web_ser
     plugin_registry.mount(mock_plugin, web_server=mock_web_server)
 
     assert "mock" in plugin_registry.plugins
-    mock_web_server.mount_plugin_pages.assert_called_once_with(mock_plugin)
-    mock_web_server.mount_plugin_apis.assert_called_once_with(mock_plugin)
+    assert mock_web_server.mount_calls == [mock_plugin]
 
 
 def test_mount_plugin_without_web_components(plugin_registry, mock_web_server):
     """Test mounting a plugin with empty web components"""
-    plugin = MockPluginWithoutLifecycle()
+    plugin = MockPlugin("simple", lifecycle=False)
     plugin.pages = {}
     plugin.apis = {}
 
     plugin_registry.mount(plugin, web_server=mock_web_server)
 
     assert "simple" in plugin_registry.plugins
-    # Plugin has pages/apis attributes, so mount methods are called even if empty
-    mock_web_server.mount_plugin_pages.assert_called_once_with(plugin)
-    mock_web_server.mount_plugin_apis.assert_called_once_with(plugin)
+    # Plugin has pages/apis attributes, so the web server is called even if they are empty
+    assert mock_web_server.mount_calls == [plugin]
 
 
-def test_mount_plugin_duplicate_name_error(plugin_registry, mock_plugin):
+def test_mount_plugin_duplicate_name_error(plugin_registry, mock_plugin, make_plugin):
     """Test mounting plugins with duplicate names raises error"""
     plugin_registry.mount(mock_plugin)
 
-    another_plugin = MockPlugin(name="mock")
+    another_plugin = make_plugin("mock")
     with pytest.raises(ValueError, match="Plugin 'mock' is already mounted"):
         plugin_registry.mount(another_plugin)
 
@@ -174,16 +221,16 @@ def test_get_plugin_success(plugin_registry, mock_plugin):
     assert result == mock_plugin
 
 
-def test_get_plugin_not_found(plugin_registry):
+def test_get_plugin_not_found(empty_registry):
     """Test getting non-existent plugin returns None"""
-    result = plugin_registry.get("nonexistent")
+    result = empty_registry.get("nonexistent")
     assert result is None
 
 
-def test_get_all_plugins(plugin_registry):
+def test_get_all_plugins(plugin_registry, make_plugin):
     """Test getting all mounted plugins"""
-    plugin1 = MockPlugin(name="plugin1")
-    plugin2 = MockPlugin(name="plugin2")
+    plugin1 = make_plugin("plugin1")
+    plugin2 = make_plugin("plugin2")
 
     plugin_registry.mount(plugin1)
     plugin_registry.mount(plugin2)
@@ -198,18 +245,18 @@ def test_get_all_plugins(plugin_registry):
     assert "plugin3" not in plugin_registry.plugins
 
 
-def test_get_all_plugins_empty(plugin_registry):
+def test_get_all_plugins_empty(empty_registry):
     """Test getting all plugins when none are mounted"""
-    all_plugins = plugin_registry.get_all()
+    all_plugins = empty_registry.get_all()
     assert all_plugins == {}
 
 
 @pytest.mark.asyncio
-async def test_start_all_plugins(plugin_registry):
+async def test_start_all_plugins(plugin_registry, make_plugin):
     """Test starting all mounted plugins"""
-    plugin1 = MockPlugin(name="plugin1")
-    plugin2 = MockPlugin(name="plugin2")
-    plugin3 = MockPluginWithoutLifecycle()  # No start method
+    plugin1 = make_plugin("plugin1")
+    plugin2 = make_plugin("plugin2")
+    plugin3 = MockPlugin("simple", lifecycle=False)  # No-op start hook
 
     plugin_registry.mount(plugin1)
     plugin_registry.mount(plugin2)
@@ -219,15 +266,42 @@ async def test_start_all_plugins(plugin_registry):
 
     assert plugin1.started is True
     assert plugin2.started is True
-    # plugin3 should not error even without start method
+    # plugin3 should not error with a no-op start hook
 
 
 @pytest.mark.asyncio
-async def test_start_all_plugins_with_error(plugin_registry, caplog):
+async def test_start_all_plugins_runs_concurrently(plugin_registry):
+    """Test plugins start concurrently so one plugin can wait on another"""
+    ready = asyncio.Event()
+
+    class WaitingPlugin(MockPlugin):
+        async def start(self) -> None:
+            await ready.wait()
+            self.started = True
+
+    class SignallingPlugin(MockPlugin):
+        async def start(self) -> None:
+            ready.set()
+            self.started = True
+
+    waiting = WaitingPlugin(name="waiting")
+    signalling = SignallingPlugin(name="signalling")
+    plugin_registry.mount(waiting)
+    plugin_registry.mount(signalling)
+
+    # Sequential startup would block forever on the first plugin
+    await asyncio.wait_for(plugin_registry.start_all(), timeout=1.0)
+
+    assert waiting.started is True
+    assert signalling.started is True
+
+
+@pytest.mark.asyncio
+async def test_start_all_plugins_with_error(plugin_registry, caplog, make_plugin):
     """Test starting plugins when one throws error"""
-    plugin1 = MockPlugin(name="plugin1")
-    error_plugin = MockPluginThrowsError()
-    plugin2 = MockPlugin(name="plugin2")
+    plugin1 = make_plugin("plugin1")
+    error_plugin = MockPlugin("error", raises=True)
+    plugin2 = make_plugin("plugin2")
 
     plugin_registry.mount(plugin1)
     plugin_registry.mount(error_plugin)
@@ -244,11 +318,11 @@ async def test_start_all_plugins_with_error(plugin_registry, caplog):
 
 
 @pytest.mark.asyncio
-async def test_stop_all_plugins(plugin_registry):
+async def test_stop_all_plugins(plugin_registry, make_plugin):
     """Test stopping all mounted plugins"""
-    plugin1 = MockPlugin(name="plugin1")
-    plugin2 = MockPlugin(name="plugin2")
-    plugin3 = MockPluginWithoutLifecycle()  # No stop method
+    plugin1 = make_plugin("plugin1")
+    plugin2 = make_plugin("plugin2")
+    plugin3 = MockPlugin("simple", lifecycle=False)  # No-op stop hook
 
     plugin_registry.mount(plugin1)
     plugin_registry.mount(plugin2)
@@ -258,15 +332,15 @@ async def test_stop_all_plugins(plugin_registry):
 
     assert plugin1.stopped is True
     assert plugin2.stopped is True
-    # plugin3 should not error even without stop method
+    # plugin3 should not error with a no-op stop hook
 
 
 @pytest.mark.asyncio
-async def test_stop_all_plugins_with_error(plugin_registry, caplog):
+async def test_stop_all_plugins_with_error(plugin_registry, caplog, make_plugin):
     """Test stopping plugins when one throws error"""
-    plugin1 = MockPlugin(name="plugin1")
-    error_plugin = MockPluginThrowsError()
-    plugin2 = MockPlugin(name="plugin2")
+    plugin1 = make_plugin("plugin1")
+    error_plugin = MockPlugin("error", raises=True)
+    plugin2 = make_plugin("plugin2")
 
     plugin_registry.mount(plugin1)
     plugin_registry.mount(error_plugin)
@@ -289,9 +363,9 @@ def test_is_mounted_true(plugin_registry, mock_plugin):
     assert plugin_registry.is_mounted("mock") is True
 
 
-def test_is_mounted_false(plugin_registry):
+def test_is_mounted_false(empty_registry):
     """Test is_mounted returns False for non-mounted plugin"""
-    assert plugin_registry.is_mounted("nonexistent") is False
+    assert empty_registry.is_mounted("nonexistent") is False
 
 
 def test_mount_calls_plugin_mount_hook(plugin_registry, mock_plugin):
@@ -302,9 +376,9 @@ def test_mount_calls_plugin_mount_hook(plugin_registry, mock_plugin):
     assert mock_plugin.app is None  # _mount(None) was called
 
 
-def test_plugin_registry_lifecycle_integration(plugin_registry):
+def test_plugin_registry_lifecycle_integration(plugin_registry, make_plugin):
     """Test full plugin lifecycle integration"""
-    plugin = MockPlugin(name="lifecycle_test")
+    plugin = make_plugin("lifecycle_test")
 
     # Mount plugin
     plugin_registry.mount(plugin)
@@ -318,24 +392,21 @@ def test_plugin_registry_lifecycle_integration(plugin_registry):
 
 def test_mount_plugin_without_pages_attribute(plugin_registry, mock_web_server):
     """Test mounting plugin without pages attribute doesn't error"""
-    plugin = MockPluginWithoutLifecycle()
-    delattr(plugin, "pages")  # Remove pages attribute
-    delattr(plugin, "apis")  # Remove apis attribute
+    plugin = BarePlugin()
 
     # Should not error
     plugin_registry.mount(plugin, web_server=mock_web_server)
 
     assert "simple" in plugin_registry.plugins
-    mock_web_server.mount_plugin_pages.assert_not_called()
-    mock_web_server.mount_plugin_apis.assert_not_called()
+    assert mock_web_server.mount_calls == []
 
 
 @pytest.mark.asyncio
-async def test_start_stop_empty_registry(plugin_registry):
+async def test_start_stop_empty_registry(empty_registry):
     """Test starting and stopping when no plugins are mounted"""
     # Should not error
-    await plugin_registry.start_all()
-    await plugin_registry.stop_all()
+    await empty_registry.start_all()
+    await empty_registry.stop_all()
 
 
 def test_plugin_registry_container_integration(plugin_registry, mock_plugin, mock_container):
@@ -8,10 +8,62 @@ import pytest
 
 from pantainos.scheduler.events import CronTriggeredEvent, IntervalExecutedEvent, WatchChangedEvent
 
+# Fixed timestamps on 2024-03-15 shared by the tests below
+_T0900 = datetime(2024, 3, 15, 9, 0, 0)
+_T1000 = datetime(2024, 3, 15, 10, 0, 0)
+_T1200 = datetime(2024, 3, 15, 12, 0, 0)
+_T1430 = datetime(2024, 3, 15, 14, 30, 0)
+_T1645 = datetime(2024, 3, 15, 16, 45, 0)
+
+
+# Validated once per session; tests that only echo fields back derive variants
+# with model_copy, which skips validation. Constructor behaviour is still
+# covered by the *_creation and validation tests below.
+@pytest.fixture(scope="session")
+def base_interval_event():
+    """Canonical IntervalExecutedEvent"""
+    return IntervalExecutedEvent(
+        source="scheduler",
+        execution_time=_T1430,
+        execution_count=1,
+        seconds=60.0,
+        start_immediately=False,
+        align_to_minute=False,
+    )
+
+
+@pytest.fixture(scope="session")
+def base_cron_event():
+    """Canonical CronTriggeredEvent"""
+    return CronTriggeredEvent(
+        source="scheduler",
+        execution_time=_T1200,
+        execution_count=1,
+        expression="0 12 * * *",
+        timezone=None,
+        scheduled_time=_T1200,
+    )
+
+
+@pytest.fixture(scope="session")
+def base_watch_event():
+    """Canonical WatchChangedEvent"""
+    return WatchChangedEvent(
+        source="scheduler",
+        execution_time=_T1000,
+        execution_count=1,
+        query="SELECT id FROM new_table",
+        check_interval=60.0,
+        detect_changes=False,
+        has_changes=False,
+        current_result_count=3,
+        previous_result_count=None,
+    )
+
 
 def test_interval_executed_event_creation():
     """Test IntervalExecutedEvent creation with all fields"""
-    execution_time = datetime(2024, 3, 15, 14, 30, 0)
+    execution_time = _T1430
     event = IntervalExecutedEvent(
         source="scheduler",
         execution_time=execution_time,
@@ -30,17 +82,9 @@ def test_interval_executed_event_creation():
     assert event.align_to_minute is False
 
 
-def test_interval_executed_event_default_values():
+def test_interval_executed_event_default_values(base_interval_event):
     """Test IntervalExecutedEvent with minimal required fields"""
-    execution_time = datetime(2024, 3, 15, 14, 30, 0)
-    event = IntervalExecutedEvent(
-        source="scheduler",
-        execution_time=execution_time,
-        execution_count=1,
-        seconds=60.0,
-        start_immediately=False,
-        align_to_minute=False,
-    )
+    event = base_interval_event
 
     assert event.event_type == "@interval"
     assert event.execution_count == 1
@@ -49,31 +93,9 @@ def test_interval_executed_event_default_values():
     assert event.align_to_minute is False
 
 
-def test_interval_executed_event_serialization():
-    """Test IntervalExecutedEvent can be serialized"""
-    execution_time = datetime(2024, 3, 15, 14, 30, 0)
-    event = IntervalExecutedEvent(
-        source="scheduler",
-        execution_time=execution_time,
-        execution_count=3,
-        seconds=45.5,
-        start_immediately=True,
-        align_to_minute=True,
-    )
-
-    event_dict = event.model_dump()
-    # event_type is a ClassVar so not included in serialization
-    assert event.event_type == "@interval"  # Access from instance
-    assert event_dict["execution_count"] == 3
-    assert event_dict["seconds"] == 45.5
-    assert event_dict["start_immediately"] is True
-    assert event_dict["align_to_minute"] is True
-
-
 def test_cron_triggered_event_creation():
     """Test CronTriggeredEvent creation with all fields"""
-    execution_time = datetime(2024, 3, 15, 9, 0, 0)
-    scheduled_time = datetime(2024, 3, 15, 9, 0, 0)
+    execution_time = scheduled_time = _T0900
     event = CronTriggeredEvent(
         source="scheduler",
         execution_time=execution_time,
@@ -92,48 +114,18 @@ def test_cron_triggered_event_creation():
     assert event.scheduled_time == scheduled_time
 
 
-def test_cron_triggered_event_without_timezone():
+def test_cron_triggered_event_without_timezone(base_cron_event):
     """Test CronTriggeredEvent without timezone specified"""
-    execution_time = datetime(2024, 3, 15, 12, 0, 0)
-    scheduled_time = datetime(2024, 3, 15, 12, 0, 0)
-    event = CronTriggeredEvent(
-        source="scheduler",
-        execution_time=execution_time,
-        execution_count=1,
-        expression="0 12 * * *",
-        timezone=None,
-        scheduled_time=scheduled_time,
-    )
+    event = base_cron_event
 
     assert event.event_type == "@cron"
     assert event.timezone is None
     assert event.expression == "0 12 * * *"
 
 
-def test_cron_triggered_event_serialization():
-    """Test CronTriggeredEvent can be serialized"""
-    execution_time = datetime(2024, 3, 15, 18, 30, 0)
-    scheduled_time = datetime(2024, 3, 15, 18, 30, 0)
-    event = CronTriggeredEvent(
-        source="scheduler",
-        execution_time=execution_time,
-        execution_count=7,
-        expression="30 18 * * *",
-        timezone="America/New_York",
-        scheduled_time=scheduled_time,
-    )
-
-    event_dict = event.model_dump()
-    # event_type is a ClassVar so not included in serialization
-    assert event.event_type == "@cron"  # Access from instance
-    assert event_dict["execution_count"] == 7
-    assert event_dict["expression"] == "30 18 * * *"
-    assert event_dict["timezone"] == "America/New_York"
-
-
 def test_watch_changed_event_creation():
     """Test WatchChangedEvent creation with all fields"""
-    execution_time = datetime(2024, 3, 15, 16, 45, 0)
+    execution_time = _T1645
     event = WatchChangedEvent(
         source="scheduler",
         execution_time=execution_time,
@@ -158,20 +150,9 @@ def test_watch_changed_event_creation():
     assert event.previous_result_count == 5
 
 
-def test_watch_changed_event_no_previous_results():
+def test_watch_changed_event_no_previous_results(base_watch_event):
     """Test WatchChangedEvent without previous results (first run)"""
-    execution_time = datetime(2024, 3, 15, 10, 0, 0)
-    event = WatchChangedEvent(
-        source="scheduler",
-        execution_time=execution_time,
-        execution_count=1,
-        query="SELECT id FROM new_table",
-        check_interval=60.0,
-        detect_changes=False,
-        has_changes=False,
-        current_result_count=3,
-        previous_result_count=None,
-    )
+    event = base_watch_event
 
     assert event.event_type == "@watch"
     assert event.execution_count == 1
@@ -181,19 +162,17 @@ def test_watch_changed_event_no_previous_results():
     assert event.previous_result_count is None
 
 
-def test_watch_changed_event_no_changes():
+def test_watch_changed_event_no_changes(base_watch_event):
     """Test WatchChangedEvent when no changes detected"""
-    execution_time = datetime(2024, 3, 15, 11, 30, 0)
-    event = WatchChangedEvent(
-        source="scheduler",
-        execution_time=execution_time,
-        execution_count=20,
-        query="SELECT COUNT(*) FROM stable_table",
-        check_interval=300.0,
-        detect_changes=True,
-        has_changes=False,
-        current_result_count=100,
-        previous_result_count=100,
+    event = base_watch_event.model_copy(
+        update={
+            "execution_count": 20,
+            "query": "SELECT COUNT(*) FROM stable_table",
+            "check_interval": 300.0,
+            "detect_changes": True,
+            "current_result_count": 100,
+            "previous_result_count": 100,
+        }
     )
 
     assert event.event_type == "@watch"
@@ -203,31 +182,43 @@ def test_watch_changed_event_no_changes():
     assert event.previous_result_count == 100
 
 
-def test_watch_changed_event_serialization():
-    """Test WatchChangedEvent can be serialized"""
-    execution_time = datetime(2024, 3, 15, 13, 15, 0)
-    event = WatchChangedEvent(
-        source="scheduler",
-        execution_time=execution_time,
-        execution_count=42,
-        query="SELECT * FROM orders WHERE status = 'pending'",
-        check_interval=30.0,
-        detect_changes=True,
-        has_changes=True,
-        current_result_count=12,
-        previous_result_count=8,
-    )
+@pytest.mark.parametrize(
+    ("fixture_name", "update", "event_type"),
+    [
+        (
+            "base_interval_event",
+            {"execution_count": 3, "seconds": 45.5, "start_immediately": True, "align_to_minute": True},
+            "@interval",
+        ),
+        (
+            "base_cron_event",
+            {"execution_count": 7, "expression": "30 18 * * *", "timezone": "America/New_York"},
+            "@cron",
+        ),
+        (
+            "base_watch_event",
+            {
+                "execution_count": 42,
+                "query": "SELECT * FROM orders WHERE status = 'pending'",
+                "check_interval": 30.0,
+                "detect_changes": True,
+                "has_changes": True,
+                "current_result_count": 12,
+                "previous_result_count": 8,
+            },
+            "@watch",
+        ),
+    ],
+)
+def test_event_serialization(request, fixture_name, update, event_type):
+    """Test scheduler events can be serialized"""
+    event = request.getfixturevalue(fixture_name).model_copy(update=update)
 
     event_dict = event.model_dump()
     # event_type is a ClassVar so not included in serialization
-    assert event.event_type == "@watch"  # Access from instance
-    assert event_dict["execution_count"] == 42
-    assert event_dict["query"] == "SELECT * FROM orders WHERE status = 'pending'"
-    assert event_dict["check_interval"] == 30.0
-    assert event_dict["detect_changes"] is True
-    assert event_dict["has_changes"] is True
-    assert event_dict["current_result_count"] == 12
-    assert event_dict["previous_result_count"] == 8
+    assert event.event_type == event_type
+    assert "event_type" not in event_dict
+    assert event_dict == event_dict | update
 
 
 def test_event_type_class_variables():
@@ -238,48 +229,22 @@ def test_event_type_class_variables():
     assert WatchChangedEvent.event_type == "@watch"
 
 
-def test_event_inheritance_from_event_model():
+def test_event_inheritance_from_event_model(base_interval_event, base_cron_event, base_watch_event):
     """Test that all events inherit from EventModel"""
-    execution_time = datetime.now()
-
-    interval_event = IntervalExecutedEvent(
-        source="test",
-        execution_time=execution_time,
-        execution_count=1,
-        seconds=30.0,
-        start_immediately=False,
-        align_to_minute=False,
-    )
-
-    cron_event = CronTriggeredEvent(
-        source="test",
-        execution_time=execution_time,
-        execution_count=1,
-        expression="0 * * * *",
-        timezone=None,
-        scheduled_time=execution_time,
-    )
-
-    watch_event = WatchChangedEvent(
-        source="test",
-        execution_time=execution_time,
-        execution_count=1,
-        query="SELECT 1",
-        check_interval=60.0,
-        detect_changes=False,
-        has_changes=False,
-        current_result_count=1,
-        previous_result_count=None,
-    )
-
     # All should have common EventModel fields
-    for event in [interval_event, cron_event, watch_event]:
+    for event in [base_interval_event, base_cron_event, base_watch_event]:
         assert hasattr(event, "source")
         assert hasattr(event, "execution_time")
         assert hasattr(event, "execution_count")
         assert hasattr(event, "event_type")
 
 
+def test_event_schemas_built_at_import():
+    """Test that event validators are built when the module is imported"""
+    for event_class in (IntervalExecutedEvent, CronTriggeredEvent, WatchChangedEvent):
+        assert event_class.__pydantic_complete__ is True
+
+
 def test_event_validation():
     """Test that events properly validate required fields"""
     with pytest.raises(ValueError):
@@ -294,17 +259,6 @@ def test_event_validation():
 
 def test_event_field_descriptions():
     """Test that event models have field descriptions"""
-    execution_time = datetime.now()
-
-    interval_event = IntervalExecutedEvent(
-        source="test",
-        execution_time=execution_time,
-        execution_count=1,
-        seconds=30.0,
-        start_immediately=False,
-        align_to_minute=False,
-    )
-
     # Check that fields have descriptions using v2 API (access from class)
     fields = IntervalExecutedEvent.model_fields
     assert fields["execution_time"].description is not None
@@ -3,42 +3,96 @@ Test schedule manager functionality
 """
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock
 
 import pytest
 
-from pantainos.core.di.container import ServiceContainer
-from pantainos.core.event_bus import EventBus
+from pantainos.db.database import Database
+from pantainos.events import EventModel
 from pantainos.scheduler import Cron, Interval, ScheduleManager, Watch
 from pantainos.scheduler.events import IntervalExecutedEvent, WatchChangedEvent
+from pantainos.scheduler.tasks import IntervalTask
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class FakeEventBus:
+    """Event bus stand-in that records emitted events"""
+
+    def __init__(self) -> None:
+        self.emitted: list[EventModel] = []
+        self.on_emit: Callable[[EventModel], Any] | None = None
+
+    async def emit(self, event: EventModel) -> None:
+        self.emitted.append(event)
+        if self.on_emit is not None:
+            self.on_emit(event)
+
+
+class FakeContainer:
+    """Service container stand-in backed by a plain dict"""
+
+    def __init__(self) -> None:
+        self.services: dict[type, Any] = {}
+        self.resolve_calls = 0
+
+    def resolve(self, service_type: type) -> Any:
+        self.resolve_calls += 1
+        return self.services[service_type]
+
+
+class FakeDatabase:
+    """Database stand-in that returns fixed rows for every query"""
+
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+        self.query_count = 0
+
+    async def execute_query(self, query: str, params: tuple[Any, ...] | None = None) -> list[dict[str, Any]]:
+        self.query_count += 1
+        return self.rows
+
+
+class FakeClock:
+    """Virtual clock whose sleep advances time instead of waiting"""
+
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.now += delay
+        await asyncio.sleep(0)
 
 
 @pytest.fixture
-def mock_event_bus():
-    """Create a mock event bus"""
-    mock_bus = AsyncMock(spec=EventBus)
-    return mock_bus
+def fake_event_bus():
+    """Create a fake event bus"""
+    return FakeEventBus()
 
 
 @pytest.fixture
-def mock_container():
-    """Create a mock service container"""
-    mock_container = MagicMock(spec=ServiceContainer)
-    return mock_container
+def fake_container():
+    """Create a fake service container"""
+    return FakeContainer()
 
 
 @pytest.fixture
-def schedule_manager(mock_event_bus, mock_container):
-    """Create a schedule manager with mocked dependencies"""
-    return ScheduleManager(mock_event_bus, mock_container)
+def schedule_manager(fake_event_bus, fake_container):
+    """Create a schedule manager with fake dependencies"""
+    return ScheduleManager(fake_event_bus, fake_container)
 
 
 @pytest.mark.asyncio
-async def test_schedule_manager_creation(mock_event_bus, mock_container):
+async def test_schedule_manager_creation(fake_event_bus, fake_container):
     """Test ScheduleManager can be created"""
-    manager = ScheduleManager(mock_event_bus, mock_container)
-    assert manager.event_bus is mock_event_bus
-    assert manager.container is mock_container
+    manager = ScheduleManager(fake_event_bus, fake_container)
+    assert manager.event_bus is fake_event_bus
+    assert manager.container is fake_container
     assert manager.running is False
     assert len(manager.scheduled_tasks) == 0
 
@@ -52,7 +106,7 @@ async def test_add_interval_schedule(schedule_manager):
     await schedule_manager.add_interval_schedule(mock_handler, interval)
 
     assert len(schedule_manager.scheduled_tasks) == 1
-    task_info = schedule_manager.scheduled_tasks[0]
+    (task_info,) = schedule_manager.scheduled_tasks.values()
     assert task_info.handler is mock_handler
     assert task_info.schedule is interval
     assert task_info.type == "interval"
@@ -67,7 +121,7 @@ async def test_add_cron_schedule(schedule_manager):
     await schedule_manager.add_cron_schedule(mock_handler, cron)
 
     assert len(schedule_manager.scheduled_tasks) == 1
-    task_info = schedule_manager.scheduled_tasks[0]
+    (task_info,) = schedule_manager.scheduled_tasks.values()
     assert task_info.handler is mock_handler
     assert task_info.schedule is cron
     assert task_info.type == "cron"
@@ -82,12 +136,41 @@ async def test_add_watch_schedule(schedule_manager):
     await schedule_manager.add_watch_schedule(mock_handler, watch)
 
     assert len(schedule_manager.scheduled_tasks) == 1
-    task_info = schedule_manager.scheduled_tasks[0]
+    (task_info,) = schedule_manager.scheduled_tasks.values()
     assert task_info.handler is mock_handler
     assert task_info.schedule is watch
     assert task_info.type == "watch"
 
 
+def test_register_task_keys_by_handler_and_schedule(schedule_manager):
+    """Test that tasks are keyed so the same handler can run on several schedules"""
+    handler = AsyncMock()
+    first = IntervalTask(handler=handler, schedule=Interval(seconds=30))
+    second = IntervalTask(handler=handler, schedule=Interval(seconds=60))
+
+    first_key = schedule_manager.register_task(first)
+    second_key = schedule_manager.register_task(second)
+
+    assert first_key != second_key
+    assert schedule_manager.scheduled_tasks[first_key] is first
+    assert schedule_manager.scheduled_tasks[second_key] is second
+
+
+def test_register_task_keeps_duplicate_registrations(schedule_manager):
+    """Test that registering the same handler and schedule twice keeps both tasks"""
+    handler = AsyncMock()
+    schedule = Interval(seconds=30)
+    first = IntervalTask(handler=handler, schedule=schedule)
+    second = IntervalTask(handler=handler, schedule=schedule)
+
+    first_key = schedule_manager.register_task(first)
+    second_key = schedule_manager.register_task(second)
+
+    assert first_key != second_key
+    assert schedule_manager.scheduled_tasks[first_key] is first
+    assert schedule_manager.scheduled_tasks[second_key] is second
+
+
 @pytest.mark.asyncio
 async def test_start_stop_manager(schedule_manager):
     """Test starting and stopping the schedule manager"""
@@ -100,6 +183,9 @@ async def test_start_stop_manager(schedule_manager):
     await schedule_manager.start()
     assert schedule_manager.running is True
     assert len(schedule_manager.background_tasks) == 1
+    (key,) = schedule_manager.scheduled_tasks
+    (task,) = schedule_manager.background_tasks
+    assert task.get_name() == f"schedule:{key}"
 
     # Stop the manager
     await schedule_manager.stop()
@@ -107,21 +193,22 @@ async def test_start_stop_manager(schedule_manager):
 
 
 @pytest.mark.asyncio
-async def test_interval_execution(schedule_manager, mock_event_bus):
+async def test_interval_execution(schedule_manager, fake_event_bus):
     """Test that interval schedules execute correctly"""
     mock_handler = AsyncMock()
     interval = Interval(seconds=0.1, start_immediately=True)  # Very short interval for testing
+    emitted = asyncio.Event()
+    fake_event_bus.on_emit = lambda event: emitted.set()
 
     await schedule_manager.add_interval_schedule(mock_handler, interval)
     await schedule_manager.start()
 
-    # Wait a bit for execution
-    await asyncio.sleep(0.2)
+    # Wait for the first execution
+    await asyncio.wait_for(emitted.wait(), timeout=1.0)
 
     # Check that event was emitted
-    assert mock_event_bus.emit.called
-    call_args = mock_event_bus.emit.call_args[0]
-    event = call_args[0]  # First argument should be IntervalExecutedEvent
+    assert fake_event_bus.emitted
+    event = fake_event_bus.emitted[-1]
     assert isinstance(event, IntervalExecutedEvent)
     assert event.event_type == "@interval"
     assert event.seconds == 0.1  # event should contain interval info
@@ -130,26 +217,25 @@ async def test_interval_execution(schedule_manager, mock_event_bus):
 
 
 @pytest.mark.asyncio
-async def test_watch_execution_with_results(schedule_manager, mock_event_bus):
+async def test_watch_execution_with_results(schedule_manager, fake_event_bus):
     """Test that database watch executes when query returns results"""
     mock_handler = AsyncMock()
     watch = Watch(query="SELECT * FROM users", check_interval=0.1)  # Short interval for testing
 
     # Mock database query to return results
-    mock_db = AsyncMock()
-    mock_db.execute_query = AsyncMock(return_value=[{"id": 1, "name": "test"}])
-    schedule_manager.container.resolve = MagicMock(return_value=mock_db)
+    schedule_manager.container.services[Database] = FakeDatabase([{"id": 1, "name": "test"}])
+    emitted = asyncio.Event()
+    fake_event_bus.on_emit = lambda event: emitted.set()
 
     await schedule_manager.add_watch_schedule(mock_handler, watch)
     await schedule_manager.start()
 
-    # Wait for execution
-    await asyncio.sleep(0.2)
+    # Wait for the first check to emit
+    await asyncio.wait_for(emitted.wait(), timeout=1.0)
 
     # Check that event was emitted with results
-    assert mock_event_bus.emit.called
-    call_args = mock_event_bus.emit.call_args[0]
-    event = call_args[0]  # First argument should be WatchChangedEvent
+    assert fake_event_bus.emitted
+    event = fake_event_bus.emitted[-1]
     assert isinstance(event, WatchChangedEvent)
     assert event.event_type == "@watch"
     assert event.query == "SELECT * FROM users"  # event should contain watch info
@@ -158,49 +244,143 @@ async def test_watch_execution_with_results(schedule_manager, mock_event_bus):
 
 
 @pytest.mark.asyncio
-async def test_execution_count_increments(schedule_manager, mock_event_bus):
+async def test_watch_resolves_database_once(schedule_manager):
+    """Test that watch checks reuse the database resolved on the first check"""
+    watch = Watch(query="SELECT * FROM users", check_interval=60)
+    database = FakeDatabase([{"id": 1}])
+    schedule_manager.container.services[Database] = database
+
+    await schedule_manager.add_watch_schedule(AsyncMock(), watch)
+    (task_info,) = schedule_manager.scheduled_tasks.values()
+
+    assert await schedule_manager._check_watch_condition(task_info) is True
+    assert await schedule_manager._check_watch_condition(task_info) is True
+
+    assert schedule_manager.container.resolve_calls == 1
+    assert database.query_count == 2
+
+    # Stopping drops the cached database so a restart picks up a new one
+    await schedule_manager.stop()
+    assert schedule_manager._database is None
+
+
+@pytest.mark.asyncio
+async def test_execution_count_increments(schedule_manager, fake_event_bus):
     """Test that execution count increments properly"""
     mock_handler = AsyncMock()
     interval = Interval(seconds=0.05, start_immediately=True)
+    executions = asyncio.Semaphore(0)
+    fake_event_bus.on_emit = lambda event: executions.release()
+
+    # Advance the schedule on a virtual clock rather than in real time
+    clock = FakeClock()
+    schedule_manager._clock = clock
+    schedule_manager._sleep = clock.sleep
 
     await schedule_manager.add_interval_schedule(mock_handler, interval)
     await schedule_manager.start()
 
-    # Wait for multiple executions
-    await asyncio.sleep(0.2)
+    # Wait for two executions
+    await asyncio.wait_for(asyncio.gather(executions.acquire(), executions.acquire()), timeout=1.0)
 
     # Should have multiple calls with increasing execution count
-    assert mock_event_bus.emit.call_count >= 2
+    assert len(fake_event_bus.emitted) >= 2
 
     # Check first and last calls have different execution counts
-    first_call_event = mock_event_bus.emit.call_args_list[0][0][0]  # First IntervalExecutedEvent
-    last_call_event = mock_event_bus.emit.call_args_list[-1][0][0]  # Last IntervalExecutedEvent
+    first_call_event = fake_event_bus.emitted[0]
+    last_call_event = fake_event_bus.emitted[-1]
     assert last_call_event.execution_count > first_call_event.execution_count
+    assert clock.now > 1_000_000.0
 
     await schedule_manager.stop()
 
 
 @pytest.mark.asyncio
-async def test_error_handling_in_schedule_execution(schedule_manager, mock_event_bus):
+async def test_queued_events_flushed_on_stop(schedule_manager, fake_event_bus):
+    """Test that events queued by executions are all emitted, in order, by stop()"""
+    await schedule_manager.add_interval_schedule(AsyncMock(), Interval(seconds=60))
+    (task_info,) = schedule_manager.scheduled_tasks.values()
+    await schedule_manager.start()
+
+    for _ in range(3):
+        await schedule_manager._execute_scheduled_task(task_info)
+    await schedule_manager.stop()
+
+    assert [event.execution_count for event in fake_event_bus.emitted] == [1, 2, 3]
+    assert schedule_manager._emit_worker is None
+
+
+@pytest.mark.asyncio
+async def test_events_emitted_directly_without_emit_worker(schedule_manager, fake_event_bus):
+    """Test that executions before start() or after stop() reach the event bus instead of an undrained queue"""
+    await schedule_manager.add_interval_schedule(AsyncMock(), Interval(seconds=60))
+    (task_info,) = schedule_manager.scheduled_tasks.values()
+
+    # Before start()
+    await schedule_manager._execute_scheduled_task(task_info)
+    assert [event.execution_count for event in fake_event_bus.emitted] == [1]
+
+    # After stop()
+    await schedule_manager.start()
+    await schedule_manager.stop()
+    await schedule_manager._execute_scheduled_task(task_info)
+    assert [event.execution_count for event in fake_event_bus.emitted] == [1, 2]
+    assert schedule_manager._emit_queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_typed_events_built_from_task_template(schedule_manager):
+    """Test that executions reuse one template per task but yield distinct events"""
+    await schedule_manager.add_watch_schedule(AsyncMock(), Watch(query="SELECT 1", check_interval=30))
+    (task_info,) = schedule_manager.scheduled_tasks.values()
+    task_info.current_results = [{"id": 1}, {"id": 2}]
+
+    task_info.execution_count = 1
+    first = await schedule_manager._create_typed_event(task_info)
+    task_info.execution_count = 2
+    second = await schedule_manager._create_typed_event(task_info)
+
+    assert len(schedule_manager._event_templates) == 1
+    assert first is not second
+    assert (first.execution_count, second.execution_count) == (1, 2)
+    assert second.model_dump() == second.model_dump() | {
+        "source": "scheduler",
+        "query": "SELECT 1",
+        "check_interval": 30.0,
+        "detect_changes": False,
+        "current_result_count": 2,
+        "previous_result_count": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_error_handling_in_schedule_execution(schedule_manager, fake_event_bus):
     """Test that errors in schedule execution don't crash the manager"""
     mock_handler = AsyncMock()
     interval = Interval(seconds=0.1)
 
     # Make emit raise an exception
-    mock_event_bus.emit.side_effect = Exception("Test error")
+    failed = asyncio.Event()
+
+    def fail(event):
+        failed.set()
+        raise Exception("Test error")
+
+    fake_event_bus.on_emit = fail
 
     await schedule_manager.add_interval_schedule(mock_handler, interval)
     await schedule_manager.start()
 
-    # Wait a bit - manager should still be running despite error
-    await asyncio.sleep(0.2)
+    # Manager should still be running after the failed emit
+    await asyncio.wait_for(failed.wait(), timeout=1.0)
+    await asyncio.sleep(0)
     assert schedule_manager.running is True
 
     await schedule_manager.stop()
 
 
 @pytest.mark.asyncio
-async def test_multiple_schedules(schedule_manager, mock_event_bus):
+async def test_multiple_schedules(schedule_manager, fake_event_bus):
     """Test managing multiple different schedule types"""
     # Add multiple schedule types
     interval_handler = AsyncMock()
@@ -7,7 +7,7 @@ from datetime import datetime
 import pytest
 
 from pantainos.scheduler import Cron, Interval, Schedule, Watch
-from pantainos.scheduler.schedules import daily, every, hourly, watch
+from pantainos.scheduler.schedules import _validate_cron, daily, every, hourly, watch
 
 
 def test_schedule_base_class():
@@ -142,9 +142,49 @@ def test_watch_conditions():
         "* * * *",  # Only 4 parts
         "* * * * * *",  # 6 parts
         "",  # Empty
+        "60 * * * *",  # Minute out of range
+        "* 24 * * *",  # Hour out of range
+        "* * 0 * *",  # Day of month out of range
+        "* * * 13 *",  # Month out of range
+        "* * * * 8",  # Weekday out of range
+        "abc * * * *",  # Not a cron field
     ],
 )
 def test_cron_invalid_expressions(invalid_expression):
     """Test that invalid cron expressions are rejected"""
     with pytest.raises(ValueError):
         Cron(expression=invalid_expression)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "*/5 * * * *",
+        "0 9 * * MON-FRI",
+        "0,30 8-17 1,15 jan-jun 1-5",
+        "59 23 31 12 7",
+    ],
+)
+def test_cron_valid_expressions(expression):
+    """Test that steps, ranges, lists and names are accepted"""
+    assert Cron(expression=expression).expression == expression
+
+
+def test_cron_validation_is_cached():
+    """Test that identical cron expressions are only parsed once"""
+    _validate_cron.cache_clear()
+
+    Cron(expression="0 9 * * *")
+    Cron.daily_at(9)
+
+    info = _validate_cron.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    assert _validate_cron("0 9 * * *") == ("0", "9", "*", "*", "*")
+
+
+@pytest.mark.parametrize("schedule_class", [Schedule, Interval, Cron, Watch])
+def test_event_type_is_class_attribute(schedule_class):
+    """Test that event_type stays a class attribute rather than a per-instance field"""
+    assert "event_type" not in schedule_class.model_fields
+    assert schedule_class.event_type.startswith("@")
@@ -160,8 +160,8 @@ def test_watch_task_change_detection(async_handler, watch_schedule):
     task.has_changes = len(task.current_results) != len(task.previous_results)
     assert task.has_changes is True
 
-    # Update previous results for next check
-    task.previous_results = task.current_results.copy()
+    # Update previous results for next check (rebound, as the scheduler does, not copied)
+    task.previous_results = task.current_results
     task.current_results = [{"id": 1, "count": 5}]  # Same results
     task.has_changes = task.current_results != task.previous_results
     assert task.has_changes is False
@@ -241,3 +241,19 @@ def test_task_type_literals():
     # Type should be readonly (though Pydantic doesn't enforce this at runtime)
     interval_task.type = "wrong"  # This will work but defeats the purpose
     assert interval_task.type == "wrong"  # Shows limitation of runtime typing
+
+
+def test_create_unchecked_applies_defaults(async_handler, interval_schedule, cron_schedule, watch_schedule):
+    """Test that unvalidated construction still fills in field defaults"""
+    interval_task = IntervalTask.create_unchecked(async_handler, interval_schedule)
+    cron_task = CronTask.create_unchecked(async_handler, cron_schedule, next_execution=123.0)
+    watch_task = WatchTask.create_unchecked(async_handler, watch_schedule)
+
+    assert interval_task.type == "interval"
+    assert interval_task.execution_count == 0
+    assert interval_task.last_execution == 0.0
+    assert cron_task.type == "cron"
+    assert cron_task.next_execution == 123.0
+    assert watch_task.type == "watch"
+    assert watch_task.previous_results == []
+    assert watch_task.previous_results is not WatchTask.create_unchecked(async_handler, watch_schedule).previous_results
@@ -7,33 +7,43 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from pantainos.events import GenericEvent
+from pantainos.application import Pantainos
+from pantainos.events import GenericEvent, equals
+from pantainos.scheduler import Cron, Interval, Watch
+
+
+@pytest.fixture(scope="module")
+def shared_app():
+    """Pantainos instance built once per module (and so once per xdist worker)"""
+    return Pantainos(database_url=":memory:")
+
+
+@pytest.fixture
+def app(shared_app):
+    """Shared Pantainos reset to no registrations, for tests that never start the full app"""
+    shared_app.reset()
+    return shared_app
 
 
 @pytest.mark.asyncio
-async def test_application_event_handler_registration():
+async def test_application_event_handler_registration(app):
     """Test that @app.on() decorator registers handlers"""
-    from pantainos.application import Pantainos
-
-    app = Pantainos()
     handler_called = []
+    handler_done = asyncio.Event()
 
     @app.on("test.event")
     async def test_handler(event):
         handler_called.append(event)
+        handler_done.set()
 
     # Start event bus
     await app.event_bus.start()
 
     # Emit event
-    from pantainos.events import GenericEvent
-
     await app.emit(GenericEvent(type="test.event", data={"test": "data"}))
 
-    # Give event bus time to process
-    import asyncio
-
-    await asyncio.sleep(0.1)
+    # Wait for the event bus to dispatch it
+    await asyncio.wait_for(handler_done.wait(), timeout=1.0)
 
     # Handler should have been called
     assert len(handler_called) == 1
@@ -44,12 +54,8 @@ async def test_application_event_handler_registration():
 
 
 @pytest.mark.asyncio
-async def test_application_plugin_mounting():
+async def test_application_plugin_mounting(app):
     """Test that plugins can be mounted"""
-    from pantainos.application import Pantainos
-
-    app = Pantainos()
-
     # Create mock plugin
     mock_plugin = MagicMock()
     mock_plugin.name = "test_plugin"
@@ -67,15 +73,59 @@ async def test_application_plugin_mounting():
     assert registered == mock_plugin
 
 
+def test_application_reset(app):
+    """Test that reset drops handlers, hooks, middleware, plugins, scheduled tasks and queued events"""
+
+    @app.on("test.event")
+    async def handler(event):
+        pass
+
+    async def hook(event):
+        pass
+
+    app.event_bus.add_event_hook(hook)
+    app.event_bus.add_middleware(hook)
+    app.event_bus.add_error_handler(hook)
+    app.event_bus.event_queue.put_nowait(GenericEvent(type="test.event", source="test"))
+
+    @app.on(Interval(seconds=30))
+    async def scheduled(event):
+        pass
+
+    plugin = MagicMock()
+    plugin.name = "test_plugin"
+    app.mount(plugin)
+
+    app.reset()
+
+    assert not app.event_bus.handlers
+    assert not app.event_bus.event_hooks
+    assert not app.event_bus.middleware
+    assert not app.event_bus.error_handlers
+    assert app.event_bus.event_queue.empty()
+    assert not app.plugin_registry.get_all()
+    assert not app.container.is_registered(type(plugin))
+    assert not app.schedule_manager.scheduled_tasks
+
+
+def test_application_builds_asgi_app_lazily():
+    """Test that the FastAPI app is only built when the application is served"""
+    app = Pantainos(database_url=":memory:")
+    assert "asgi_manager" not in vars(app)
+
+    fastapi_app = app()
+
+    assert fastapi_app is app.asgi_manager.fastapi
+    assert app() is fastapi_app
+
+
 @pytest.mark.asyncio
-async def test_application_start_stop():
+async def test_application_start_stop(monkeypatch):
     """Test that application can start and stop"""
-    from pantainos.application import Pantainos
-
     app = Pantainos(database_url=":memory:")
 
-    # Mock database initialization to avoid file system
-    app._initialize_database = AsyncMock()
+    # Skip database initialization to avoid file system
+    monkeypatch.setattr(app, "_initialize_database", AsyncMock())
 
     # Should start successfully
     await app.start()
@@ -91,44 +141,54 @@ async def test_application_start_stop():
 
 
 @pytest.mark.asyncio
-async def test_application_with_conditions():
-    """Test that event handlers work with conditions"""
-    from pantainos.application import Pantainos
-    from pantainos.events import equals
+async def test_application_leaves_loop_task_factory_alone(monkeypatch):
+    """Test that starting and stopping the app does not change the loop's task factory"""
+    app = Pantainos(database_url=":memory:")
+    monkeypatch.setattr(app, "_initialize_database", AsyncMock())
+    loop = asyncio.get_running_loop()
+    original_factory = loop.get_task_factory()
+
+    await app.start()
+    assert loop.get_task_factory() is original_factory
 
-    app = Pantainos()
+    await app.stop()
+    assert loop.get_task_factory() is original_factory
+
+
+@pytest.mark.asyncio
+async def test_application_with_conditions(app):
+    """Test that event handlers work with conditions"""
     handler_called = []
+    handler_done = asyncio.Event()
 
     @app.on("test.event", when=equals("value", "match"))
     async def test_handler(event):
         handler_called.append(event)
+        handler_done.set()
 
     await app.event_bus.start()
 
-    # Emit event that doesn't match condition
-    await app.emit(GenericEvent(type="test.event", data={"value": "nomatch"}))
-    await asyncio.sleep(0.1)
-
-    # Handler should not be called
-    assert len(handler_called) == 0
-
-    # Emit event that matches condition
-    await app.emit(GenericEvent(type="test.event", data={"value": "match"}))
-    await asyncio.sleep(0.1)
-
-    # Handler should be called
+    # Emit an event that doesn't match the condition, then one that does.
+    # Workers may dispatch them in either order, so wait for both to finish.
+    await app.emit_many(
+        [
+            GenericEvent(type="test.event", data={"value": "nomatch"}),
+            GenericEvent(type="test.event", data={"value": "match"}),
+        ]
+    )
+    await asyncio.wait_for(handler_done.wait(), timeout=1.0)
+    await asyncio.wait_for(app.event_bus.drain(), timeout=1.0)
+
+    # Handler should only be called for the matching event
     assert len(handler_called) == 1
+    assert handler_called[0].data == {"value": "match"}
 
     await app.event_bus.stop()
 
 
 @pytest.mark.asyncio
-async def test_application_scheduled_events():
+async def test_application_scheduled_events(app):
     """Test that application supports scheduled events"""
-    from pantainos.application import Pantainos
-    from pantainos.scheduler import Cron, Interval, Watch
-
-    app = Pantainos()
     handler_called = []
 
     @app.on(Interval(seconds=30))
@@ -150,22 +210,19 @@ async def test_application_scheduled_events():
     # Should have registered scheduled tasks
     assert len(app.schedule_manager.scheduled_tasks) == 3
 
-    task_types = [task.type for task in app.schedule_manager.scheduled_tasks]
+    task_types = [task.type for task in app.schedule_manager.scheduled_tasks.values()]
     assert "interval" in task_types
     assert "cron" in task_types
     assert "watch" in task_types
 
 
 @pytest.mark.asyncio
-async def test_application_schedule_manager_lifecycle():
+async def test_application_schedule_manager_lifecycle(monkeypatch):
     """Test that schedule manager starts and stops with application"""
-    from pantainos.application import Pantainos
-    from pantainos.scheduler import Interval
-
     app = Pantainos(database_url=":memory:")
 
-    # Mock database initialization
-    app._initialize_database = AsyncMock()
+    # Skip database initialization
+    monkeypatch.setattr(app, "_initialize_database", AsyncMock())
 
     @app.on(Interval(seconds=60))
     async def test_handler(event):
@@ -189,17 +246,15 @@ async def test_application_schedule_manager_lifecycle():
 
 
 @pytest.mark.asyncio
-async def test_application_mixed_event_types():
+async def test_application_mixed_event_types(app):
     """Test that application handles both regular and scheduled events"""
-    from pantainos.application import Pantainos
-    from pantainos.scheduler import Interval
-
-    app = Pantainos()
     handlers_called = []
+    regular_done = asyncio.Event()
 
     @app.on("regular.event")
     async def regular_handler(event):
         handlers_called.append("regular")
+        regular_done.set()
 
     @app.on(Interval(seconds=30))
     async def scheduled_handler(event):
@@ -213,7 +268,7 @@ async def test_application_mixed_event_types():
 
     # Test regular event
     await app.emit(GenericEvent(type="regular.event", data={}))
-    await asyncio.sleep(0.1)
+    await asyncio.wait_for(regular_done.wait(), timeout=1.0)
 
     # Should have called regular handler
     assert "regular" in handlers_called
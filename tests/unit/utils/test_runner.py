@@ -2,6 +2,7 @@
 Tests for ApplicationRunner
 """
 
+import re
 import sys
 from unittest.mock import MagicMock, patch
 
@@ -9,18 +10,31 @@ import pytest
 
 from pantainos.utils.runner import ApplicationRunner
 
+# Expected RuntimeError messages, compiled once for pytest.raises(match=...)
+WORKERS_UNSUPPORTED = re.compile("Multiple workers feature is unsupported")
+UVICORN_MISSING = re.compile("uvicorn not available")
+NO_IMPORT_STRING = re.compile("Could not auto-detect import string")
 
-@pytest.fixture
+
+class StubApp:
+    """Callable stand-in for a Pantainos app that returns a fixed ASGI app."""
+
+    def __init__(self) -> None:
+        self.asgi_app = object()
+
+    def __call__(self) -> object:
+        return self.asgi_app
+
+
+@pytest.fixture(scope="module")
 def mock_app():
-    """Create a mock Pantainos app instance."""
-    app = MagicMock()
-    app.return_value = MagicMock()  # Mock ASGI app
-    return app
+    """Create a stub Pantainos app instance."""
+    return StubApp()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runner(mock_app):
-    """Create ApplicationRunner with mock app."""
+    """Create ApplicationRunner with mock app, shared by the module since it only holds the app."""
     return ApplicationRunner(mock_app)
 
 
@@ -39,31 +53,17 @@ def test_run_with_workers_error(runner):
     mock_uvicorn = MagicMock()
 
     with patch.dict("sys.modules", {"uvicorn": mock_uvicorn}):
-        with pytest.raises(RuntimeError, match="Multiple workers feature is unsupported"):
+        with pytest.raises(RuntimeError, match=WORKERS_UNSUPPORTED):
             runner.run(workers=2)
 
 
-def test_run_uvicorn_not_available(runner):
+def test_run_uvicorn_not_available(runner, monkeypatch):
     """Test error when uvicorn is not available."""
-    # Remove uvicorn from sys.modules temporarily
-    uvicorn_module = sys.modules.pop("uvicorn", None)
-
-    try:
-        # Mock the import to raise ImportError
-        with patch(
-            "builtins.__import__",
-            side_effect=lambda name, *args, **kwargs: (
-                (_ for _ in ()).throw(ImportError("No module named 'uvicorn'"))
-                if name == "uvicorn"
-                else __import__(name, *args, **kwargs)
-            ),
-        ):
-            with pytest.raises(RuntimeError, match="uvicorn not available"):
-                runner.run()
-    finally:
-        # Restore uvicorn module if it existed
-        if uvicorn_module is not None:
-            sys.modules["uvicorn"] = uvicorn_module
+    # A None entry in sys.modules makes `import uvicorn` raise ImportError
+    monkeypatch.setitem(sys.modules, "uvicorn", None)
+
+    with pytest.raises(RuntimeError, match=UVICORN_MISSING):
+        runner.run()
 
 
 def test_run_with_reload_success(runner, mock_app):
@@ -83,33 +83,20 @@ def test_run_with_reload_no_import_string(runner):
 
     with patch.dict("sys.modules", {"uvicorn": mock_uvicorn}):
         with patch.object(runner, "_get_import_string", return_value=None):
-            with pytest.raises(RuntimeError, match="Could not auto-detect import string"):
+            with pytest.raises(RuntimeError, match=NO_IMPORT_STRING):
                 runner.run(reload=True)
 
 
-def test_filename_to_module_valid(runner):
+def test_filename_to_module_valid(runner, tmp_path, monkeypatch):
     """Test converting valid filename to module name."""
-    with patch("pantainos.utils.runner.Path") as mock_path_class:
-        # Mock Path.cwd()
-        mock_cwd = MagicMock()
-        mock_path_class.cwd.return_value = mock_cwd
+    monkeypatch.chdir(tmp_path)
+    app_file = tmp_path / "src" / "pantainos" / "app.py"
+    app_file.parent.mkdir(parents=True)
+    app_file.touch()
 
-        # Mock Path(filename)
-        mock_file_path = MagicMock()
-        mock_path_class.return_value = mock_file_path
+    result = runner._filename_to_module(str(app_file))
 
-        # Mock the relative_to() chain
-        mock_rel_path = MagicMock()
-        mock_file_path.relative_to.return_value = mock_rel_path
-
-        # Mock with_suffix() and parts
-        mock_module_path = MagicMock()
-        mock_rel_path.with_suffix.return_value = mock_module_path
-        mock_module_path.parts = ("src", "pantainos", "app")
-
-        result = runner._filename_to_module("/path/to/src/pantainos/app.py")
-
-        assert result == "src.pantainos.app"
+    assert result == "src.pantainos.app"
 
 
 def test_filename_to_module_not_python(runner):
@@ -118,17 +105,14 @@ def test_filename_to_module_not_python(runner):
     assert result is None
 
 
-def test_filename_to_module_relative_error(runner):
+def test_filename_to_module_relative_error(runner, tmp_path, monkeypatch):
     """Test handling of relative path errors."""
-    with patch("pathlib.Path.cwd") as mock_cwd, patch("pathlib.Path") as mock_path_class:
-        # Mock the Path constructor to return an object that raises ValueError on relative_to
-        mock_path = MagicMock()
-        mock_path_class.return_value = mock_path
-        mock_path.relative_to.side_effect = ValueError("Different drives")
+    monkeypatch.chdir(tmp_path)
 
-        result = runner._filename_to_module("/path/to/app.py")
+    # A file outside the working directory cannot be made relative to it
+    result = runner._filename_to_module(str(tmp_path.parent / "elsewhere" / "app.py"))
 
-        assert result is None
+    assert result is None
 
 
 def test_get_import_string_not_found(runner):
@@ -139,14 +123,13 @@ def test_get_import_string_not_found(runner):
     assert result is None  # Should return None when not found in any frame
 
 
-def test_filename_to_module_empty_result(runner):
+def test_filename_to_module_empty_result(runner, tmp_path, monkeypatch):
     """Test that empty module name returns None."""
-    with patch("pathlib.Path.cwd") as mock_cwd, patch("pathlib.Path") as mock_path_class:
-        # Mock to return empty parts
-        mock_path = MagicMock()
-        mock_path_class.return_value = mock_path
-        mock_path.relative_to.return_value.with_suffix.return_value.parts = ()
+    # The working directory itself, named like a Python file, has no module path
+    cwd = tmp_path / "app.py"
+    cwd.mkdir()
+    monkeypatch.chdir(cwd)
 
-        result = runner._filename_to_module("/app.py")
+    result = runner._filename_to_module(str(cwd))
 
-        assert result is None
+    assert result is None
@@ -0,0 +1,29 @@
+"""
+Shared fixtures for the web UI tests
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pantainos.application import Pantainos
+
+
+@pytest.fixture
+def mock_app():
+    """Plain stand-in for a Pantainos application with no handlers or plugins"""
+    return SimpleNamespace(event_bus=SimpleNamespace(handlers={}, emit=AsyncMock()), plugins={})
+
+
+@pytest.fixture(scope="module")
+def shared_pantainos():
+    """Real Pantainos instance built once per module (and so once per xdist worker)"""
+    return Pantainos(database_url="sqlite:///:memory:")
+
+
+@pytest.fixture
+def app(shared_pantainos):
+    """Shared Pantainos reset to no handlers, hooks or plugins, with its event bus stopped"""
+    shared_pantainos.reset()
+    return shared_pantainos
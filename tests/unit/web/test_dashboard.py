@@ -2,35 +2,80 @@
 Tests for the modern dashboard hub interface
 """
 
+from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-# Mock NiceGUI and psutil before import
-mock_psutil_module = MagicMock()
-mock_psutil_module.cpu_percent = MagicMock(return_value=0)
-mock_psutil_module.virtual_memory = MagicMock(return_value=MagicMock(percent=0))
+from tests.fixtures.modules import mock_web_modules
 
-with patch.dict("sys.modules", {"nicegui": MagicMock(), "nicegui.events": MagicMock(), "psutil": mock_psutil_module}):
-    from pantainos.web.dashboard import DashboardHub
+# Instant the dashboard's clock is pinned to
+FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def dashboard_module():
+    """pantainos.web.dashboard, imported once per module with NiceGUI mocked out"""
+    with mock_web_modules():
+        import pantainos.web.dashboard as dashboard_module
+    return dashboard_module
+
+
+@pytest.fixture(scope="module")
+def dashboard_hub_cls(dashboard_module):
+    """DashboardHub from the mocked dashboard module"""
+    return dashboard_module.DashboardHub
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() always returns FROZEN_NOW"""
+
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW
+
+
+@pytest.fixture
+def frozen_now(dashboard_module, monkeypatch):
+    """Pin the dashboard's clock to FROZEN_NOW"""
+    monkeypatch.setattr(dashboard_module, "datetime", FrozenDatetime)
+    return FROZEN_NOW
+
+
+@pytest.fixture
+def mock_psutil(dashboard_module, monkeypatch):
+    """Make the dashboard see psutil as available, backed by a MagicMock"""
+    psutil_mock = MagicMock()
+    monkeypatch.setattr(dashboard_module, "PSUTIL_AVAILABLE", True)
+    monkeypatch.setattr(dashboard_module, "psutil", psutil_mock)
+    return psutil_mock
+
+
+@pytest.fixture(scope="module")
+def shared_mock_app():
+    """Plain stand-in for the Pantainos application, built once per module"""
+    plugins = {"plugin1": object(), "plugin2": object()}
+    return SimpleNamespace(
+        event_bus=SimpleNamespace(
+            handlers={"test.event": [{"name": "handler1"}], "hello": [{"name": "handler2"}]},
+            emit=AsyncMock(),
+        ),
+        plugin_registry=SimpleNamespace(get_all=lambda: plugins),
+    )
 
 
 @pytest.fixture
-def mock_app():
-    """Mock Pantainos application"""
-    app = MagicMock()
-    app.event_bus = MagicMock()
-    app.event_bus.handlers = {"test.event": [{"name": "handler1"}], "hello": [{"name": "handler2"}]}
-    app.event_bus.emit = AsyncMock()
-    app.plugin_registry = MagicMock()
-    app.plugin_registry.get_all.return_value = {"plugin1": MagicMock(), "plugin2": MagicMock()}
-    return app
+def mock_app(shared_mock_app):
+    """Shared mock application with its recorded emits cleared"""
+    shared_mock_app.event_bus.emit.reset_mock()
+    return shared_mock_app
 
 
 @pytest.fixture
-def dashboard_hub(mock_app):
-    """Create a dashboard hub instance"""
-    return DashboardHub(mock_app)
+def dashboard_hub(dashboard_hub_cls, mock_app, frozen_now):
+    """Create a dashboard hub instance running on the frozen clock"""
+    return dashboard_hub_cls(mock_app)
 
 
 def test_dashboard_can_be_created(dashboard_hub):
@@ -58,10 +103,10 @@ def test_dashboard_tracks_events(dashboard_hub):
 def test_dashboard_limits_event_history(dashboard_hub):
     """Test that event history is limited to prevent memory issues"""
     # Add more than the max limit (100)
-    for i in range(150):
-        dashboard_hub.event_history.append(
-            {"type": f"test.event.{i}", "data": {}, "source": "test", "timestamp": "2024-01-01T10:00:00"}
-        )
+    dashboard_hub.event_history.extend(
+        {"type": f"test.event.{i}", "data": {}, "source": "test", "timestamp": "2024-01-01T10:00:00"}
+        for i in range(150)
+    )
 
     # Should be limited to 100 (deque maxlen)
     assert len(dashboard_hub.event_history) == 100
@@ -79,13 +124,10 @@ def test_dashboard_initialization_metrics(dashboard_hub, mock_app):
     assert len(dashboard_hub.memory_history) == 0
 
 
-@pytest.mark.asyncio
-async def test_update_metrics(dashboard_hub, mock_app):
+async def test_update_metrics(dashboard_hub, mock_app, frozen_now):
     """Test that metrics are updated correctly"""
-    from datetime import datetime
-
     # Add events to history
-    now = datetime.now().isoformat()
+    now = frozen_now.isoformat()
     dashboard_hub.event_history.append({"type": "test.event", "source": "test", "timestamp": now})
     dashboard_hub.event_history.append({"type": "test.event2", "source": "test", "timestamp": now})
 
@@ -93,6 +135,7 @@ async def test_update_metrics(dashboard_hub, mock_app):
     await dashboard_hub._update_metrics()
 
     assert dashboard_hub.total_events == 2
+    assert dashboard_hub.events_per_second == 2  # Both events fall within the last second
     assert dashboard_hub.active_handlers == 2  # Two event types in mock_app
     assert dashboard_hub.plugin_count == 2  # Two plugins in mock_app
 
@@ -108,19 +151,14 @@ def test_format_time(dashboard_hub):
     assert result == "just now"
 
 
-def test_get_uptime(dashboard_hub):
+def test_get_uptime(dashboard_hub, frozen_now):
     """Test uptime calculation"""
-    from datetime import datetime, timedelta
+    # Set start time to 1 hour 30 minutes 45 seconds ago
+    dashboard_hub.start_time = frozen_now - timedelta(hours=1, minutes=30, seconds=45)
 
-    # Set start time to 1 hour ago
-    dashboard_hub.start_time = datetime.now() - timedelta(hours=1, minutes=30, seconds=45)
+    assert dashboard_hub._get_uptime() == "01:30:45"
 
-    uptime = dashboard_hub._get_uptime()
-    # Should be approximately "01:30:45" (may vary by a few seconds)
-    assert uptime.startswith("01:30:")
 
-
-@pytest.mark.asyncio
 async def test_emit_test_event(dashboard_hub, mock_app):
     """Test emitting test events through dashboard"""
     # Since ui is None (mocked at import), just test the event emission
@@ -136,7 +174,6 @@ async def test_emit_test_event(dashboard_hub, mock_app):
     # ui.notify won't be called since ui is None in test environment
 
 
-@pytest.mark.asyncio
 async def test_clear_history(dashboard_hub):
     """Test clearing event history"""
     # Add some events
@@ -152,40 +189,30 @@ async def test_clear_history(dashboard_hub):
     assert len(dashboard_hub.event_history) == 0
 
 
-@pytest.mark.asyncio
-async def test_system_health_updates_without_psutil(dashboard_hub):
-    """Test system health metrics update when psutil returns default values"""
-    # In test environment, psutil is mocked and returns 0 by default
+async def test_system_health_updates_without_psutil(dashboard_hub, dashboard_module, monkeypatch):
+    """Test system health metrics fall back to zero when psutil is unavailable"""
+    monkeypatch.setattr(dashboard_module, "PSUTIL_AVAILABLE", False)
+
     await dashboard_hub._update_system_health()
 
-    # Should have 0 values from the mocked psutil
     assert dashboard_hub.cpu_usage == 0
     assert dashboard_hub.memory_usage == 0
-    # History should have the 0 values added
-    assert len(dashboard_hub.cpu_history) == 1
-    assert len(dashboard_hub.memory_history) == 1
-    assert dashboard_hub.cpu_history[0] == 0
-    assert dashboard_hub.memory_history[0] == 0
+    # Nothing is recorded without real readings
+    assert len(dashboard_hub.cpu_history) == 0
+    assert len(dashboard_hub.memory_history) == 0
 
 
-@pytest.mark.asyncio
-async def test_system_health_with_mock_psutil(dashboard_hub):
+async def test_system_health_with_mock_psutil(dashboard_hub, mock_psutil):
     """Test system health metrics update with mocked psutil"""
-    # Configure the module-level mock that was set during import
-    mock_psutil_module.cpu_percent.return_value = 25.5
-    mock_psutil_module.virtual_memory.return_value = MagicMock(percent=60.0)
-
-    # Patch PSUTIL_AVAILABLE to True and use the configured mock
-    with (
-        patch("pantainos.web.dashboard.PSUTIL_AVAILABLE", True),
-        patch("pantainos.web.dashboard.psutil", mock_psutil_module),
-    ):
-        await dashboard_hub._update_system_health()
-
-        # Check the values were set correctly
-        assert dashboard_hub.cpu_usage == 25.5
-        assert dashboard_hub.memory_usage == 60.0
-        assert len(dashboard_hub.cpu_history) == 1
-        assert len(dashboard_hub.memory_history) == 1
-        assert dashboard_hub.cpu_history[0] == 25.5
-        assert dashboard_hub.memory_history[0] == 60.0
+    mock_psutil.cpu_percent.return_value = 25.5
+    mock_psutil.virtual_memory.return_value = MagicMock(percent=60.0)
+
+    await dashboard_hub._update_system_health()
+
+    # Check the values were set correctly
+    assert dashboard_hub.cpu_usage == 25.5
+    assert dashboard_hub.memory_usage == 60.0
+    assert len(dashboard_hub.cpu_history) == 1
+    assert len(dashboard_hub.memory_history) == 1
+    assert dashboard_hub.cpu_history[0] == 25.5
+    assert dashboard_hub.memory_history[0] == 60.0
@@ -2,54 +2,66 @@
 Tests for documentation generator functionality
 """
 
-from unittest.mock import AsyncMock, MagicMock
+import copy
+import gc
+import inspect
+import weakref
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from pantainos.application import Pantainos
+from pantainos.core.event_bus import EventBus
+from pantainos.web.docs import DocumentationGenerator, _handler_signature, _signature_cache
 
-@pytest.fixture
-def mock_pantainos_app():
-    """Create a mock Pantainos application for documentation testing"""
-    app = MagicMock()
-    app.event_bus = MagicMock()
+
+def named_mock(name):
+    """MagicMock whose .name attribute is name (MagicMock(name=...) only sets its repr)"""
+    mock = MagicMock()
+    mock.name = name
+    return mock
+
+
+@pytest.fixture(scope="module")
+def proto_pantainos_app():
+    """Mock Pantainos application for documentation testing, built once per module"""
+    app = MagicMock(spec=Pantainos)
+    app.event_bus = MagicMock(spec=EventBus)
     app.event_bus.handlers = {
         "test.event": [{"handler": AsyncMock(__name__="test_handler"), "condition": None, "source": "core"}],
         "chat.message": [
             {
                 "handler": AsyncMock(__name__="chat_handler"),
-                "condition": MagicMock(name="command_filter"),
+                "condition": named_mock("command_filter"),
                 "source": "chat_plugin",
             }
         ],
     }
-    app.plugins = {"chat_plugin": MagicMock(name="ChatPlugin"), "test_plugin": MagicMock(name="TestPlugin")}
     return app
 
 
-@pytest.mark.asyncio
-async def test_documentation_generator_import():
-    """Test that DocumentationGenerator can be imported"""
-    from pantainos.web.docs import DocumentationGenerator
+@pytest.fixture
+def mock_pantainos_app(proto_pantainos_app):
+    """Shallow copy of the prototype app; its handler mocks are shared and only read"""
+    return copy.copy(proto_pantainos_app)
+
 
+def test_documentation_generator_import():
+    """Test that DocumentationGenerator can be imported"""
     assert DocumentationGenerator is not None
 
 
-@pytest.mark.asyncio
-async def test_documentation_generator_creation(mock_pantainos_app):
+def test_documentation_generator_creation(mock_pantainos_app):
     """Test DocumentationGenerator can be created with Pantainos app"""
-    from pantainos.web.docs import DocumentationGenerator
-
     generator = DocumentationGenerator(mock_pantainos_app)
 
     assert generator is not None
     assert generator.app is mock_pantainos_app
 
 
-@pytest.mark.asyncio
-async def test_extract_handlers_docs_basic(mock_pantainos_app):
+def test_extract_handlers_docs_basic(mock_pantainos_app):
     """Test basic handler documentation extraction"""
-    from pantainos.web.docs import DocumentationGenerator
-
     generator = DocumentationGenerator(mock_pantainos_app)
     docs = generator.extract_handlers_docs()
 
@@ -58,11 +70,8 @@ async def test_extract_handlers_docs_basic(mock_pantainos_app):
     assert len(docs["handlers"]) == 2  # Two handlers in mock data
 
 
-@pytest.mark.asyncio
-async def test_extract_handlers_docs_structure(mock_pantainos_app):
+def test_extract_handlers_docs_structure(mock_pantainos_app):
     """Test that extracted docs have correct structure"""
-    from pantainos.web.docs import DocumentationGenerator
-
     generator = DocumentationGenerator(mock_pantainos_app)
     docs = generator.extract_handlers_docs()
 
@@ -78,11 +87,8 @@ async def test_extract_handlers_docs_structure(mock_pantainos_app):
     assert "source" in handler_doc
 
 
-@pytest.mark.asyncio
-async def test_extract_handlers_with_conditions(mock_pantainos_app):
+def test_extract_handlers_with_conditions(mock_pantainos_app):
     """Test extraction of handlers with conditions"""
-    from pantainos.web.docs import DocumentationGenerator
-
     generator = DocumentationGenerator(mock_pantainos_app)
     docs = generator.extract_handlers_docs()
 
@@ -90,14 +96,11 @@ async def test_extract_handlers_with_conditions(mock_pantainos_app):
     handler_with_condition = next(h for h in docs["handlers"] if h["event_type"] == "chat.message")
 
     assert handler_with_condition["conditions"] is not None
-    assert "name" in handler_with_condition["conditions"]
+    assert handler_with_condition["conditions"]["name"] == "command_filter"
 
 
-@pytest.mark.asyncio
-async def test_extract_handlers_without_conditions(mock_pantainos_app):
+def test_extract_handlers_without_conditions(mock_pantainos_app):
     """Test extraction of handlers without conditions"""
-    from pantainos.web.docs import DocumentationGenerator
-
     generator = DocumentationGenerator(mock_pantainos_app)
     docs = generator.extract_handlers_docs()
 
@@ -107,36 +110,29 @@ async def test_extract_handlers_without_conditions(mock_pantainos_app):
     assert handler_no_condition["conditions"] is None
 
 
-@pytest.mark.asyncio
-async def test_extract_handlers_empty_bus():
+def test_extract_handlers_empty_bus(mock_app):
     """Test extraction when event bus has no handlers"""
-    app = MagicMock()
-    app.event_bus.handlers = {}
-    app.plugins = {}
-
-    from pantainos.web.docs import DocumentationGenerator
-
-    generator = DocumentationGenerator(app)
+    generator = DocumentationGenerator(mock_app)
     docs = generator.extract_handlers_docs()
 
     assert docs["handlers"] == []
 
 
-@pytest.mark.asyncio
-async def test_extract_dependencies_from_handler():
+def test_extract_dependencies_from_handler(mock_pantainos_app):
     """Test extraction of handler dependencies through signature inspection"""
-    from pantainos.web.docs import DocumentationGenerator
 
     # Mock handler with dependencies in signature
     def sample_handler(event, db_repo, chat_plugin):
         """Sample handler with dependencies"""
         pass
 
-    app = MagicMock()
-    app.event_bus.handlers = {"sample.event": [{"handler": sample_handler, "condition": None, "source": "test"}]}
-    app.plugins = {}
+    # Copy the prototype's bus too, so swapping its handlers leaves the prototype intact
+    mock_pantainos_app.event_bus = copy.copy(mock_pantainos_app.event_bus)
+    mock_pantainos_app.event_bus.handlers = {
+        "sample.event": [{"handler": sample_handler, "condition": None, "source": "test"}]
+    }
 
-    generator = DocumentationGenerator(app)
+    generator = DocumentationGenerator(mock_pantainos_app)
     docs = generator.extract_handlers_docs()
 
     handler_doc = docs["handlers"][0]
@@ -144,3 +140,83 @@ async def test_extract_dependencies_from_handler():
     # Should extract parameter names beyond 'event'
     deps = handler_doc["dependencies"]
     assert "db_repo" in deps or "chat_plugin" in deps
+
+    # Rendering again reuses the cached signature instead of inspecting the handler again
+    with patch("pantainos.web.docs.inspect.signature") as signature:
+        assert generator.extract_handlers_docs() == docs
+    signature.assert_not_called()
+
+
+def test_handler_signature_is_cached():
+    """Test that handler signatures are introspected once and reused"""
+
+    async def handler(event, service):
+        pass
+
+    assert _handler_signature(handler) is _handler_signature(handler)
+    assert str(_handler_signature(handler)) == "(event, service)"
+
+
+def test_handler_signature_of_unhashable_callable():
+    """Test that callables the cache cannot hold still get their signature"""
+
+    class UnhashableHandler:
+        __hash__ = None
+
+        def __call__(self, event, service):
+            pass
+
+    class SlottedHandler:
+        __slots__ = ()
+
+        def __call__(self, event, service):
+            pass
+
+    assert str(_handler_signature(UnhashableHandler())) == "(event, service)"
+    assert str(_handler_signature(SlottedHandler())) == "(event, service)"
+
+
+def test_handler_signature_cache_does_not_keep_handlers_alive():
+    """Test that a cached handler is freed, and its entry dropped, once nothing else references it"""
+
+    async def handler(event, service):
+        pass
+
+    _handler_signature(handler)
+    assert handler in _signature_cache
+    handler_ref = weakref.ref(handler)
+
+    del handler
+    gc.collect()
+
+    assert handler_ref() is None
+
+
+def _make_handler(index):
+    """Distinct handler function per index, so each has its own signature cache entry"""
+
+    async def handler(event, service):
+        pass
+
+    handler.__name__ = f"handler_{index}"
+    return handler
+
+
+@pytest.mark.parametrize("count", [0, 2, 100, 1000])
+def test_extract_handlers_docs_scales_with_handler_count(count):
+    """Test that every handler is documented and introspected once, however many there are"""
+    handlers = {
+        f"event.{i}": [{"handler": _make_handler(i), "condition": None, "source": "test"}] for i in range(count)
+    }
+    app = SimpleNamespace(event_bus=SimpleNamespace(handlers=handlers))
+    generator = DocumentationGenerator(app)
+
+    with patch("pantainos.web.docs.inspect.signature", wraps=inspect.signature) as signature:
+        docs = generator.extract_handlers_docs()
+
+        assert [doc["handler_name"] for doc in docs["handlers"]] == [f"handler_{i}" for i in range(count)]
+        assert signature.call_count == count
+
+        # A second render inspects nothing new
+        generator.extract_handlers_docs()
+        assert signature.call_count == count
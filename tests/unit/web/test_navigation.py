@@ -2,28 +2,15 @@
 Test suite for the Navigation System component.
 """
 
-from unittest.mock import MagicMock, patch
-
 import pytest
 
-# Mock NiceGUI before import
-mock_nicegui = MagicMock()
-mock_nicegui.__bool__ = lambda self: True  # Make it truthy
-mock_nicegui.__nonzero__ = lambda self: True  # Python 2 compatibility
+from tests.fixtures.modules import mock_web_modules
 
-with patch.dict("sys.modules", {"nicegui": mock_nicegui, "nicegui.events": MagicMock()}):
+# Mock NiceGUI before import
+with mock_web_modules():
     from pantainos.web.components.navigation import NavigationBuilder, NavigationSystem
 
 
-@pytest.fixture
-def mock_app():
-    """Mock Pantainos application."""
-    app = MagicMock()
-    app.event_bus = MagicMock()
-    app.plugins = {}
-    return app
-
-
 @pytest.fixture
 def navigation_system(mock_app):
     """Create a navigation system instance."""
@@ -118,15 +105,21 @@ def test_mobile_menu_shows_limited_items(navigation_system):
     assert main_items[0]["id"] == "dashboard"
 
 
-def test_navigation_system_initialization_check():
+def test_navigation_system_initialization_check(mock_app):
     """Test that NavigationSystem checks for NiceGUI availability."""
     # Since we mocked nicegui at import time, NICEGUI_AVAILABLE is True
     # So this test verifies the NavigationSystem can be created with our mock
-    mock_app = MagicMock()
-    mock_app.event_bus = MagicMock()
-    mock_app.plugins = {}
 
     # Should create successfully with our mocked nicegui
     nav = NavigationSystem(mock_app)
     assert nav is not None
     assert nav.app == mock_app
+
+
+def test_navigation_items_are_per_instance(mock_app):
+    """Test that each NavigationSystem gets its own copy of the default items."""
+    first = NavigationSystem(mock_app)
+    second = NavigationSystem(mock_app)
+
+    assert first.nav_items == second.nav_items
+    assert first.nav_items is not second.nav_items
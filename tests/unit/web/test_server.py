@@ -2,371 +2,339 @@
 Tests for web server functionality
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from typing import ClassVar
 
 import pytest
 
+from pantainos.web.server import WEB_AVAILABLE, WebServer
 
-@pytest.fixture
-def mock_pantainos_app():
-    """Create a mock Pantainos application"""
-    app = MagicMock()
-    app.event_bus = MagicMock()
-    app.event_bus.running = True
-    app.event_bus.handlers = {"test.event": []}
-    app.schedule_manager = MagicMock()
-    app.schedule_manager.running = True
-    app.plugins = {}
-    app.emit = AsyncMock()
-    return app
-
-
-@pytest.mark.asyncio
-async def test_web_server_import():
-    """Test that WebServer can be imported when dependencies are available"""
-    try:
-        from pantainos.web.server import WebServer
-
-        assert WebServer is not None
-    except ImportError as e:
-        # Skip test if web dependencies not available
-        pytest.skip(f"Web dependencies not available: {e}")
-
-
-@pytest.mark.asyncio
-async def test_web_server_creation_without_dependencies():
-    """Test that WebServer raises error when dependencies missing"""
-    with patch("pantainos.web.server.WEB_AVAILABLE", False):
-        from pantainos.web.server import WebServer
 
-        mock_app = MagicMock()
+async def _handler():
+    """Route handler stand-in for plugin pages and APIs"""
 
-        with pytest.raises(RuntimeError, match="Web dependencies not available"):
-            WebServer(mock_app)
 
+class StubFastAPI:
+    """Records routes registered through FastAPI's decorator API, included routers and middleware"""
 
-@pytest.mark.asyncio
-async def test_web_server_creation_with_dependencies(mock_pantainos_app):
-    """Test WebServer creation when dependencies are available"""
-    with (
-        patch("pantainos.web.server.WEB_AVAILABLE", True),
-        patch("pantainos.web.server.FastAPI"),
-    ):
-        from pantainos.web.server import WebServer
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.get_paths = []
+        self.post_paths = []
+        self.routers = []
+        self.middleware = []
 
-        web_server = WebServer(mock_pantainos_app)
+    def add_middleware(self, middleware_class, **kwargs):
+        self.middleware.append((middleware_class, kwargs))
 
-        assert web_server.app is mock_pantainos_app
-        assert hasattr(web_server, "fastapi")
-        assert hasattr(web_server, "plugin_pages")
+    def get(self, path, **kwargs):
+        self.get_paths.append(path)
+        return lambda handler: handler
 
+    def post(self, path, **kwargs):
+        self.post_paths.append(path)
+        return lambda handler: handler
 
-@pytest.mark.asyncio
-async def test_web_server_health_endpoint(mock_pantainos_app):
-    """Test that health endpoint returns correct status"""
-    with (
-        patch("pantainos.web.server.WEB_AVAILABLE", True),
-        patch("pantainos.web.server.FastAPI") as mock_fastapi,
-    ):
-        from pantainos.web.server import WebServer
+    def include_router(self, router):
+        self.routers.append(router)
+        for route in router.routes:
+            if "GET" in route.methods:
+                self.get_paths.append(route.path)
+            if "POST" in route.methods:
+                self.post_paths.append(route.path)
 
-        # Mock FastAPI instance
-        mock_app = MagicMock()
-        mock_fastapi.return_value = mock_app
 
-        WebServer(mock_pantainos_app)
+class StubUvicornConfig:
+    """Captures the arguments WebServer passes to uvicorn.Config"""
 
-        # Verify FastAPI instance was created with correct parameters
-        mock_fastapi.assert_called_once()
-        call_kwargs = mock_fastapi.call_args[1]
-        assert call_kwargs["title"] == "Pantainos API"
-        assert "event-driven application" in call_kwargs["description"]
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
 
 
-@pytest.mark.asyncio
-async def test_plugin_page_mounting():
-    """Test that plugin pages can be mounted"""
-    with (
-        patch("pantainos.web.server.WEB_AVAILABLE", True),
-        patch("pantainos.web.server.FastAPI"),
-    ):
-        from pantainos.web.server import WebServer
+class StubUvicornServer:
+    """Records the config it was built with and whether serve() ran"""
 
-        mock_app = MagicMock()
-        mock_app.event_bus.running = True
-        mock_app.schedule_manager.running = True
-        mock_app.plugins = {}
-        mock_app.event_bus.handlers = {}
+    instances: ClassVar[list["StubUvicornServer"]] = []
 
-        web_server = WebServer(mock_app)
+    def __init__(self, config):
+        self.config = config
+        self.served = False
+        StubUvicornServer.instances.append(self)
 
-        # Create mock plugin with pages
-        mock_plugin = MagicMock()
-        mock_plugin.name = "test_plugin"
-        mock_plugin.pages = {"": {"handler": AsyncMock()}, "config": {"handler": AsyncMock()}}
+    async def serve(self):
+        self.served = True
 
-        # Test mounting
-        web_server.mount_plugin_pages(mock_plugin)
 
-        assert "test_plugin" in web_server.plugin_pages
-        assert web_server.plugin_pages["test_plugin"] == mock_plugin.pages
+@pytest.fixture(scope="module")
+def pantainos_app():
+    """Plain stand-in for the Pantainos application, built once per module; WebServer only reads it"""
+    return SimpleNamespace(
+        event_bus=SimpleNamespace(running=True, handlers={"test.event": []}),
+        schedule_manager=SimpleNamespace(running=True),
+        plugins={},
+    )
 
 
-@pytest.mark.asyncio
-async def test_plugin_without_pages():
-    """Test handling plugins that don't have web pages"""
-    with (
-        patch("pantainos.web.server.WEB_AVAILABLE", True),
-        patch("pantainos.web.server.FastAPI"),
-    ):
-        from pantainos.web.server import WebServer
-
-        mock_app = MagicMock()
-        mock_app.event_bus.running = True
-        mock_app.schedule_manager.running = True
-        mock_app.plugins = {}
-        mock_app.event_bus.handlers = {}
-
-        web_server = WebServer(mock_app)
+@pytest.fixture
+def web_server_cls(monkeypatch):
+    """WebServer with FastAPI replaced by StubFastAPI"""
+    monkeypatch.setattr("pantainos.web.server.WEB_AVAILABLE", True)
+    monkeypatch.setattr("fastapi.FastAPI", StubFastAPI)
+    return WebServer
 
-        # Create mock plugin without pages
-        mock_plugin = MagicMock()
-        mock_plugin.name = "simple_plugin"
-        # No pages attribute
 
-        # Should not raise error
-        web_server.mount_plugin_pages(mock_plugin)
+@pytest.fixture
+def stub_uvicorn(monkeypatch):
+    """Replace uvicorn's Config and Server with recording stubs"""
+    StubUvicornServer.instances = []
+    monkeypatch.setattr("uvicorn.Config", StubUvicornConfig)
+    monkeypatch.setattr("uvicorn.Server", StubUvicornServer)
+    return StubUvicornServer.instances
 
-        assert "simple_plugin" not in web_server.plugin_pages
 
+def test_web_server_import():
+    """Test that WebServer can be imported and reports its dependencies as available"""
+    assert WebServer is not None
+    assert WEB_AVAILABLE
 
-@pytest.mark.asyncio
-async def test_get_fastapi_app():
-    """Test getting the FastAPI application instance"""
-    with (
-        patch("pantainos.web.server.WEB_AVAILABLE", True),
-        patch("pantainos.web.server.FastAPI") as mock_fastapi,
-    ):
-        from pantainos.web.server import WebServer
 
-        mock_app = MagicMock()
-        mock_app.event_bus.running = True
-        mock_app.schedule_manager.running = True
-        mock_app.plugins = {}
-        mock_app.event_bus.handlers = {}
+def test_web_server_creation_without_dependencies(monkeypatch, pantainos_app):
+    """Test that WebServer raises error when dependencies missing"""
+    monkeypatch.setattr("pantainos.web.server.WEB_AVAILABLE", False)
 
-        mock_fastapi_instance = MagicMock()
-        mock_fastapi.return_value = mock_fastapi_instance
+    with pytest.raises(RuntimeError, match="Web dependencies not available"):
+        WebServer(pantainos_app)
 
-        web_server = WebServer(mock_app)
 
-        assert web_server.get_fastapi_app() is mock_fastapi_instance
+def test_web_server_creation_with_dependencies(web_server_cls, pantainos_app):
+    """Test WebServer creation when dependencies are available"""
+    web_server = web_server_cls(pantainos_app)
 
+    assert web_server.app is pantainos_app
+    assert hasattr(web_server, "fastapi")
+    assert hasattr(web_server, "plugin_pages")
 
-@pytest.mark.asyncio
-async def test_web_server_start():
-    """Test starting the web server"""
-    with (
-        patch("pantainos.web.server.WEB_AVAILABLE", True),
-        patch("pantainos.web.server.FastAPI") as mock_fastapi,
-        patch("uvicorn.Config") as mock_config,
-        patch("uvicorn.Server") as mock_server_class,
-    ):
-        from pantainos.web.server import WebServer
+    # Responses are gzip-compressed by default
+    from fastapi.middleware.gzip import GZipMiddleware
 
-        mock_app = MagicMock()
-        mock_app.event_bus.running = True
-        mock_app.schedule_manager.running = True
-        mock_app.plugins = {}
-        mock_app.event_bus.handlers = {}
+    assert web_server.fastapi.middleware == [(GZipMiddleware, {"minimum_size": 1024, "compresslevel": 6})]
 
-        mock_fastapi_instance = MagicMock()
-        mock_fastapi.return_value = mock_fastapi_instance
 
-        # Mock uvicorn server instance
-        mock_server_instance = AsyncMock()
-        mock_server_class.return_value = mock_server_instance
+def test_web_server_creation_without_compression(web_server_cls, pantainos_app):
+    """Test that response compression can be turned off"""
+    web_server = web_server_cls(pantainos_app, compress=False)
 
-        # Mock config instance
-        mock_config_instance = MagicMock()
-        mock_config.return_value = mock_config_instance
+    assert web_server.fastapi.middleware == []
 
-        web_server = WebServer(mock_app)
 
-        # Test start with default port
-        await web_server.start()
+def test_web_server_health_endpoint(web_server_cls, pantainos_app):
+    """Test that health endpoint returns correct status"""
+    web_server = web_server_cls(pantainos_app)
 
-        # Should have created config with correct parameters
-        mock_config.assert_called_once_with(app=mock_fastapi_instance, port=8080, host="127.0.0.1", log_level="info")
+    # Verify FastAPI instance was created with correct parameters
+    assert web_server.fastapi.kwargs["title"] == "Pantainos API"
+    assert "event-driven application" in web_server.fastapi.kwargs["description"]
 
-        # Should have created server with config
-        mock_server_class.assert_called_once_with(mock_config_instance)
 
-        # Should have called server.serve()
-        mock_server_instance.serve.assert_called_once()
+def test_plugin_page_mounting(web_server_cls, pantainos_app):
+    """Test that plugin pages can be mounted"""
+    web_server = web_server_cls(pantainos_app)
 
+    plugin = SimpleNamespace(name="test_plugin", pages={"": {"handler": _handler}, "config": {"handler": _handler}})
 
-@pytest.mark.asyncio
-async def test_web_server_start_custom_port():
-    """Test starting the web server with custom port"""
-    with (
-        patch("pantainos.web.server.WEB_AVAILABLE", True),
-        patch("pantainos.web.server.FastAPI") as mock_fastapi,
-        patch("uvicorn.Config") as mock_config,
-        patch("uvicorn.Server") as mock_server_class,
-    ):
-        from pantainos.web.server import WebServer
+    web_server.mount_plugin_pages(plugin)
 
-        mock_app = MagicMock()
-        mock_app.event_bus.running = True
-        mock_app.schedule_manager.running = True
-        mock_app.plugins = {}
-        mock_app.event_bus.handlers = {}
+    assert "test_plugin" in web_server.plugin_pages
+    assert web_server.plugin_pages["test_plugin"] == plugin.pages
 
-        mock_fastapi_instance = MagicMock()
-        mock_fastapi.return_value = mock_fastapi_instance
 
-        # Mock uvicorn server instance
-        mock_server_instance = AsyncMock()
-        mock_server_class.return_value = mock_server_instance
+def test_plugin_without_pages(web_server_cls, pantainos_app):
+    """Test handling plugins that don't have web pages"""
+    web_server = web_server_cls(pantainos_app)
 
-        # Mock config instance
-        mock_config_instance = MagicMock()
-        mock_config.return_value = mock_config_instance
+    # Plugin without a pages attribute
+    plugin = SimpleNamespace(name="simple_plugin")
 
-        web_server = WebServer(mock_app)
+    # Should not raise error
+    web_server.mount_plugin_pages(plugin)
 
-        # Test start with custom port
-        await web_server.start(port=9000, host="127.0.0.1")
+    assert "simple_plugin" not in web_server.plugin_pages
 
-        # Should have created config with custom parameters
-        mock_config.assert_called_once_with(app=mock_fastapi_instance, port=9000, host="127.0.0.1", log_level="info")
 
-        # Should have created server with config
-        mock_server_class.assert_called_once_with(mock_config_instance)
+def test_get_fastapi_app(web_server_cls, pantainos_app):
+    """Test getting the FastAPI application instance"""
+    web_server = web_server_cls(pantainos_app)
+
+    assert isinstance(web_server.get_fastapi_app(), StubFastAPI)
+    assert web_server.get_fastapi_app() is web_server.fastapi
+
+
+@pytest.mark.parametrize(
+    ("start_kwargs", "port", "access_log"),
+    [
+        ({}, 8080, False),
+        ({"port": 9000, "host": "127.0.0.1"}, 9000, False),
+        ({"access_log": True}, 8080, True),
+    ],
+)
+async def test_web_server_start(web_server_cls, pantainos_app, stub_uvicorn, start_kwargs, port, access_log):
+    """Test starting the web server with default and custom ports and access logging"""
+    web_server = web_server_cls(pantainos_app)
+
+    await web_server.start(**start_kwargs)
+    await web_server._server_task
+
+    # Should have created a single server with the expected config
+    assert len(stub_uvicorn) == 1
+    server = stub_uvicorn[0]
+    assert server.config.kwargs == {
+        "app": web_server.fastapi,
+        "port": port,
+        "host": "127.0.0.1",
+        "log_level": "info",
+        "access_log": access_log,
+        "proxy_headers": False,
+        "server_header": False,
+        "date_header": False,
+    }
+
+    # Should have called server.serve()
+    assert server.served
+
+
+def test_plugin_api_mounting(web_server_cls, pantainos_app):
+    """Test that plugin API endpoints can be mounted to FastAPI"""
+    web_server = web_server_cls(pantainos_app)
 
-        # Should have called server.serve()
-        mock_server_instance.serve.assert_called_once()
+    plugin = SimpleNamespace(
+        name="test_plugin",
+        apis={
+            "/events": {"handler": _handler, "type": "api"},
+            "/metrics": {"handler": _handler, "type": "api"},
+            "/metrics/reset": {"handler": _handler, "type": "api"},
+        },
+    )
 
+    web_server.mount_plugin_apis(plugin)
 
-@pytest.mark.asyncio
-async def test_plugin_api_mounting():
-    """Test that plugin API endpoints can be mounted to FastAPI"""
-    with (
-        patch("pantainos.web.server.WEB_AVAILABLE", True),
-        patch("pantainos.web.server.FastAPI") as mock_fastapi,
-    ):
-        from pantainos.web.server import WebServer
-
-        mock_app = MagicMock()
-        mock_app.event_bus.running = True
-        mock_app.schedule_manager.running = True
-        mock_app.plugins = {}
-        mock_app.event_bus.handlers = {}
-
-        # Mock FastAPI instance
-        mock_fastapi_instance = MagicMock()
-        mock_fastapi.return_value = mock_fastapi_instance
-
-        web_server = WebServer(mock_app)
-
-        # Create mock plugin with API endpoints
-        mock_plugin = MagicMock()
-        mock_plugin.name = "test_plugin"
-        mock_plugin.apis = {
-            "/events": {"handler": AsyncMock(), "type": "api"},
-            "/metrics": {"handler": AsyncMock(), "type": "api"},
-            "/metrics/reset": {"handler": AsyncMock(), "type": "api"},
-        }
-
-        # Test mounting APIs
-        web_server.mount_plugin_apis(mock_plugin)
-
-        # Verify that endpoints were registered with FastAPI
-        assert mock_fastapi_instance.post.call_count == 2  # /events and /metrics/reset
-        assert mock_fastapi_instance.get.call_count == 3  # /metrics, /ui/docs, and /ui/events
-
-        # Check specific endpoint registrations with correct namespacing
-        post_calls = [call[0][0] for call in mock_fastapi_instance.post.call_args_list]
-        get_calls = [call[0][0] for call in mock_fastapi_instance.get.call_args_list]
-
-        assert "/api/plugins/test_plugin/events" in post_calls
-        assert "/api/plugins/test_plugin/metrics/reset" in post_calls
-        assert "/api/plugins/test_plugin/metrics" in get_calls
-
-
-@pytest.mark.asyncio
-async def test_plugin_without_apis():
-    """Test handling plugins that don't have API endpoints"""
-    with (
-        patch("pantainos.web.server.WEB_AVAILABLE", True),
-        patch("pantainos.web.server.FastAPI") as mock_fastapi,
-    ):
-        from pantainos.web.server import WebServer
+    # Verify that endpoints were added to FastAPI through a single router
+    fastapi = web_server.fastapi
+    assert len(fastapi.routers) == 1
+    assert len(fastapi.post_paths) == 2  # /events and /metrics/reset
+    assert len(fastapi.get_paths) == 3  # /metrics, /ui/docs, and /ui/events
 
-        mock_app = MagicMock()
-        mock_app.event_bus.running = True
-        mock_app.schedule_manager.running = True
-        mock_app.plugins = {}
-        mock_app.event_bus.handlers = {}
+    # Check specific endpoint registrations with correct namespacing
+    assert "/api/plugins/test_plugin/events" in fastapi.post_paths
+    assert "/api/plugins/test_plugin/metrics/reset" in fastapi.post_paths
+    assert "/api/plugins/test_plugin/metrics" in fastapi.get_paths
 
-        mock_fastapi_instance = MagicMock()
-        mock_fastapi.return_value = mock_fastapi_instance
 
-        web_server = WebServer(mock_app)
+def test_plugin_without_apis(web_server_cls, pantainos_app):
+    """Test handling plugins that don't have API endpoints"""
+    web_server = web_server_cls(pantainos_app)
 
-        # Create mock plugin without APIs
-        mock_plugin = MagicMock()
-        mock_plugin.name = "simple_plugin"
-        # No apis attribute
+    # Plugin without an apis attribute
+    plugin = SimpleNamespace(name="simple_plugin")
 
-        # Should not raise error
-        web_server.mount_plugin_apis(mock_plugin)
+    # Should not raise error
+    web_server.mount_plugin_apis(plugin)
 
-        # Should not have registered any endpoints (except docs routes)
-        assert mock_fastapi_instance.post.call_count == 0
-        assert mock_fastapi_instance.get.call_count == 2  # Documentation and Event Explorer routes
+    # Should not have registered any endpoints (except docs routes)
+    assert web_server.fastapi.routers == []
+    assert web_server.fastapi.post_paths == []
+    assert len(web_server.fastapi.get_paths) == 2  # Documentation and Event Explorer routes
 
 
-@pytest.mark.asyncio
-async def test_plugin_page_ui_route_mounting():
+def test_plugin_page_ui_route_mounting(web_server_cls, pantainos_app):
     """Test that plugin pages are mounted as UI routes with proper namespacing"""
-    with (
-        patch("pantainos.web.server.WEB_AVAILABLE", True),
-        patch("pantainos.web.server.FastAPI") as mock_fastapi,
-    ):
-        from pantainos.web.server import WebServer
-
-        mock_app = MagicMock()
-        mock_app.event_bus.running = True
-        mock_app.schedule_manager.running = True
-        mock_app.plugins = {}
-        mock_app.event_bus.handlers = {}
-
-        # Mock FastAPI instance
-        mock_fastapi_instance = MagicMock()
-        mock_fastapi.return_value = mock_fastapi_instance
-
-        web_server = WebServer(mock_app)
-
-        # Create mock plugin with pages
-        mock_plugin = MagicMock()
-        mock_plugin.name = "test_plugin"
-        mock_plugin.pages = {
-            "": {"handler": AsyncMock(), "type": "page"},  # Main page
-            "config": {"handler": AsyncMock(), "type": "page"},  # Config subpage
-            "dashboard": {"handler": AsyncMock(), "type": "page"},  # Dashboard subpage
-        }
-
-        # Test mounting pages as UI routes
-        web_server.mount_plugin_pages(mock_plugin)
-
-        # Verify that pages were registered as GET routes with proper namespacing
-        assert mock_fastapi_instance.get.call_count == 5  # Main, config, dashboard, /ui/docs, and /ui/events
-
-        # Check specific UI route registrations
-        get_calls = [call[0][0] for call in mock_fastapi_instance.get.call_args_list]
-
-        assert "/ui/plugins/test_plugin/" in get_calls  # Main page
-        assert "/ui/plugins/test_plugin/config" in get_calls  # Config subpage
-        assert "/ui/plugins/test_plugin/dashboard" in get_calls  # Dashboard subpage
+    web_server = web_server_cls(pantainos_app)
+
+    plugin = SimpleNamespace(
+        name="test_plugin",
+        pages={
+            "": {"handler": _handler, "type": "page"},  # Main page
+            "config": {"handler": _handler, "type": "page"},  # Config subpage
+            "dashboard": {"handler": _handler, "type": "page"},  # Dashboard subpage
+        },
+    )
+
+    web_server.mount_plugin_pages(plugin)
+
+    # Verify that pages were registered as GET routes with proper namespacing, through a single router
+    assert len(web_server.fastapi.routers) == 1
+    get_paths = web_server.fastapi.get_paths
+    assert len(get_paths) == 5  # Main, config, dashboard, /ui/docs, and /ui/events
+
+    assert "/ui/plugins/test_plugin/" in get_paths  # Main page
+    assert "/ui/plugins/test_plugin/config" in get_paths  # Config subpage
+    assert "/ui/plugins/test_plugin/dashboard" in get_paths  # Dashboard subpage
+
+
+def test_documentation_route_caches_rendered_page(app, monkeypatch):
+    """Test that the docs page is rendered once and re-rendered only after handlers change"""
+    from fastapi.responses import HTMLResponse
+
+    # Real FastAPI here: rendering imports NiceGUI, whose app class must not subclass StubFastAPI
+    monkeypatch.setattr("pantainos.web.ui.NICEGUI_AVAILABLE", True)
+    web_server = WebServer(app)
+    get_documentation = next(route.endpoint for route in web_server.fastapi.routes if route.path == "/ui/docs")
+
+    response = get_documentation()
+    assert isinstance(response, HTMLResponse)
+    assert b"No event handlers registered" in response.body
+    assert get_documentation() is response
+
+    @app.on("docs.event")
+    async def docs_handler(event):
+        pass
+
+    updated = get_documentation()
+    assert updated is not response
+    assert b"docs_handler" in updated.body
+    assert get_documentation() is updated
+
+
+def test_documentation_route_rerenders_after_plugin_or_status_change(app, monkeypatch):
+    """Test that the cached docs page is dropped when plugin routes or app status change"""
+    monkeypatch.setattr("pantainos.web.ui.NICEGUI_AVAILABLE", True)
+    web_server = WebServer(app)
+    get_documentation = next(route.endpoint for route in web_server.fastapi.routes if route.path == "/ui/docs")
+
+    plugin = SimpleNamespace(name="docs_plugin", apis={}, pages={})
+    monkeypatch.setitem(app.plugin_registry.plugins, "docs_plugin", plugin)
+    response = get_documentation()
+
+    # A route added to an already-registered plugin shows up
+    monkeypatch.setitem(plugin.apis, "/stats", {"handler": _handler})
+    updated = get_documentation()
+    assert updated is not response
+    assert b"/api/plugins/docs_plugin/stats" in updated.body
+
+    # Mounting plugin routes through the server drops the cached page
+    web_server.mount_plugin_apis(plugin)
+    assert get_documentation() is not updated
+
+    # Gaining a web server changes the reported status
+    cached = get_documentation()
+    monkeypatch.setattr(app, "web_server", web_server, raising=False)
+    assert get_documentation() is not cached
+
+
+def test_mount_plugin_adds_pages_and_apis_through_one_router(web_server_cls, pantainos_app):
+    """Test that mounting a whole plugin registers its pages and APIs in a single pass"""
+    web_server = web_server_cls(pantainos_app)
+
+    plugin = SimpleNamespace(
+        name="test_plugin",
+        pages={"": {"handler": _handler}},
+        apis={"/events": {"handler": _handler}, "/metrics": {"handler": _handler}},
+    )
+
+    web_server.mount_plugin(plugin)
+
+    fastapi = web_server.fastapi
+    assert len(fastapi.routers) == 1
+    assert web_server.plugin_pages["test_plugin"] == plugin.pages
+    assert fastapi.post_paths == ["/api/plugins/test_plugin/events"]
+    assert "/ui/plugins/test_plugin/" in fastapi.get_paths
+    assert "/api/plugins/test_plugin/metrics" in fastapi.get_paths
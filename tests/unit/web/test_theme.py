@@ -2,11 +2,7 @@
 Test suite for the unified theme and design system.
 """
 
-from unittest.mock import MagicMock, patch
-
-# Mock NiceGUI before import
-with patch.dict("sys.modules", {"nicegui": MagicMock(), "nicegui.events": MagicMock()}):
-    from pantainos.web.components.theme import ThemeConfig, ThemeManager
+from pantainos.web.components.theme import ThemeConfig, ThemeManager
 
 
 def test_theme_manager_switch_theme():
@@ -90,3 +86,62 @@ def test_theme_manager_toggle_theme():
     # Toggle back to dark
     manager.toggle_theme()
     assert manager.current_theme == "dark"
+
+
+def test_theme_config_generate_css_is_cached():
+    """Test that CSS is generated once per config and reused."""
+    config = ThemeConfig(primary="#FF0000")
+
+    css = config.generate_css()
+    assert "--primary: #FF0000;" in css
+    assert config.generate_css() is css
+
+    # Equal configs still compare equal once one has cached its CSS
+    assert config == ThemeConfig(primary="#FF0000")
+
+
+def test_theme_config_generate_css_follows_changes():
+    """Test that changing a config value regenerates its CSS."""
+    config = ThemeConfig()
+    config.generate_css()
+
+    config.primary = "#00FF00"
+
+    assert "--primary: #00FF00;" in config.generate_css()
+
+
+def test_theme_manager_apply_theme_skips_unchanged_theme():
+    """Test that re-applying the current theme pushes nothing new."""
+    manager = ThemeManager()
+
+    manager.apply_theme()
+    applied = manager._applied_css
+    manager.apply_theme()
+    assert manager._applied_css is applied
+
+    manager.switch_theme("light")
+    assert manager._applied_css == manager.themes["light"].generate_css()
+
+
+def test_theme_manager_follows_replaced_and_edited_themes():
+    """Test that the current configuration tracks themes replaced or edited in place."""
+    manager = ThemeManager()
+
+    replacement = ThemeConfig(primary="#123456")
+    manager.register_theme("dark", replacement)
+    assert manager.get_current_config() is replacement
+
+    direct = ThemeConfig(primary="#654321")
+    manager.themes["dark"] = direct
+    assert manager.get_current_config() is direct
+
+    manager.apply_theme()
+    direct.primary = "#ABCDEF"
+    manager.apply_theme()
+    assert "--primary: #ABCDEF;" in manager._applied_css
+
+
+def test_theme_objects_have_no_instance_dict():
+    """Test that theme configs and managers store their attributes in slots."""
+    assert not hasattr(ThemeConfig(), "__dict__")
+    assert not hasattr(ThemeManager(), "__dict__")
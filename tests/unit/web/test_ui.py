@@ -2,145 +2,102 @@
 Tests for NiceGUI documentation UI components
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
 from pantainos.application import Pantainos
+from pantainos.web.ui import DocumentationUI
 
 
-@pytest.mark.asyncio
-async def test_documentation_ui_creation_requires_nicegui():
-    """Test that DocumentationUI raises error when NiceGUI not available"""
-    app = Pantainos(database_url="sqlite:///:memory:")
+@pytest.fixture
+def nicegui_available(request, monkeypatch):
+    """Set pantainos.web.ui.NICEGUI_AVAILABLE; True unless parametrized indirectly"""
+    available = getattr(request, "param", True)
+    monkeypatch.setattr("pantainos.web.ui.NICEGUI_AVAILABLE", available)
+    return available
 
-    with patch("pantainos.web.ui.NICEGUI_AVAILABLE", False):
-        from pantainos.web.ui import DocumentationUI
 
+@pytest.mark.parametrize(
+    ("nicegui_available", "expect_error"),
+    [pytest.param(True, False, id="available"), pytest.param(False, True, id="missing")],
+    indirect=["nicegui_available"],
+)
+def test_documentation_ui_creation(app, nicegui_available, expect_error):
+    """Test that DocumentationUI is created only when NiceGUI is available"""
+    if expect_error:
         with pytest.raises(RuntimeError, match="NiceGUI not available"):
             DocumentationUI(app)
+        return
 
+    ui = DocumentationUI(app)
+    assert ui.app is app
 
-@pytest.mark.asyncio
-async def test_documentation_ui_creation_with_nicegui():
-    """Test that DocumentationUI can be created when NiceGUI is available"""
-    app = Pantainos(database_url="sqlite:///:memory:")
-
-    with patch("pantainos.web.ui.NICEGUI_AVAILABLE", True):
-        from pantainos.web.ui import DocumentationUI
 
-        # Should create without error
-        ui = DocumentationUI(app)
-        assert ui.app is app
+def _documented_handler(event):
+    """Test handler docstring"""
 
 
-@pytest.mark.asyncio
-async def test_documentation_ui_creates_styled_html():
-    """Test that DocumentationUI creates properly styled HTML for web display"""
+@pytest.fixture(scope="module")
+def rendered_docs_html():
+    """Documentation page for an app with handlers, a plugin, a web server and a database, rendered once"""
     app = Pantainos(database_url="sqlite:///:memory:")
 
     # Mock handlers data
     app.event_bus = MagicMock()
-    app.event_bus.handlers = {"test.event": [{"handler": lambda event: None, "condition": None, "source": "test"}]}
-
-    # Mock plugins by mounting through plugin registry
-    mock_plugin = MagicMock(name="test_plugin", apis={"route": "handler"}, pages={"page": "handler"})
-    mock_plugin.name = "test_plugin"
-    app.plugin_registry.plugins["test_plugin"] = mock_plugin
-
-    with patch("pantainos.web.ui.NICEGUI_AVAILABLE", True):
-        from pantainos.web.ui import DocumentationUI
-
-        ui_instance = DocumentationUI(app)
-        result = ui_instance.create_documentation_page()
-
-        # Should return styled HTML string for web display
-        assert isinstance(result, str)
-        assert "<!DOCTYPE html>" in result
-        assert "<style>" in result  # Should include CSS styling
-        assert "Pantainos API Documentation" in result
-        assert "[EVENT_HANDLERS]" in result
-        assert "Plugins" in result
-        assert "[SYSTEM_METRICS]" in result
-
-        # Should have proper CSS classes and styling
-        assert "container" in result or "documentation" in result  # CSS classes
-        assert "background-color" in result or "color:" in result  # Some CSS styling
-
-
-@pytest.mark.asyncio
-async def test_documentation_ui_displays_handler_information():
-    """Test that DocumentationUI displays event handler information correctly"""
-    app = Pantainos(database_url="sqlite:///:memory:")
-
-    # Create mock handler
-    def test_handler(event):
-        """Test handler docstring"""
-        pass
-
-    app.event_bus = MagicMock()
-    app.event_bus.handlers = {"user.login": [{"handler": test_handler, "condition": None, "source": "test"}]}
+    app.event_bus.handlers = {
+        "test.event": [{"handler": lambda event: None, "condition": None, "source": "test"}],
+        "user.login": [{"handler": _documented_handler, "condition": None, "source": "test"}],
+    }
 
-    with patch("pantainos.web.ui.NICEGUI_AVAILABLE", True):
-        from pantainos.web.ui import DocumentationUI
-
-        ui = DocumentationUI(app)
-        html_content = ui.create_documentation_page()
-
-        # Should contain handler information
-        assert "test_handler" in html_content
-        assert "user.login" in html_content
-        assert "Test handler docstring" in html_content
-
-
-@pytest.mark.asyncio
-async def test_documentation_ui_displays_plugin_information():
-    """Test that DocumentationUI displays plugin information correctly"""
-    app = Pantainos(database_url="sqlite:///:memory:")
-    app.event_bus = MagicMock()
-    app.event_bus.handlers = {}
-
-    # Create mock plugin
+    # Mock plugin with an API route and a main page
     mock_plugin = MagicMock()
     mock_plugin.name = "test_plugin"
     mock_plugin.apis = {"/events": {"handler": MagicMock()}}
     mock_plugin.pages = {"": {"handler": MagicMock()}}
-
     app.plugin_registry.plugins["test_plugin"] = mock_plugin
 
-    with patch("pantainos.web.ui.NICEGUI_AVAILABLE", True):
-        from pantainos.web.ui import DocumentationUI
-
-        ui = DocumentationUI(app)
-        html_content = ui.create_documentation_page()
-
-        # Should contain plugin information
-        assert "test_plugin" in html_content
-        assert "/events" in html_content
-        assert "/ui/plugins/test_plugin" in html_content
-
-
-@pytest.mark.asyncio
-async def test_documentation_ui_shows_application_metrics():
-    """Test that DocumentationUI displays application overview metrics"""
-    app = Pantainos(database_url="sqlite:///:memory:")
-
-    # Setup mock data
-    app.event_bus = MagicMock()
-    app.event_bus.handlers = {"event1": [], "event2": []}
-    app.plugin_registry.plugins = {"plugin1": MagicMock(), "plugin2": MagicMock()}
     app.web_server = MagicMock()
     app.database = MagicMock()
 
-    with patch("pantainos.web.ui.NICEGUI_AVAILABLE", True):
-        from pantainos.web.ui import DocumentationUI
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("pantainos.web.ui.NICEGUI_AVAILABLE", True)
+        return DocumentationUI(app).create_documentation_page()
 
-        ui = DocumentationUI(app)
-        html_content = ui.create_documentation_page()
 
-        # Should show metrics
-        assert "[SYSTEM_METRICS]" in html_content
-        assert "Events" in html_content
-        assert "Plugins" in html_content
-        assert "Web API" in html_content
-        assert "Database" in html_content
+def test_documentation_ui_creates_styled_html(rendered_docs_html):
+    """Test that DocumentationUI creates properly styled HTML for web display"""
+    assert isinstance(rendered_docs_html, str)
+
+    # Should have proper CSS classes and styling
+    assert "container" in rendered_docs_html or "documentation" in rendered_docs_html  # CSS classes
+    assert "background-color" in rendered_docs_html or "color:" in rendered_docs_html  # Some CSS styling
+
+
+@pytest.mark.parametrize(
+    "needle",
+    [
+        # Page structure and styling
+        "<!DOCTYPE html>",
+        "<style>",
+        "Pantainos API Documentation",
+        "[EVENT_HANDLERS]",
+        # Handler information
+        "_documented_handler",
+        "user.login",
+        "Test handler docstring",
+        # Plugin information
+        "test_plugin",
+        "/events",
+        "/ui/plugins/test_plugin",
+        # Application metrics
+        "[SYSTEM_METRICS]",
+        "Events",
+        "Plugins",
+        "Web API",
+        "Database",
+    ],
+)
+def test_documentation_page_contains(rendered_docs_html, needle):
+    """Test that the rendered documentation page shows the app's handlers, plugins and metrics"""
+    assert needle in rendered_docs_html